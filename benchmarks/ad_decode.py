@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+r"""
+Compare the shared AD/EIR decoder (bluing.gap_data) with the two decoding
+paths it replaced.
+
+- br: the loop of br_scan.pp_ext_inquiry_rsp, re-slicing the EIR data after
+  every AD structure.
+- le: bluepy turning each AD structure into text, then LeDevicesScanResult
+  turning the text back into values with split() and bytes.fromhex().
+
+Printing is left out, only the decoding is measured.
+
+Usage:
+    ad_decode.py [-h | --help]
+    ad_decode.py [--number=<n>] [--repeat=<n>] [--check]
+
+Options:
+    -h, --help        Print this help and quit
+    --number=<n>      Decodings per measurement [default: 10000]
+    --repeat=<n>      Measurements, the best one is taken [default: 5]
+    --check           Exit with status 1 if the shared decoder is slower than
+                      an old path
+"""
+
+import sys
+import binascii
+import timeit
+from pathlib import Path
+from uuid import UUID
+
+from docopt import docopt
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent/'src'))
+
+from bluing.gap_data import iter_ad_structs, parse_ad_value
+
+
+def ad(ad_type: int, value: bytes) -> bytes:
+    return bytes([1 + len(value), ad_type]) + value
+
+
+# Flags, 16-bit UUIDs, TX Power Level, Manufacturer Specific Data, name
+ADV_DATA = (ad(0x01, b'\x06') + ad(0x03, bytes.fromhex('12180f18')) + ad(0x0A, b'\x04') +
+            ad(0xFF, bytes.fromhex('4c001005031c0a8f')) + ad(0x09, b'bluing'))
+
+# 16-bit UUIDs, 128-bit UUID, name, TX Power Level, the non-significant part
+EIR_DATA = (ad(0x03, bytes.fromhex('0b110c110e111e1112111f11')) +
+            ad(0x07, bytes.fromhex('00112233445566778899aabbccddeeff')) +
+            ad(0x09, b'Bluetooth Speaker') + ad(0x0A, b'\x00')).ljust(240, b'\x00')
+
+
+def old_br_decode(ext_inq_rsp: bytes) -> list:
+    """The walk of br_scan.pp_ext_inquiry_rsp before the shared decoder"""
+    result = []
+    while ext_inq_rsp[0] != 0:
+        length = ext_inq_rsp[0]
+        data = ext_inq_rsp[1:1+length]
+        data_type = data[0]
+        ext_inq_rsp = ext_inq_rsp[1+length:]
+        if data_type == 0x03:
+            eir_data = data[1:]
+            result.append([int.from_bytes(eir_data[i:i+2], byteorder='little')
+                           for i in range(0, len(eir_data), 2)])
+        elif data_type == 0x05:
+            eir_data = data[1:]
+            result.append([int.from_bytes(eir_data[i:i+4], byteorder='little')
+                           for i in range(0, len(eir_data), 4)])
+        elif data_type == 0x07:
+            eir_data = data[1:]
+            result.append([int.from_bytes(eir_data[i:i+16], byteorder='little')
+                           for i in range(0, len(eir_data), 16)])
+        elif data_type in (0x08, 0x09):
+            result.append(data[1:].decode())
+        elif data_type == 0x0A:
+            result.append(int.from_bytes(data[1:], byteorder='little'))
+        else:
+            result.append(data[1:])
+    return result
+
+
+def bluepy_value_text(sdid: int, val: bytes) -> str:
+    """bluepy.btle.ScanEntry.getValueText()"""
+    if sdid in (0x08, 0x09):
+        return val.decode('utf-8')
+    elif sdid in (0x02, 0x03):
+        nbytes = 2
+    elif sdid in (0x04, 0x05):
+        nbytes = 4
+    elif sdid in (0x06, 0x07):
+        nbytes = 16
+    else:
+        return binascii.b2a_hex(val).decode('ascii')
+
+    uuids = []
+    for i in range(0, len(val), nbytes):
+        rs = ''
+        for b in val[i:i+nbytes]:
+            rs = ("%02X" % b) + rs
+        if nbytes != 16:
+            rs = rs.rjust(8, '0') + '00001000800000805F9B34FB'
+        uuids.append(str(UUID(rs)))
+    return ','.join(uuids)
+
+
+def old_le_decode(adv_data: bytes) -> list:
+    """bluepy parsing the advertising data into text, then the value parsing
+    of LeDevicesScanResult.print before the shared decoder"""
+    scan_data = {}
+    while len(adv_data) >= 2:
+        sdlen, sdid = adv_data[0:2]
+        val = adv_data[2:sdlen + 1]
+        scan_data[sdid] = val
+        adv_data = adv_data[sdlen + 1:]
+
+    result = []
+    for sdid, val in scan_data.items():
+        value = bluepy_value_text(sdid, val)
+        if sdid in (0x02, 0x03):
+            result.append(["0x" + uuid[4:8].upper() for uuid in value.split(',')])
+        elif sdid in (0x06, 0x07):
+            result.append([uuid.upper() for uuid in value.split(',')])
+        elif sdid == 0x01:
+            result.append(bytes.fromhex(value)[0])
+        elif sdid == 0xFF:
+            raw = bytes.fromhex(value)
+            result.append((int.from_bytes(raw[0:2], 'little'), raw[2:]))
+        elif sdid == 0x0A:
+            result.append(int.from_bytes(bytes.fromhex(value), 'little', signed=True))
+        else:
+            result.append(value)
+    return result
+
+
+def new_decode(data: bytes) -> list:
+    return [parse_ad_value(ad_type, value) for ad_type, value in iter_ad_structs(data)]
+
+
+def bench(func, data: bytes, number: int, repeat: int) -> float:
+    """Return the best time of one decoding in us."""
+    return min(timeit.repeat(lambda: func(data), number=number, repeat=repeat)) / number * 1e6
+
+
+def main(argv: list[str] = sys.argv):
+    args = docopt(__doc__, argv[1:])
+    number = int(args['--number'])
+    repeat = int(args['--repeat'])
+
+    slower = []
+    print("{:<6}{:>12}{:>12}{:>10}".format('data', 'old (us)', 'new (us)', 'speedup'))
+    for name, old_decode, data in (('br', old_br_decode, EIR_DATA),
+                                   ('le', old_le_decode, ADV_DATA)):
+        old = bench(old_decode, data, number, repeat)
+        new = bench(new_decode, data, number, repeat)
+        print("{:<6}{:>12.2f}{:>12.2f}{:>9.2f}x".format(name, old, new, old/new))
+        if new > old:
+            slower.append(name)
+
+    if args['--check'] and slower:
+        print("The shared decoder is slower than the old {} path".format(
+            ', '.join(slower)), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
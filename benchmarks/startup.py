@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+r"""
+Measure the startup time of bluing, i.e. the wall time each command spends
+before touching the radio.
+
+For every command, `bluing <command> --help` is run in fresh interpreters on
+temporary copies of the package, so the caches of the working tree are left
+alone. Each cold run uses a fresh copy, with an empty bytecode cache and no
+registry or OUI index cache. The warm runs reuse the caches of the last cold
+run. The import cost of each module is taken from `python -X importtime`. A
+run failing (e.g. an import error) aborts the benchmark instead of being timed.
+
+Usage:
+    startup.py [-h | --help]
+    startup.py [--runs=<n>] [--cold-runs=<n>] [--top=<n>] [--save] [--check]
+               [--baseline=<path>] [--threshold=<percent>] [<command>...]
+
+Arguments:
+    <command>    br, le, android, spoof or plugin. All of them by default
+
+Options:
+    -h, --help               Print this help and quit
+    --runs=<n>               Number of warm runs per command [default: 10]
+    --cold-runs=<n>          Number of cold runs per command [default: 5]
+    --top=<n>                Number of the most expensive modules to print [default: 10]
+    --save                   Store the result as the new baseline
+    --check                  Compare the result with the baseline, exit with
+                             status 1 when a command regressed. Skipped if
+                             there is no baseline yet
+    --baseline=<path>        Baseline file [default: benchmarks/results/startup.json]
+    --threshold=<percent>    Allowed regression of the warm median [default: 20]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from docopt import docopt
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_ROOT = REPO_ROOT/'src'
+COMMANDS = ['br', 'le', 'android', 'spoof', 'plugin']
+
+PKG_ROOT = SRC_ROOT/'bluing'
+RES_ROOT = PKG_ROOT/'res'
+OUI_TXT_PATH = RES_ROOT/'oui.txt'
+# Built by bluing from its resource files at runtime. oui.idx can only be
+# rebuilt if oui.txt is there.
+RES_CACHES = {'registry', 'oui.idx', 'oui.idx.tmp'} if OUI_TXT_PATH.exists() else {'registry'}
+
+
+def ignore_caches(dir: str, names: list[str]) -> list[str]:
+    return [name for name in names
+            if name == '__pycache__' or (Path(dir) == RES_ROOT and name in RES_CACHES)]
+
+
+def copy_pkg(src_root: Path):
+    """Copy the package into src_root without any of its caches"""
+    shutil.copytree(PKG_ROOT, src_root/'bluing', ignore=ignore_caches)
+
+
+def bench_env(src_root: Path, pycache_prefix: Path) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(src_root), env.get('PYTHONPATH')]))
+    env['PYTHONPYCACHEPREFIX'] = str(pycache_prefix)
+    return env
+
+
+def run_once(argv: list[str], env: dict) -> tuple[float, str]:
+    """Return the wall time (s) and stderr of running `python <argv>`.
+
+    Raise RuntimeError if it exits with a non-zero status.
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable] + argv, env=env, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError("`python {}` exited with status {}\n{}".format(
+            ' '.join(argv), proc.returncode, proc.stderr.strip()))
+    return elapsed, proc.stderr
+
+
+def parse_importtime(stderr: str) -> tuple[dict[str, int], int]:
+    """Parse `-X importtime` output.
+
+    Return {module: cumulative import time in us} and the total import time in
+    us, i.e. the sum of the top-level imports.
+    """
+    costs = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            cumulative = int(cumulative)
+        except ValueError:
+            # The header line
+            continue
+
+        # Nested imports are indented by two more spaces per level.
+        if len(name) - len(name.lstrip()) == 1:
+            total += cumulative
+        costs[name.strip()] = cumulative
+    return costs, total
+
+
+def bench_cmd(cmd: str, runs: int, cold_runs: int) -> dict:
+    argv = ['-m', 'bluing', cmd, '--help']
+
+    with TemporaryDirectory() as tmp_dir:
+        cold = []
+        for i in range(cold_runs):
+            run_dir = Path(tmp_dir)/str(i)
+            copy_pkg(run_dir/'src')
+            env = bench_env(run_dir/'src', run_dir/'pycache')
+            cold.append(run_once(argv, env)[0])
+        warm = [run_once(argv, env)[0] for _ in range(runs)]
+        _, stderr = run_once(['-X', 'importtime'] + argv, env)
+
+    modules, import_total = parse_importtime(stderr)
+    bluing_modules = {name: us for name, us in modules.items()
+                      if name.split('.')[0] == 'bluing'}
+
+    return {
+        'cold': statistics.median(cold),
+        'cold_min': min(cold),
+        'cold_max': max(cold),
+        'warm_median': statistics.median(warm),
+        'warm_min': min(warm),
+        'warm_max': max(warm),
+        'import_total_us': import_total,
+        'modules_us': dict(sorted(modules.items(), key=lambda item: item[1], reverse=True)),
+        'bluing_modules_us': dict(sorted(bluing_modules.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def print_result(result: dict, top: int):
+    print("{:<10}{:>14}{:>14}{:>12}{:>12}".format(
+        'command', 'cold med (ms)', 'warm med (ms)', 'min (ms)', 'max (ms)'))
+    for cmd, r in result['commands'].items():
+        print("{:<10}{:>14.1f}{:>14.1f}{:>12.1f}{:>12.1f}".format(
+            cmd, r['cold']*1000, r['warm_median']*1000, r['warm_min']*1000, r['warm_max']*1000))
+    print()
+
+    for cmd, r in result['commands'].items():
+        print("bluing {}, the {} most expensive imports (cumulative ms):".format(cmd, top))
+        for name, us in list(r['modules_us'].items())[:top]:
+            print("    {:>9.1f}  {}".format(us/1000, name))
+        print()
+
+
+def check_regressions(result: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for cmd, r in result['commands'].items():
+        try:
+            base = baseline['commands'][cmd]['warm_median']
+        except KeyError:
+            continue
+
+        if r['warm_median'] > base * (1 + threshold/100):
+            regressions.append("bluing {}: warm median {:.1f} ms > baseline {:.1f} ms + {}%".format(
+                cmd, r['warm_median']*1000, base*1000, threshold))
+    return regressions
+
+
+def main(argv: list[str] = sys.argv):
+    args = docopt(__doc__, argv[1:])
+
+    cmds = args['<command>'] or COMMANDS
+    for cmd in cmds:
+        if cmd not in COMMANDS:
+            print("Invalid command: {}".format(cmd), file=sys.stderr)
+            sys.exit(1)
+
+    baseline_path = Path(args['--baseline'])
+    if not baseline_path.is_absolute():
+        baseline_path = REPO_ROOT/baseline_path
+
+    result = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'runs': int(args['--runs']),
+        'cold_runs': int(args['--cold-runs']),
+    }
+    if result['runs'] < 1 or result['cold_runs'] < 1:
+        print("--runs and --cold-runs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    try:
+        result['commands'] = {cmd: bench_cmd(cmd, result['runs'], result['cold_runs'])
+                              for cmd in cmds}
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    print_result(result, int(args['--top']))
+
+    if args['--check']:
+        try:
+            baseline = json.loads(baseline_path.read_text())
+        except FileNotFoundError:
+            baseline = None
+            print("No baseline: {}, check skipped. Run with --save to create one".format(
+                baseline_path), file=sys.stderr)
+
+        if baseline is not None:
+            regressions = check_regressions(result, baseline, float(args['--threshold']))
+            for regression in regressions:
+                print(regression, file=sys.stderr)
+            if regressions:
+                sys.exit(1)
+
+    if args['--save']:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(result, indent=4) + '\n')
+        print("Saved to {}".format(baseline_path))
+
+
+if __name__ == '__main__':
+    main()
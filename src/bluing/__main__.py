@@ -2,37 +2,47 @@
 
 import os
 import sys
+from importlib import import_module
 from shutil import copy
 from subprocess import STDOUT, check_output
 from pathlib import Path
 
 from xpycommon.log import Logger
 from xpycommon.ui import red, blue
-from xpycommon.bluetooth.bluez import stop_bluetooth_service, \
-    restart_bluetooth_service
-
-from bthci import HCI
 
 from . import LOG_LEVEL, MICRO_BIT_FIRMWARE_PATH
 from .ui import parse_cmdline
-from .br import main as br_main
-from .le import main as le_main
-from .android import main as android_main
-from .spoof import main as spoof_main
-from .plugin import main as plugin_main
 
 
 logger = Logger(__name__, LOG_LEVEL)
-cmd_to_main = {
-    'br': br_main,
-    'le': le_main,
-    'android': android_main,
-    'spoof': spoof_main,
-    'plugin': plugin_main,
+
+# Command packages are only imported when the command is actually run, so that
+# e.g. `bluing spoof` does not pay for importing bluepy, dbus, btgatt, btsm... 
+cmd_to_pkg = {
+    'br': '.br',
+    'le': '.le',
+    'android': '.android',
+    'spoof': '.spoof',
+    'plugin': '.plugin',
 }
 
 
+def load_cmd_main(cmd: str):
+    """Import the package of a command and return its main()."""
+    try:
+        pkg_name = cmd_to_pkg[cmd]
+    except KeyError:
+        raise ValueError("Invalid command: " + red(cmd))
+
+    return import_module(pkg_name, __package__).main
+
+
 def clean(iface: str, raddr: str):
+    # Only `--clean` needs them, keep them out of the startup path of commands.
+    from xpycommon.bluetooth.bluez import stop_bluetooth_service, \
+        restart_bluetooth_service
+    from bthci import HCI
+
     hci = HCI(iface)
     laddr = hci.bd_addr
     hci.close()
@@ -103,10 +113,7 @@ def main(argv: list[str] = sys.argv):
             cmd = args['<command>']
             argv = [cmd] + args['<args>']
 
-            try:
-                cmd_to_main[cmd](argv)
-            except KeyError as e:
-                raise ValueError("Invalid command: " + red(args['<command>']))
+            load_cmd_main(cmd)(argv)
     except Exception as e:
         logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
         sys.exit(1)
@@ -38,7 +38,7 @@ def main(argv: list[str] = sys.argv):
                 raise NotImplementedError("The `--local` option is not yet implemented")
             else:
                 br_scanner = BrScanner(args['-i'])
-                br_scanner.scan_lmp_features(args['BD_ADDR'])
+                br_scanner.scan_lmp_features(args['BD_ADDR'], args['--max-age'])
         elif args['--stack']:
             # StackScanner(args['-i']).scan(args['BD_ADDR'])
             raise NotImplementedError("The `--stack` option is not yet implemented")
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import sys
+import time
 import struct
 
 from bthci import HCI, HciRuntimeError, ControllerErrorCodes
@@ -8,17 +9,16 @@ from bthci.events import HciEventCodes, HCI_Inquiry_Result, HCI_Inquiry_Result_w
                          HCI_Extended_Inquiry_Result
 from bthci.bluez_hci import HCI_CHANNEL_USER
 from xpycommon.log import Logger
-from xpycommon.ui import green, blue, red, INDENT
+from xpycommon.ui import green, blue, red
 from xpycommon.bluetooth import ClassOfDevice
 
-from .. import BlueScanner, service_cls_profile_ids
+from .. import BlueScanner
 from ..common import bdaddr_to_company_name
 from ..le.ll import ll_vers
-from ..gap_data import gap_type_names, \
-    COMPLETE_LIST_OF_16_BIT_SERVICE_CLASS_UUIDS, \
-    COMPLETE_LIST_OF_32_BIT_SERVICE_CLASS_UUIDS, \
-    COMPLETE_LIST_OF_128_BIT_SERVICE_CLASS_UUIDS, COMPLETE_LOCAL_NAME, \
-    SHORTENED_LOCAL_NAME, TX_POWER_LEVEL
+from ..gap_data import iter_ad_structs, pp_ad_struct
+from ..feature_bits import LMP_FEATURES
+from ..fingerprint_cache import Fingerprint, DEFAULT_MAX_AGE, TRANSPORT_BR, \
+                                load_fingerprint, store_fingerprints
 
 from . import LOG_LEVEL
 from .lmp import lmp_vers, company_identfiers, pp_lmp_features, pp_ext_lmp_features
@@ -84,64 +84,27 @@ class BrScanner(BlueScanner):
         hci.close()
 
 
-    def scan_lmp_features(self, paddr: str):
-        hci = HCI(self.iface, HCI_CHANNEL_USER)
-        conn_complete = hci.create_connection(paddr, page_scan_repetition_mode = 0x02)
-
-        if conn_complete.status != ControllerErrorCodes.SUCCESS:
-            logger.error("Failed to connect {} BD/EDR address\n"
-                         "    connection complete status: 0x{:02x} - {}".format(
-                             paddr,
-                             conn_complete.status, ControllerErrorCodes[conn_complete.status].name))
-            sys.exit(1)
-
-        read_remote_version_info_complete = hci.read_remote_version_information(conn_complete.conn_handle)
+    def scan_lmp_features(self, paddr: str, max_age: float = DEFAULT_MAX_AGE):
+        """
+        max_age - The version and LMP features read within this many seconds
+                  are served from the fingerprint cache, 0 to always read them.
+        """
+        fingerprint = load_fingerprint(paddr, TRANSPORT_BR, max_age)
+        if fingerprint is not None:
+            logger.info("LMP features of {} read {} sec ago, from the fingerprint cache".format(
+                blue(paddr), blue("{:.0f}".format(time.time() - fingerprint.updated))))
+        else:
+            hci = HCI(self.iface, HCI_CHANNEL_USER)
+            try:
+                fingerprint = read_lmp_fingerprint(hci, paddr)
+            except Exception as e:
+                logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
+                sys.exit(1)
+            finally:
+                hci.close()
+            store_fingerprints([fingerprint])
 
-        if read_remote_version_info_complete.status != ControllerErrorCodes.SUCCESS:
-            logger.error('Failed to read remote version')
-            sys.exit(1)
-
-        print(blue('Version'))
-        print('    Version:')
-        print(' '*8+lmp_vers[read_remote_version_info_complete.version], '(LMP)')
-        print(' '*8+ll_vers[read_remote_version_info_complete.version], '(LL)')
-        print('    Manufacturer name:', green(company_identfiers[read_remote_version_info_complete.company_id]))
-        print('    Subversion:', read_remote_version_info_complete.subversion, '\n')
-
-        read_remote_supported_features_complete = hci.read_remote_supported_features(conn_complete.conn_handle)
-        if read_remote_supported_features_complete.status != ControllerErrorCodes.SUCCESS:
-            logger.error("Failed to read remote extented features\n"
-                         "    read remote extented features complete status: 0x{:02x} - {}".format(
-                             read_remote_ext_features_complete.status, ControllerErrorCodes[read_remote_ext_features_complete.status].name))
-            hci.disconnect(conn_complete.conn_handle)
-            sys.exit(1)
-  
-        print(blue('LMP features'))
-        pp_lmp_features(read_remote_supported_features_complete.lmp_features)
-        print()
-
-        if not True if (read_remote_supported_features_complete.lmp_features[7] >> 7) & 0x01 else False:
-            sys.exit(1)
-
-        print(blue('Extended LMP features'))
-        # Get Max_Page_Number
-        read_remote_ext_features_complete = hci.read_remote_extended_features(conn_complete.conn_handle, 0x00)
-        if read_remote_ext_features_complete.status != ControllerErrorCodes.SUCCESS:
-            logger.error("Failed to read remote extented features\n"
-                         "    read remote extented features complete status: 0x{:02x} - {}".format(
-                             read_remote_ext_features_complete.status, ControllerErrorCodes[read_remote_ext_features_complete.status].name))
-            hci.disconnect(conn_complete.conn_handle)
-            sys.exit(1)
-            
-        max_page_num = read_remote_ext_features_complete.max_page_num
-        for i in range(1, max_page_num+1):
-            read_remote_ext_features_complete_i = hci.read_remote_extended_features(conn_complete.conn_handle, i)
-            if read_remote_ext_features_complete_i.status != ControllerErrorCodes.SUCCESS:
-                logger.error('Failed to read remote extented features, page {}'.format(i))
-            else:
-                pp_ext_lmp_features(read_remote_ext_features_complete_i.ext_lmp_features, i)
-                
-        hci.disconnect(conn_complete.conn_handle)
+        pp_lmp_fingerprint(fingerprint)
 
 
     def pp_inquiry_result(self, params):
@@ -242,6 +205,76 @@ class BrScanner(BlueScanner):
         self.scanned_dev.append(bd_addr)
 
 
+def read_lmp_fingerprint(hci: HCI, paddr: str) -> Fingerprint:
+    """Connect paddr, read its version and all its LMP feature pages, then
+    disconnect.
+
+    Raise RuntimeError if the controller fails to connect or to read the
+    version or the LMP features. An extended features page failing to be read
+    is only logged.
+    """
+    conn_complete = hci.create_connection(paddr, page_scan_repetition_mode = 0x02)
+    if conn_complete.status != ControllerErrorCodes.SUCCESS:
+        raise RuntimeError("Failed to connect {} BD/EDR address, status: 0x{:02x} - {}".format(
+            paddr, conn_complete.status, ControllerErrorCodes[conn_complete.status].name))
+
+    try:
+        read_remote_version_info_complete = hci.read_remote_version_information(conn_complete.conn_handle)
+        if read_remote_version_info_complete.status != ControllerErrorCodes.SUCCESS:
+            raise RuntimeError("Failed to read remote version, status: 0x{:02x} - {}".format(
+                read_remote_version_info_complete.status,
+                ControllerErrorCodes[read_remote_version_info_complete.status].name))
+
+        read_remote_supported_features_complete = hci.read_remote_supported_features(conn_complete.conn_handle)
+        if read_remote_supported_features_complete.status != ControllerErrorCodes.SUCCESS:
+            raise RuntimeError("Failed to read remote supported features, status: 0x{:02x} - {}".format(
+                read_remote_supported_features_complete.status,
+                ControllerErrorCodes[read_remote_supported_features_complete.status].name))
+        features = {0: read_remote_supported_features_complete.lmp_features}
+
+        if 'Extended features' in LMP_FEATURES.decode(features[0]):
+            # Get Max_Page_Number
+            read_remote_ext_features_complete = hci.read_remote_extended_features(conn_complete.conn_handle, 0x00)
+            if read_remote_ext_features_complete.status != ControllerErrorCodes.SUCCESS:
+                raise RuntimeError("Failed to read remote extented features, status: 0x{:02x} - {}".format(
+                    read_remote_ext_features_complete.status,
+                    ControllerErrorCodes[read_remote_ext_features_complete.status].name))
+
+            for i in range(1, read_remote_ext_features_complete.max_page_num+1):
+                read_remote_ext_features_complete_i = hci.read_remote_extended_features(conn_complete.conn_handle, i)
+                if read_remote_ext_features_complete_i.status != ControllerErrorCodes.SUCCESS:
+                    logger.error('Failed to read remote extented features, page {}'.format(i))
+                else:
+                    features[i] = read_remote_ext_features_complete_i.ext_lmp_features
+    finally:
+        hci.disconnect(conn_complete.conn_handle)
+
+    return Fingerprint(paddr.upper(), TRANSPORT_BR, None, read_remote_version_info_complete.version,
+                       read_remote_version_info_complete.company_id,
+                       read_remote_version_info_complete.subversion, features, time.time())
+
+
+def pp_lmp_fingerprint(fingerprint: Fingerprint):
+    print(blue('Version'))
+    print('    Version:')
+    print(' '*8+lmp_vers[fingerprint.version], '(LMP)')
+    print(' '*8+ll_vers[fingerprint.version], '(LL)')
+    print('    Manufacturer name:', green(company_identfiers[fingerprint.company_id]))
+    print('    Subversion:', fingerprint.subversion, '\n')
+
+    print(blue('LMP features'))
+    pp_lmp_features(fingerprint.features[0])
+    print()
+
+    if 'Extended features' not in LMP_FEATURES.decode(fingerprint.features[0]):
+        return
+
+    print(blue('Extended LMP features'))
+    for page_num in sorted(fingerprint.features):
+        if page_num != 0:
+            pp_ext_lmp_features(fingerprint.features[page_num], page_num)
+
+
 def pp_page_scan_repetition_mode(val):
     print(val, end=' ')
     if val == 0x00:
@@ -266,66 +299,5 @@ def pp_ext_inquiry_rsp(ext_inq_rsp):
 
     print()
 
-    while ext_inq_rsp[0] != 0:
-        length = ext_inq_rsp[0]
-        data = ext_inq_rsp[1:1+length]
-        data_type = data[0]
-        ext_inq_rsp = ext_inq_rsp[1+length:]
-        print(INDENT, end='')
-        # TODO: Unify the gap type name parsings of BR and LE
-        if data_type == COMPLETE_LIST_OF_16_BIT_SERVICE_CLASS_UUIDS:
-            print(gap_type_names[data_type])
-            if length - 1 >= 2:
-                eir_data = data[1:]
-                if len(eir_data) % 2 != 0:
-                    print(INDENT*2 + blue('Invalid EIR data length: %d'%len(eir_data)))
-                    continue
-
-                for i in range(0, len(eir_data), 2):
-                    uuid = int.from_bytes(eir_data[i:i+2], byteorder='little')
-                    print(INDENT*2 + '0x%04x '%uuid, end='')
-                    try:
-                        print(blue(service_cls_profile_ids[uuid]['Name']))
-                    except KeyError as e:
-                        print(red('unknown'))
-            else:
-                print(INDENT*2 + red('None'))
-        elif data_type == COMPLETE_LIST_OF_32_BIT_SERVICE_CLASS_UUIDS:
-            print(gap_type_names[data_type])
-            if length - 1 >= 4:
-                eir_data = data[1:]
-                if len(eir_data) % 4 != 0:
-                    logger.info(INDENT*2 + 'Invalid EIR data length: {} {}'.format(len(eir_data), eir_data))
-                    continue
-                for i in range(0, len(eir_data), 4):
-                    uuid = int.from_bytes(eir_data[i:i+4], byteorder='little')
-                    print(INDENT*2 + '0x%08x '%uuid)
-            else:
-                print(INDENT*2 + red('None'))
-        elif data_type == COMPLETE_LIST_OF_128_BIT_SERVICE_CLASS_UUIDS:
-            print(gap_type_names[data_type])
-            if length - 1 >= 16:
-                eir_data = data[1:]
-                if len(eir_data) % 16 != 0:
-                    logger.info(INDENT*2 + 'Invalid EIR data length: {} {}'.format(len(eir_data), eir_data))
-                    continue
-                for i in range(0, len(eir_data), 16):
-                    uuid = int.from_bytes(eir_data[i:i+16], byteorder='little')
-                    uuid_str = '%032X' % uuid
-                    print(INDENT*2, end='')
-                    print(blue('-'.join([uuid_str[:8], uuid_str[8:12], 
-                        uuid_str[12:16], uuid_str[16:20], uuid_str[20:32]])))   
-            else:
-                print(INDENT*2 + red('None'))
-        elif data_type == SHORTENED_LOCAL_NAME or \
-            data_type == COMPLETE_LOCAL_NAME:
-            print(gap_type_names[data_type]+':', blue(data[1:].decode()))
-        elif data_type == TX_POWER_LEVEL:
-            print(gap_type_names[data_type]+':', blue(str(int.from_bytes(
-                data[1:], byteorder='little')) + ' dBm'))
-        else:
-            try:
-                print(gap_type_names[data_type])
-            except KeyError as e:
-                print(red('Unknown, 0x%02x'%data_type))
-            print(INDENT*2, data[1:],sep='')
+    for data_type, data in iter_ad_structs(ext_inq_rsp):
+        pp_ad_struct(data_type, data)
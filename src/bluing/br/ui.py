@@ -6,7 +6,7 @@ Usage:
     bluing br [-i <hci>] [--inquiry-len=<n>] --inquiry
     bluing br [-i <hci>] --sdp BD_ADDR
     bluing br [-i <hci>] --local --sdp
-    bluing br [-i <hci>] --lmp-features BD_ADDR
+    bluing br [-i <hci>] [--max-age=<sec>] --lmp-features BD_ADDR
     bluing br [-i <hci>] --local --lmp-features
     bluing br [-i <hci>] --stack BD_ADDR
     bluing br [-i <hci>] --local --stack
@@ -34,6 +34,9 @@ Options:
     --sdp                        Retrieve information from the SDP database of a 
                                  remote BR/EDR device
     --lmp-features               Read LMP features of a remote BR/EDR device
+    --max-age=<sec>              Serve the version and LMP features read within this 
+                                 long from the fingerprint cache, 0 to always read 
+                                 them [default: 86400]
     --stack                      Determine the Bluetooth stack type of a remote BR/EDR device
     --mon-incoming-conn          Print incoming connection from other nearby BR/EDR devices
     --inquiry-scan               Enable the Inquiry Scan
@@ -115,6 +118,14 @@ def parse_cmdline(argv: list[str] = sys.argv[1:]) -> dict:
                 e.args = ("Invalid --timeout: " + red(args['--timeout']),)
                 raise e
 
+        try:
+            args['--max-age'] = int(args['--max-age'])
+        except ValueError as e:
+            e.args = ("Invalid --max-age: " + red(args['--max-age']),)
+            raise e
+        if args['--max-age'] < 0:
+            raise ValueError("Invalid --max-age: " + red(str(args['--max-age'])))
+
         if args['BD_ADDR']:
             if not BD_ADDR.verify(args['BD_ADDR']):
                 raise ValueError("Invalid BD_ADDR: " + red(args['BD_ADDR']))
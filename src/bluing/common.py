@@ -1,29 +1,16 @@
 #!/usr/bin/env python
 
-import io
-import pkg_resources
-
 from dbus.exceptions import DBusException
 
 from xpycommon.log import Logger
 from xpycommon.ui import blue, red
 
 from . import LOG_LEVEL
+from .oui import oui_to_company_name
 
 
 logger = Logger(__name__, LOG_LEVEL)
 
-oui_file = pkg_resources.resource_stream(__name__, "res/oui.txt")
-oui_file = io.TextIOWrapper(oui_file)
-oui_company_names = {}
-for line in oui_file:
-    items = line.strip().split('\t\t')
-    if len(items) == 2 and '   (hex)' in items[0]:
-        company_id = items[0].removesuffix('   (hex)')
-        oui_company_names[company_id] = items[1]
-        
-# logger.debug("oui_company_names: {}".format(oui_company_names))
-
 
 class InvalidArgsException(DBusException):
     _dbus_error_name = 'org.freedesktop.DBus.Error.InvalidArgs'
@@ -45,12 +32,16 @@ class Rejected(DBusException):
 
 
 def bdaddr_to_company_name(addr: str):
-    company_id = addr.replace(':', '-').upper()[0:8]
-    
     logger.debug("bdaddr_to_company_name(), addr: " + addr)
-    logger.debug(company_id)
 
     try:
-        return blue(oui_company_names[company_id])
-    except KeyError:
+        company_id = int(addr.replace(':', '').replace('-', '')[0:6], base=16)
+    except ValueError:
+        return red('Unknown')
+    logger.debug("0x{:06X}".format(company_id))
+
+    company_name = oui_to_company_name(company_id)
+    if company_name is None:
         return red('Unknown')
+    else:
+        return blue(company_name)
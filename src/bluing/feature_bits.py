@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+
+"""Table-driven decoding of the LE features and the LMP features
+
+A FeatureSchema maps each feature to its page, bit and width. The feature
+bytes of a page are turned into one int with int.from_bytes(), then every
+feature is a shift and a mask, for printing as well as for queries such as
+"all peers with LE Coded PHY".
+"""
+
+from typing import NamedTuple
+
+from xpycommon.ui import green, red, INDENT
+
+
+RESERVED = 'Reserved for future use'
+
+
+class Feature(NamedTuple):
+    name: str
+    page: int
+    bit: int
+    width: int = 1 # More than 1 for a numeric field, e.g. Flow control lag
+
+
+class FeatureSchema:
+    def __init__(self, pages: dict[int, list[str | tuple[str, int]]]):
+        """
+        pages - {page number: [name or (name, width) of each field, from bit 0]}.
+                RESERVED can be used more than once.
+        """
+        self.pages = {}
+        self.features = {}
+        for page, fields in pages.items():
+            self.pages[page] = []
+            bit = 0
+            for field in fields:
+                name, width = (field, 1) if isinstance(field, str) else field
+                feature = Feature(name, page, bit, width)
+                self.pages[page].append(feature)
+                if name != RESERVED:
+                    self.features[name] = feature
+                bit += width
+
+    def __getitem__(self, name: str) -> Feature:
+        return self.features[name]
+
+    def decode(self, features: bytes, page: int = 0) -> 'FeatureSet':
+        return FeatureSet(self).add_page(features, page)
+
+    def mask(self, *names: str) -> dict[int, int]:
+        """{page: bits} of the features, for FeatureSet.has_all()"""
+        masks = {}
+        for name in names:
+            feature = self.features[name]
+            masks[feature.page] = masks.get(feature.page, 0) | \
+                ((1 << feature.width) - 1) << feature.bit
+        return masks
+
+
+class FeatureSet:
+    """The features of one device, one int per page"""
+    __slots__ = ('schema', 'pages')
+
+    def __init__(self, schema: FeatureSchema):
+        self.schema = schema
+        self.pages = {}
+
+    def add_page(self, features: bytes, page: int = 0) -> 'FeatureSet':
+        self.pages[page] = int.from_bytes(features, 'little')
+        return self
+
+    def value(self, name: str) -> int:
+        feature = self.schema.features[name]
+        return (self.pages.get(feature.page, 0) >> feature.bit) & ((1 << feature.width) - 1)
+
+    def __contains__(self, name: str) -> bool:
+        return self.value(name) != 0
+
+    def has_all(self, mask: dict[int, int]) -> bool:
+        """
+        mask - From FeatureSchema.mask()
+        """
+        return all(self.pages.get(page, 0) & bits == bits for page, bits in mask.items())
+
+    def supported(self) -> list[str]:
+        return [feature.name for page in sorted(self.pages)
+                for feature in self.schema.pages.get(page, [])
+                if feature.name != RESERVED and self.value(feature.name)]
+
+    def to_dict(self) -> dict[str, bool | int]:
+        return {feature.name: self.value(feature.name) if feature.width > 1 else
+                                  self.value(feature.name) != 0
+                for page in sorted(self.pages)
+                for feature in self.schema.pages.get(page, [])
+                if feature.name != RESERVED}
+
+
+def pp_feature_page(feature_set: FeatureSet, page: int = 0):
+    bits = feature_set.pages.get(page, 0)
+    for feature in feature_set.schema.pages.get(page, []):
+        value = (bits >> feature.bit) & ((1 << feature.width) - 1)
+        if feature.width > 1:
+            print(INDENT + feature.name + ':', value)
+        else:
+            print(INDENT + feature.name + ':', green('True') if value else red('False'))
+
+
+# LE features, Core Spec Vol 6, Part B, 4.6
+LE_FEATURES = FeatureSchema({
+    0: [
+        'LE Encryption',
+        'Connection Parameters Request Procedure',
+        'Extended Reject Indication',
+        'Slave-initiated Features Exchange',
+        'LE Ping',
+        'LE Data Packet Length Extension',
+        'LL Privacy',
+        'Extended Scanner Filter Policies',
+        'LE 2M PHY',
+        'Stable Modulation Index - Transmitter',
+        'Stable Modulation Index - Receiver',
+        'LE Coded PHY',
+        'LE Extended Advertising',
+        'LE Periodic Advertising',
+        'Channel Selection Algorithm #2',
+        'LE Power Class 1',
+        'Minimum Number of Used Channels Procedure',
+        'Connection CTE Request',
+        'Connection CTE Response',
+        'Connectionless CTE Transmitter',
+        'Connectionless CTE Receiver',
+        'Antenna Switching During CTE Transmission (AoD)',
+        'Antenna Switching During CTE Reception (AoA)',
+        'Receiving Constant Tone Extensions',
+        'Periodic Advertising Sync Transfer - Sender',
+        'Periodic Advertising Sync Transfer - Recipient',
+        'Sleep Clock Accuracy Updates',
+        'Remote Public Key Validation',
+        'Connected Isochronous Stream - Master',
+        'Connected Isochronous Stream - Slave',
+        'Isochronous Broadcaster',
+        'Synchronized Receiver',
+        'Isochronous Channels (Host Support)',
+        'LE Power Control Request',
+        'LE Power Change Indication',
+        'LE Path Loss Monitoring',
+    ],
+})
+
+# LMP features, Core Spec Vol 2, Part C, 3.3
+LMP_FEATURES = FeatureSchema({
+    0: [
+        '3 slot packets',
+        '5 slot packets',
+        'Encryption',
+        'Slot offset',
+        'Timing accuracy',
+        'Role switch',
+        'Hold mode',
+        'Sniff mode',
+        'Previously used',
+        'Power control requests',
+        'Channel quality driven data rate (CQDDR)',
+        'SCO link',
+        'HV2 packets',
+        'HV3 packets',
+        'μ-law log synchronous data',
+        'A-law log synchronous data',
+        'CVSD synchronous data',
+        'Paging parameter negotiation',
+        'Power control',
+        'Transparent synchronous data',
+        ('Flow control lag', 3),
+        'Broadcast Encryption',
+        RESERVED,
+        'Enhanced Data Rate ACL 2 Mb/s mode',
+        'Enhanced Data Rate ACL 3 Mb/s mode',
+        'Enhanced inquiry scan',
+        'Interlaced inquiry scan',
+        'Interlaced page scan',
+        'RSSI with inquiry results',
+        'Extended SCO link (EV3 packets)',
+        'EV4 packets',
+        'EV5 packets',
+        RESERVED,
+        'AFH capable slave',
+        'AFH classification slave',
+        'BR/EDR Not Supported',
+        'LE Supported (Controller)',
+        '3-slot Enhanced Data Rate ACL packets',
+        '5-slot Enhanced Data Rate ACL packets',
+        'Sniff subrating',
+        'Pause encryption',
+        'AFH capable master',
+        'AFH classification master',
+        'Enhanced Data Rate eSCO 2 Mb/s mode',
+        'Enhanced Data Rate eSCO 3 Mb/s mode',
+        '3-slot Enhanced Data Rate eSCO packets',
+        'Extended Inquiry Response',
+        'Simultaneous LE and BR/EDR to Same Device Capable (Controller)',
+        RESERVED,
+        'Secure Simple Pairing (Controller Support)',
+        'Encapsulated PDU',
+        'Erroneous Data Reporting',
+        'Non-flushable Packet Boundary Flag',
+        RESERVED,
+        'HCI_Link_Supervision_Timeout_Changed event',
+        'Variable Inquiry TX Power Level',
+        'Enhanced Power Control',
+        RESERVED,
+        RESERVED,
+        RESERVED,
+        RESERVED,
+        'Extended features',
+    ],
+    1: [
+        'Secure Simple Pairing (Host Support)',
+        'LE Supported (Host)',
+        'Simultaneous LE and BR/EDR to Same Device Capable (Host)',
+        'Secure Connections (Host Support)',
+    ],
+    2: [
+        'Connectionless Slave Broadcast - Master Operation',
+        'Connectionless Slave Broadcast - Slave Operation',
+        'Synchronization Train',
+        'Synchronization Scan',
+        'HCI_Inquiry_Response_Notification event',
+        'Generalized interlaced scan',
+        'Coarse Clock Adjustment',
+        RESERVED,
+        'Secure Connections (Controller Support)',
+        'Ping',
+        'Slot Availability Mask',
+        'Train nudging',
+    ],
+})
+
+
+def __test():
+    le_features = LE_FEATURES.decode(bytes.fromhex('fd09000000000000'))
+    print('LE Coded PHY' in le_features, le_features.supported())
+    print(le_features.has_all(LE_FEATURES.mask('LE Encryption', 'LE 2M PHY')))
+
+    lmp_features = LMP_FEATURES.decode(bytes.fromhex('bffecffedbff7b87'))
+    lmp_features.add_page(b'\x0f', 1)
+    print(lmp_features.value('Flow control lag'), 'LE Supported (Host)' in lmp_features)
+    pp_feature_page(lmp_features, 1)
+
+
+if __name__ == '__main__':
+    __test()
+
+
+__all__ = ['Feature', 'FeatureSchema', 'FeatureSet', 'pp_feature_page',
+           'LE_FEATURES', 'LMP_FEATURES']
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+
+"""Persistent cache of remote controller fingerprints
+
+The version, company ID, subversion and feature pages read from a remote
+controller are recorded per BD_ADDR and transport (LE or BR/EDR) in an SQLite
+database. A fingerprint younger than the max age asked for is served from the
+cache, only the devices new or stale are connected again.
+"""
+
+import time
+import sqlite3
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from xpycommon.log import Logger
+
+from . import FINGERPRINT_CACHE, LOG_LEVEL
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+# Seconds to wait for another writer to release the database
+LOCK_TIMEOUT = 10
+
+# Seconds a fingerprint is served from the cache by default
+DEFAULT_MAX_AGE = 24 * 3600
+
+TRANSPORT_LE = 'le'
+TRANSPORT_BR = 'br'
+
+
+class Fingerprint(NamedTuple):
+    addr: str
+    transport: str # TRANSPORT_LE or TRANSPORT_BR
+    addr_type: int | None # ADDR_TYPE_PUBLIC or ADDR_TYPE_RANDOM of LE
+    version: int | None
+    company_id: int | None
+    subversion: int | None
+    features: dict[int, bytes] # Page number -> feature bytes
+    updated: float
+
+
+def addr2int(addr: str) -> int:
+    return int(addr.replace(':', ''), base=16)
+
+
+class FingerprintCache:
+    def __init__(self, path: Path = FINGERPRINT_CACHE):
+        self.path = path
+        self.conn = None
+
+    def __enter__(self) -> 'FingerprintCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self, create: bool = False) -> sqlite3.Connection:
+        """
+        create - Whether to create the database if it does not exist. If not,
+                 FileNotFoundError is raised.
+        """
+        if self.conn is not None:
+            return self.conn
+
+        if not create and not self.path.exists():
+            raise FileNotFoundError("No fingerprint cache: {}".format(self.path))
+
+        self.conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS fingerprints ("
+                          "addr INTEGER NOT NULL, "
+                          "transport TEXT NOT NULL, "
+                          "addr_type INTEGER, "
+                          "version INTEGER, "
+                          "company_id INTEGER, "
+                          "subversion INTEGER, "
+                          "updated REAL NOT NULL, "
+                          "PRIMARY KEY (addr, transport))")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS feature_pages ("
+                          "addr INTEGER NOT NULL, "
+                          "transport TEXT NOT NULL, "
+                          "page INTEGER NOT NULL, "
+                          "features BLOB NOT NULL, "
+                          "PRIMARY KEY (addr, transport, page))")
+        return self.conn
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def get(self, addr: str, transport: str, max_age: float = None) -> Fingerprint | None:
+        """None if not cached, or updated more than max_age seconds ago. Raise
+        FileNotFoundError if nothing has been cached yet."""
+        conn = self.open()
+        row = conn.execute(
+            "SELECT addr_type, version, company_id, subversion, updated FROM fingerprints "
+            "WHERE addr = ? AND transport = ?", (addr2int(addr), transport)).fetchone()
+        if row is None or (max_age is not None and time.time() - row[-1] > max_age):
+            return None
+
+        features = dict(conn.execute(
+            "SELECT page, features FROM feature_pages WHERE addr = ? AND transport = ?",
+            (addr2int(addr), transport)).fetchall())
+        addr_type, version, company_id, subversion, updated = row
+        return Fingerprint(addr.upper(), transport, addr_type, version, company_id, subversion,
+                           features, updated)
+
+    def put(self, fingerprints: Iterable[Fingerprint]) -> int:
+        """Replace the fingerprints of the same addresses and transport, in one
+        transaction. Return the number of fingerprints given."""
+        fingerprints = list(fingerprints)
+        if not fingerprints:
+            return 0
+
+        conn = self.open(create=True)
+        with conn:
+            for fp in fingerprints:
+                key = (addr2int(fp.addr), fp.transport)
+                conn.execute(
+                    "INSERT OR REPLACE INTO fingerprints (addr, transport, addr_type, version, "
+                    "company_id, subversion, updated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    key + (fp.addr_type, fp.version, fp.company_id, fp.subversion, fp.updated))
+                conn.execute("DELETE FROM feature_pages WHERE addr = ? AND transport = ?", key)
+                conn.executemany(
+                    "INSERT INTO feature_pages (addr, transport, page, features) "
+                    "VALUES (?, ?, ?, ?)",
+                    [key + (page, bytes(features)) for page, features in fp.features.items()])
+        return len(fingerprints)
+
+    def __len__(self) -> int:
+        try:
+            return self.open().execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+        except FileNotFoundError:
+            return 0
+
+
+def load_fingerprints(addrs: Iterable[str], transport: str,
+                      max_age: float = DEFAULT_MAX_AGE) -> dict[str, Fingerprint]:
+    """The fresh fingerprints of addrs found in the cache, by address in
+    uppercase. Failures only logged."""
+    fingerprints = {}
+    if max_age <= 0:
+        return fingerprints
+
+    try:
+        with FingerprintCache() as cache:
+            for addr in addrs:
+                fp = cache.get(addr, transport, max_age)
+                if fp is not None:
+                    fingerprints[fp.addr] = fp
+    except FileNotFoundError:
+        pass
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to load fingerprints, {}: {}".format(e.__class__.__name__, e))
+    return fingerprints
+
+
+def load_fingerprint(addr: str, transport: str,
+                     max_age: float = DEFAULT_MAX_AGE) -> Fingerprint | None:
+    return load_fingerprints([addr], transport, max_age).get(addr.upper())
+
+
+def store_fingerprints(fingerprints: Iterable[Fingerprint]):
+    """Put fingerprints into the cache, failures only logged"""
+    try:
+        with FingerprintCache() as cache:
+            count = cache.put(fingerprints)
+        logger.debug("Stored {} fingerprints into {}".format(count, FINGERPRINT_CACHE))
+    except (OSError, sqlite3.Error) as e:
+        # E.g. the package is installed in a read-only location.
+        logger.warning("Failed to store fingerprints, {}: {}".format(e.__class__.__name__, e))
+
+
+def __test():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with FingerprintCache(Path(tmpdir)/'fingerprints.db') as cache:
+            try:
+                cache.get('11:22:33:44:55:66', TRANSPORT_BR)
+            except FileNotFoundError as e:
+                print(e)
+
+            now = time.time()
+            cache.put([Fingerprint('11:22:33:44:55:66', TRANSPORT_BR, None, 9, 0x000f, 0x1234,
+                                   {0: bytes.fromhex('bffecffedbff7b87'), 1: b'\x0f'}, now),
+                       Fingerprint('c0:ff:ee:00:00:01', TRANSPORT_LE, 1, None, None, None,
+                                   {0: bytes.fromhex('fd09000000000000')}, now - 3600)])
+            print(cache.get('11:22:33:44:55:66', TRANSPORT_BR))
+            print(cache.get('C0:FF:EE:00:00:01', TRANSPORT_LE))
+            print(cache.get('C0:FF:EE:00:00:01', TRANSPORT_LE, max_age=60))
+            print(cache.get('11:22:33:44:55:66', TRANSPORT_LE))
+            print(len(cache))
+
+
+if __name__ == '__main__':
+    __test()
+
+
+__all__ = ['Fingerprint', 'FingerprintCache', 'DEFAULT_MAX_AGE', 'TRANSPORT_LE', 'TRANSPORT_BR',
+           'load_fingerprint', 'load_fingerprints', 'store_fingerprints']
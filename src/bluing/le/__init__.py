@@ -11,7 +11,8 @@ PKG_NAME = '.'.join([PARENT_PKG_NAME, 'le'])
 PKG_ROOT = Path(__file__).parent
 LOG_LEVEL = PARENT_LOG_LEVEL
 # LOG_LEVEL = DEBUG
-LE_DEVS_SCAN_RESULT_CACHE = PKG_ROOT/'res'/'le_devs_scan_result.cache'
+LE_ADDR_TYPE_CACHE = PKG_ROOT/'res'/'le_addr_types.db'
+LE_GATT_CACHE = PKG_ROOT/'res'/'gatt_dbs.db'
 
 
 from .__main__ import main
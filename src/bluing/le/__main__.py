@@ -13,32 +13,85 @@ from .microbit import get_microbit_devpaths
 from . import LOG_LEVEL
 from .ui import parse_cmdline
 from .le_scan import LeScanner
+from .multi_scan import scan_devs_multi
+from .survey import resolve_addr_types, survey_ll_features, survey_pairing_features
+from .scan_sink import ConsoleSink, JsonLinesSink
 from .gatt_scan import GattScanner
 
 
 logger = Logger(__name__, LOG_LEVEL)
 
 
+def write_survey(scan_result, sinks: list[JsonLinesSink]):
+    """Write one line per target of a survey to the --jsonl sinks. Return
+    scan_result if it is still to be printed."""
+    for sink in sinks:
+        for record in scan_result.to_dicts():
+            sink.write(record)
+
+    if any(sink.console for sink in sinks):
+        # Not mixed with the JSON Lines on stdout
+        return None
+    return scan_result
+
+
 def main(argv: list[str] = sys.argv):
     args = parse_cmdline(argv[1:])
     logger.debug("parse_cmdline() returned\n"
                  "    args:", args)
 
+    sinks = []
+
     try:
         scan_result = None
 
+        if args['--stream']:
+            sinks.append(ConsoleSink())
+        if args['--jsonl']:
+            sinks.append(JsonLinesSink(args['--jsonl']))
+
         if args['--scan']:
-            scan_result = LeScanner(args['-i']).scan_devs(args['--timeout'], 
-                    args['--scan-type'], args['--sort'])
+            if len(args['ifaces']) > 1:
+                scan_result = scan_devs_multi(args['ifaces'], args['--timeout'], 
+                    args['--scan-type'], args['--sort'], sinks, args['--backend'], 
+                    args['scan_filter'], args['--filter-dup'], args['scan_interval'], 
+                    args['scan_window'], args['--adaptive'], args['--top'])
+            else:
+                scan_result = LeScanner(args['-i'], backend=args['--backend'], 
+                                        scan_interval=args['scan_interval'], 
+                                        scan_window=args['scan_window']).scan_devs(args['--timeout'], 
+                    args['--scan-type'], args['--sort'], sinks, scan_filter=args['scan_filter'], 
+                    filter_dup=args['--filter-dup'], adaptive=args['--adaptive'], top=args['--top'])
+
+            if any(sink.console for sink in sinks):
+                # All devices have been printed during the scan.
+                scan_result.store()
+                scan_result = None
+        elif args['--monitor']:
+            LeScanner(args['-i'], backend=args['--backend'], scan_interval=args['scan_interval'], 
+                      scan_window=args['scan_window']).monitor(args['--scan-type'], args['--max-devs'], 
+                args['--idle-timeout'], args['--report-interval'], sinks, args['--rssi-history'], 
+                args['scan_filter'], args['--filter-dup'], args['--sort'], args['--top'])
         elif args['--ll-feature-set']:
-            LeScanner(args['-i']).read_ll_feature_set(
-                args['PEER_ADDR'], args['--addr-type'], args['--timeout'])
+            if args['survey']:
+                scan_result = survey_ll_features(args['ifaces'], args['targets'], args['--timeout'], 
+                                                 args['--backend'], args['--max-age'])
+                scan_result = write_survey(scan_result, sinks)
+            else:
+                LeScanner(args['-i'], backend=args['--backend']).read_ll_feature_set(
+                    args['PEER_ADDR'], args['--addr-type'], args['--timeout'], args['--max-age'])
         elif args['--pairing-feature']:
-            LeScanner(args['-i']).req_pairing_feature(
-                args['PEER_ADDR'], args['--addr-type'], args['--timeout'])
+            if args['survey']:
+                targets = resolve_addr_types(args['-i'], args['targets'], args['--backend'], 
+                                             args['--timeout'])
+                scan_result = survey_pairing_features(args['ifaces'], targets, args['--timeout'])
+                scan_result = write_survey(scan_result, sinks)
+            else:
+                LeScanner(args['-i']).req_pairing_feature(
+                    args['PEER_ADDR'], args['--addr-type'], args['--timeout'])
         elif args['--gatt']:
             scan_result = GattScanner(args['-i'], args['--io-cap']).scan(
-                args['PEER_ADDR'], args['--addr-type']) 
+                args['PEER_ADDR'], args['--addr-type'], not args['--no-cache']) 
         elif args['--sniff-adv']:
             if not args['--device']:
                 dev_paths = get_microbit_devpaths()
@@ -96,3 +149,6 @@ def main(argv: list[str] = sys.argv):
         logger.debug("e_info: {}".format(e_info))
         logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
         sys.exit(1)
+    finally:
+        for sink in sinks:
+            sink.close()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+"""Persistent cache of LE address types
+
+Every LE device seen by a scan is recorded as address -> (address type, last
+seen, source) in an SQLite database, keyed by the address as an integer. A
+lookup is a single primary key search, and scans are merged into the cache
+instead of replacing it, so any device seen before is found without scanning.
+SQLite serializes concurrent writers, e.g. two bluing processes on different
+HCI devices.
+"""
+
+import time
+import sqlite3
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from xpycommon.log import Logger
+
+from . import LE_ADDR_TYPE_CACHE, LOG_LEVEL
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+# Seconds to wait for another writer to release the database
+LOCK_TIMEOUT = 10
+
+
+class LeAddrTypeRecord(NamedTuple):
+    addr: str
+    addr_type: str
+    last_seen: float
+    source: str | None # The HCI device the LE device was seen on
+
+
+def addr2int(addr: str) -> int:
+    return int(addr.replace(':', ''), base=16)
+
+
+def int2addr(addr: int) -> str:
+    addr = "{:012X}".format(addr)
+    return ':'.join([addr[i:i+2] for i in range(0, 12, 2)])
+
+
+class LeAddrTypeCache:
+    def __init__(self, path: Path = LE_ADDR_TYPE_CACHE):
+        self.path = path
+        self.conn = None
+
+    def __enter__(self) -> 'LeAddrTypeCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self, create: bool = False) -> sqlite3.Connection:
+        """
+        create - Whether to create the database if it does not exist. If not,
+                 FileNotFoundError is raised.
+        """
+        if self.conn is not None:
+            return self.conn
+
+        if not create and not self.path.exists():
+            raise FileNotFoundError("No LE address type cache: {}".format(self.path))
+
+        self.conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT)
+        # Readers do not block the writer and vice versa.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS le_addr_types ("
+                          "addr INTEGER PRIMARY KEY, "
+                          "addr_type TEXT NOT NULL, "
+                          "last_seen REAL NOT NULL, "
+                          "source TEXT)")
+        return self.conn
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def get(self, addr: str) -> LeAddrTypeRecord | None:
+        """Raise FileNotFoundError if nothing has been cached yet."""
+        row = self.open().execute(
+            "SELECT addr_type, last_seen, source FROM le_addr_types WHERE addr = ?",
+            (addr2int(addr),)).fetchone()
+        if row is None:
+            return None
+        return LeAddrTypeRecord(addr.upper(), *row)
+
+    def merge(self, records: Iterable[tuple[str, str, float, str | None]]) -> int:
+        """Insert or update the records of (addr, addr_type, last_seen, source)
+        in one transaction. A record older than the cached one of the same
+        address is ignored. Return the number of records given."""
+        rows = [(addr2int(addr), addr_type, last_seen, source)
+                for addr, addr_type, last_seen, source in records]
+        if not rows:
+            return 0
+
+        conn = self.open(create=True)
+        with conn:
+            conn.executemany(
+                "INSERT INTO le_addr_types (addr, addr_type, last_seen, source) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (addr) DO UPDATE SET "
+                "addr_type = excluded.addr_type, "
+                "last_seen = excluded.last_seen, "
+                "source = excluded.source "
+                "WHERE excluded.last_seen >= le_addr_types.last_seen", rows)
+        return len(rows)
+
+    def __len__(self) -> int:
+        try:
+            return self.open().execute("SELECT COUNT(*) FROM le_addr_types").fetchone()[0]
+        except FileNotFoundError:
+            return 0
+
+
+def store_addr_types(records: Iterable[tuple[str, str, float, str | None]]):
+    """Merge records into the cache, failures only logged"""
+    try:
+        with LeAddrTypeCache() as cache:
+            count = cache.merge(records)
+        logger.debug("Merged {} LE address types into {}".format(count, LE_ADDR_TYPE_CACHE))
+    except (OSError, sqlite3.Error) as e:
+        # E.g. the package is installed in a read-only location.
+        logger.warning("Failed to store LE address types, {}: {}".format(
+            e.__class__.__name__, e))
+
+
+def __test():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with LeAddrTypeCache(Path(tmpdir)/'le_addr_types.db') as cache:
+            try:
+                cache.get('11:22:33:44:55:66')
+            except FileNotFoundError as e:
+                print(e)
+
+            now = time.time()
+            cache.merge([('11:22:33:44:55:66', 'public', now, 'hci0'),
+                         ('c0:ff:ee:00:00:01', 'random', now, 'hci1')])
+            cache.merge([('11:22:33:44:55:66', 'random', now - 60, 'hci1')])
+            print(cache.get('11:22:33:44:55:66'))
+            print(cache.get('C0:FF:EE:00:00:01'))
+            print(cache.get('00:00:00:00:00:00'))
+            print(len(cache))
+
+
+if __name__ == '__main__':
+    __test()
+
+
+__all__ = ['LeAddrTypeCache', 'LeAddrTypeRecord', 'store_addr_types']
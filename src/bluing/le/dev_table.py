@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable
+
+from xpycommon.log import Logger
+from xpycommon.ui import blue, INDENT
+
+from ..gap_data import TX_POWER_LEVEL
+from . import LOG_LEVEL
+from .ranking import TopK, record_ranks, dev_vendor
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+
+class RssiHistory:
+    """The latest RSSIs of a device and when they were received, in a ring
+    buffer of fixed size.
+
+    RSSIs are kept as int8 and times as float32 offsets from the first one, so
+    a buffer of 64 entries takes 320 octets however long the device is seen.
+    """
+    __slots__ = ('rssis', 'offsets', 'start', 'size', 'count', 'idx')
+
+    def __init__(self, size: int = 64, start: float = 0.0):
+        self.rssis = array('b', bytes(size))
+        self.offsets = array('f', bytes(4*size))
+        self.start = start
+        self.size = size
+        self.count = 0 # Entries filled
+        self.idx = 0 # Where the next entry goes
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, rssi: int | None, now: float):
+        """An RSSI not available (None) is skipped."""
+        if rssi is None:
+            return
+        self.rssis[self.idx] = max(-128, min(127, rssi))
+        self.offsets[self.idx] = now - self.start
+        self.idx = (self.idx + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def _ordered(self, buf: array) -> array:
+        """Oldest first"""
+        if self.count < self.size:
+            return buf[:self.count]
+        return buf[self.idx:] + buf[:self.idx]
+
+    def values(self) -> array:
+        return self._ordered(self.rssis)
+
+    def times(self) -> list[float]:
+        return [self.start + offset for offset in self._ordered(self.offsets)]
+
+    # The statistics below work on the filled part of the buffer. min(), max()
+    # and sum() iterate the array in C.
+
+    def min(self) -> int:
+        return min(self.rssis[:self.count])
+
+    def max(self) -> int:
+        return max(self.rssis[:self.count])
+
+    def mean(self) -> float:
+        return sum(self.rssis[:self.count]) / self.count
+
+    def percentile(self, p: float) -> float:
+        """Linear interpolation between the closest ranks, p in [0, 100]"""
+        values = sorted(self.rssis[:self.count])
+        pos = (len(values) - 1) * p / 100
+        lower = int(pos)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (pos - lower)
+
+
+class LeDeviceRecord:
+    """A device tracked by LeDeviceTable"""
+    __slots__ = ('addr', 'addr_type', 'dev_info', 'first_seen', 'last_seen',
+                 'adv_count', 'change_count', 'rssi', 'history')
+
+    def __init__(self, addr: str, addr_type: str, rssi: int | None, now: float,
+                 history_size: int = 64):
+        self.addr = addr
+        self.addr_type = addr_type
+        self.dev_info = None # The latest decoded LeDeviceInfo
+        self.first_seen = now
+        self.last_seen = now
+        self.adv_count = 1
+        self.change_count = 0 # Advertisements that changed the data, i.e. decoded
+        self.rssi = rssi # The latest available, None if none yet
+        self.history = RssiHistory(history_size, now)
+        self.history.append(rssi, now)
+
+    def update(self, rssi: int | None, now: float):
+        self.last_seen = now
+        self.adv_count += 1
+        if rssi is not None:
+            self.rssi = rssi
+        self.history.append(rssi, now)
+
+    @property
+    def tx_power(self) -> int | None:
+        """The TX power advertised, from TX Power Level or extended advertising"""
+        if self.dev_info is None:
+            return None
+        for ad in self.dev_info.ad_structs:
+            if ad.type == TX_POWER_LEVEL:
+                tx_power = ad.decode()
+                if isinstance(tx_power, int):
+                    return tx_power
+        return self.dev_info.tx_power
+
+    def pathloss(self) -> float | None:
+        """Estimated from the median RSSI, which is not thrown off by a few
+        faded or reflected advertisements."""
+        tx_power = self.tx_power
+        if tx_power is None or not self.history:
+            return None
+        return tx_power - self.history.percentile(50)
+
+    @property
+    def vendor(self) -> str:
+        return dev_vendor(self.addr, self.addr_type,
+                          [] if self.dev_info is None else self.dev_info.ad_structs)
+
+
+class LeDeviceTable:
+    """A bounded table of LE devices keyed by address.
+
+    Records are kept in the order they were last seen, so that devices idle
+    for longer than idle_timeout can be evicted from the front in O(1) each.
+    When max_devs is reached, the least recently seen device is evicted to make
+    room for a new one.
+
+    If sort is given, the devices are also ranked by that key in a TopK as
+    they are updated, and printed in the order of the ranking.
+    """
+    def __init__(self, max_devs: int = 1000, idle_timeout: float = 300,
+                 on_evict: Callable[[LeDeviceRecord], None] = None,
+                 history_size: int = 64, sort: str = None):
+        """
+        history_size - Number of the latest RSSIs kept per device
+        sort         - One of ranking.SORT_KEYS
+        """
+        self.max_devs = max_devs
+        self.idle_timeout = idle_timeout
+        self.history_size = history_size
+        self.on_evict = on_evict
+        self.ranking = None if sort is None else TopK(record_ranks[sort])
+        self.records = OrderedDict()
+        self.evicted_count = 0
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def __contains__(self, addr: str) -> bool:
+        return addr in self.records
+
+    def get(self, addr: str) -> LeDeviceRecord | None:
+        return self.records.get(addr)
+
+    def update(self, addr: str, addr_type: str, rssi: int | None,
+               now: float = None) -> tuple[LeDeviceRecord, bool]:
+        """Account an advertising report, return the record and whether the
+        device is new to the table. rssi is None if not available."""
+        if now is None:
+            now = time.time()
+
+        try:
+            record = self.records[addr]
+        except KeyError:
+            if len(self.records) >= self.max_devs:
+                self._evict_oldest()
+            record = self.records[addr] = LeDeviceRecord(addr, addr_type, rssi, now,
+                                                         self.history_size)
+            self.rank(record)
+            return record, True
+
+        record.update(rssi, now)
+        self.records.move_to_end(addr)
+        self.rank(record)
+        return record, False
+
+    def rank(self, record: LeDeviceRecord):
+        """Update the ranking of record, also needed when its dev_info changes"""
+        if self.ranking is not None:
+            self.ranking.update(record.addr, record)
+
+    def evict_idle(self, now: float = None) -> int:
+        """Evict devices not seen for idle_timeout seconds, return the number
+        of evicted devices."""
+        if now is None:
+            now = time.time()
+
+        count = 0
+        deadline = now - self.idle_timeout
+        while self.records:
+            record = next(iter(self.records.values()))
+            if record.last_seen >= deadline:
+                break
+            self._evict_oldest()
+            count += 1
+        return count
+
+    def _evict_oldest(self):
+        _, record = self.records.popitem(last=False)
+        self.evicted_count += 1
+        if self.ranking is not None:
+            self.ranking.remove(record.addr)
+        if self.on_evict is not None:
+            self.on_evict(record)
+
+    def print(self, now: float = None, top: int = None):
+        """
+        top - Only print the top ranked devices, or the latest seen ones if
+              the table is not ranked
+        """
+        if now is None:
+            now = time.time()
+
+        if self.ranking is not None:
+            records = [self.records[addr] for addr in self.ranking.top(top)]
+        else:
+            records = list(reversed(self.records.values()))[:top]
+
+        print("{} devices tracked, {} evicted".format(blue(str(len(self.records))),
+                                                      self.evicted_count))
+        print(INDENT + "{:<17}  {:<6}  {:>7}  {:>7}  {:>4}  {:>4}  {:>6}  {:>6}  {:>4}  {:>6}  {:>9}".format(
+            'Addr', 'Type', 'ADVs', 'Changes', 'RSSI', 'Min', 'Median', 'Mean', 'Max', 'Loss', 'Last seen'))
+        for record in records:
+            history = record.history
+            pathloss = record.pathloss()
+            if history:
+                stats = (history.min(), "{:.1f}".format(history.percentile(50)),
+                         "{:.1f}".format(history.mean()), history.max())
+            else:
+                # No report carried an RSSI
+                stats = ('-',) * 4
+            print(INDENT + "{:<17}  {:<6}  {:>7}  {:>7}  {:>4}  {:>4}  {:>6}  {:>6}  {:>4}  {:>6}  {:>8.1f}s".format(
+                record.addr, record.addr_type, record.adv_count, record.change_count,
+                '-' if record.rssi is None else record.rssi, *stats,
+                '-' if pathloss is None else "{:.1f}".format(pathloss),
+                now - record.last_seen))
+        print()
+
+
+__all__ = ['RssiHistory', 'LeDeviceRecord', 'LeDeviceTable']
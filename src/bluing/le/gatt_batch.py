@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+
+"""Batched reads of characteristic values and descriptors
+
+A Read Multiple Variable Length Response carries the length of each value, so
+any readable attributes can share one request. A Read Multiple Response is the
+values concatenated, so only the attributes of the types whose values have a
+fixed length share one. An attribute is read with its own request if the
+server supports neither procedure (Request Not Supported), if its value does
+not fit into the response, or if the server responds to a batch with an error
+on it (e.g. Read Not Permitted). The rest of such a batch is requested again.
+
+btgatt has no Read Multiple procedures, so the request PDUs are built here and
+sent on the L2CAP socket of the ATT bearer of the GattClient, between its own
+procedures. The socket is looked up by the attribute names of btgatt/btatt
+(att_bearer_sock()), without it every attribute is read one by one.
+"""
+
+import time
+import socket
+import struct
+from uuid import UUID
+from typing import Callable
+
+from btgatt import bt_base_uuid
+from xpycommon.log import Logger
+
+from . import LOG_LEVEL
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+ATT_DEFAULT_MTU = 23
+# An ATT PDU is at most 517 octets on LE
+ATT_MAX_PDU_SIZE = 517
+
+# ATT opcodes, Core Spec Vol 3, Part F, 3.4.8
+ATT_ERROR_RSP                   = 0x01
+ATT_READ_MULTIPLE_REQ           = 0x0E
+ATT_READ_MULTIPLE_RSP           = 0x0F
+ATT_HANDLE_VALUE_IND            = 0x1D
+ATT_HANDLE_VALUE_CFM            = 0x1E
+ATT_READ_MULTIPLE_VARIABLE_REQ  = 0x20
+ATT_READ_MULTIPLE_VARIABLE_RSP  = 0x21
+
+# ATT_ERROR_RSP: Request Opcode In Error, Attribute Handle In Error, Error Code
+ATT_ERROR_RSP_PARAMS = struct.Struct('<BHB')
+
+# Seconds to wait for the response to a batch, as ATT transactions
+ATT_TRANSACTION_TIMEOUT = 30
+
+# ATT_ERROR_RSP Error Code of a server not supporting the request
+ATT_REQUEST_NOT_SUPPORTED = 0x06
+
+# Batching stops after this many batches timed out, each costs an ATT
+# transaction timeout and a reconnection.
+MAX_BATCH_TIMEOUTS = 2
+
+# Value lengths of the characteristics and descriptors of a fixed length, by
+# 16-bit UUID
+FIXED_VALUE_LENS = {
+    0x2900: 2,  # Characteristic Extended Properties
+    0x2902: 2,  # Client Characteristic Configuration
+    0x2903: 2,  # Server Characteristic Configuration
+    0x2904: 7,  # Characteristic Presentation Format
+    0x2A01: 2,  # Appearance
+    0x2A04: 8,  # Peripheral Preferred Connection Parameters
+    0x2A07: 1,  # Tx Power Level
+    0x2A19: 1,  # Battery Level
+    0x2A23: 8,  # System ID
+    0x2A50: 7,  # PnP ID
+    0x2AA6: 1,  # Central Address Resolution
+    0x2AC9: 1,  # Resolvable Private Address Only
+    0x2B2A: 16, # Database Hash
+}
+
+# Request opcode of each procedure
+PROCEDURE_OPCODES = {
+    'variable': ATT_READ_MULTIPLE_VARIABLE_REQ,
+    'fixed': ATT_READ_MULTIPLE_REQ,
+}
+
+
+class AttErrorRsp(Exception):
+    """The server responded with ATT_ERROR_RSP."""
+    def __init__(self, req_opcode: int, handle: int, error_code: int):
+        super().__init__("ATT_ERROR_RSP to 0x{:02x}, handle 0x{:04x}, error code 0x{:02x}".format(
+            req_opcode, handle, error_code))
+        self.req_opcode = req_opcode
+        self.handle = handle
+        self.error_code = error_code
+
+
+def uuid16(uuid) -> int | None:
+    """The 16-bit UUID of a UUID or an attribute type, None if it is not one"""
+    int16 = getattr(uuid, 'int16', None)
+    if int16 is not None:
+        return int16
+    if isinstance(uuid, int):
+        return uuid if uuid <= 0xFFFF else None
+    if isinstance(uuid, UUID) and uuid.bytes[4:] == bt_base_uuid.bytes[4:] and \
+            uuid.bytes[:2] == b'\x00\x00':
+        return int.from_bytes(uuid.bytes[2:4], 'big')
+    return None
+
+
+def split_length_value_tuples(params: bytes) -> list[bytes | None]:
+    """Split a Length Value Tuple List. A value truncated by the ATT_MTU is None."""
+    values = []
+    offset = 0
+    while offset + 2 <= len(params):
+        length = int.from_bytes(params[offset:offset+2], 'little')
+        value = params[offset+2:offset+2+length]
+        values.append(value if len(value) == length else None)
+        offset += 2 + length
+    return values
+
+
+def att_bearer_sock(gatt_client) -> socket.socket | None:
+    """The L2CAP socket of the ATT bearer of a btgatt.GattClient, None if it
+    does not expose one. Looked up again after every reconnection."""
+    att_client = getattr(gatt_client, 'att_client', gatt_client)
+    sock = getattr(att_client, 'sock', None)
+    return sock if isinstance(sock, socket.socket) else None
+
+
+def att_mtu(gatt_client) -> int:
+    """The ATT_MTU of the current connection of a btgatt.GattClient"""
+    att_client = getattr(gatt_client, 'att_client', gatt_client)
+    return getattr(att_client, 'mtu', None) or ATT_DEFAULT_MTU
+
+
+def att_request(sock: socket.socket, req: bytes, timeout: float = ATT_TRANSACTION_TIMEOUT) -> bytes:
+    """Send an ATT request PDU, return the parameters of its response.
+
+    Raise AttErrorRsp if the server responds with an error, TimeoutError if it
+    does not respond in time, ConnectionError if the bearer is closed.
+    Indications received meanwhile are confirmed, notifications are dropped.
+    """
+    prev_timeout = sock.gettimeout()
+    try:
+        sock.settimeout(timeout)
+        sock.send(req)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("No response to ATT request 0x{:02x}".format(req[0]))
+
+            sock.settimeout(remaining)
+            # socket.timeout is TimeoutError.
+            pdu = sock.recv(ATT_MAX_PDU_SIZE)
+            if len(pdu) == 0:
+                # Nothing but empty reads from now on
+                raise ConnectionError("ATT bearer closed")
+
+            if pdu[0] == req[0] + 1:
+                return pdu[1:]
+            elif pdu[0] == ATT_ERROR_RSP and len(pdu) >= 1 + ATT_ERROR_RSP_PARAMS.size and \
+                    pdu[1] == req[0]:
+                raise AttErrorRsp(*ATT_ERROR_RSP_PARAMS.unpack_from(pdu, 1))
+            elif pdu[0] == ATT_HANDLE_VALUE_IND:
+                sock.send(bytes([ATT_HANDLE_VALUE_CFM]))
+    finally:
+        sock.settimeout(prev_timeout)
+
+
+class BatchReader:
+    def __init__(self, gatt_client, reconnect: Callable[[], None] = None):
+        """
+        gatt_client - btgatt.GattClient, the requests are sent on its ATT
+                      bearer.
+        reconnect   - Called when a batch times out or the bearer is closed
+        """
+        self.gatt_client = gatt_client
+        self.reconnect = reconnect
+        self.procedures = dict(PROCEDURE_OPCODES)
+        if att_bearer_sock(gatt_client) is None:
+            logger.info("No access to the ATT bearer of the GATT client, values are read one by one")
+            self.procedures = {procedure: None for procedure in PROCEDURE_OPCODES}
+        self.timeouts = 0
+        self.num_requests = 0
+        # Handles the server responded with an error to, not batched again
+        self.refused = set()
+
+    @property
+    def mtu(self) -> int:
+        # A reconnection exchanges the MTU again.
+        return att_mtu(self.gatt_client)
+
+    def read(self, attrs: list[tuple[int, object]]) -> dict[int, bytes]:
+        """Read the values of attrs [(handle, type)] in as few requests as
+        possible. Return {handle: value} of those read, the others are left
+        to be read one by one."""
+        values = {}
+
+        # The values not fitting into a response are requested again in the
+        # next batch. The first value of a response not fitting is too long
+        # to be read in a batch.
+        pending = [handle for handle, _ in attrs]
+        while self.procedures['variable'] is not None and len(pending) > 1:
+            # Handles of 2 bytes after the 1 byte opcode
+            max_handles = (self.mtu - 1) // 2
+            read_handles = self.read_batch('variable', pending[:max_handles], values)
+            if len(read_handles) != 0 and read_handles[0] not in values:
+                read_handles = read_handles[1:]
+            pending = [handle for handle in read_handles if handle not in values] + \
+                pending[max_handles:]
+
+        fixed_lens = {handle: FIXED_VALUE_LENS.get(uuid16(attr_type)) for handle, attr_type in attrs}
+        remaining = [handle for handle, _ in attrs
+                     if handle not in values and handle not in self.refused and fixed_lens[handle]]
+        if self.procedures['fixed'] is not None and len(remaining) > 1:
+            mtu = self.mtu
+            max_handles = (mtu - 1) // 2
+            batch = []
+            size = 0
+            for handle in remaining:
+                if len(batch) == max_handles or size + fixed_lens[handle] > mtu - 1:
+                    self.read_batch('fixed', batch, values, fixed_lens)
+                    # A timeout reconnects, possibly with another MTU.
+                    mtu = self.mtu
+                    max_handles = (mtu - 1) // 2
+                    batch = []
+                    size = 0
+                batch.append(handle)
+                size += fixed_lens[handle]
+            self.read_batch('fixed', batch, values, fixed_lens)
+
+        logger.debug("Read {} of {} values in {} batches".format(
+            len(values), len(attrs), self.num_requests))
+        return values
+
+    def read_batch(self, procedure: str, handles: list[int], values: dict[int, bytes],
+                   fixed_lens: dict[int, int] = None) -> list[int]:
+        """Put the values read into values. Return the handles of the request
+        answered, in order, empty if the batch failed.
+
+        An attribute the server responds with an error to (e.g. Read Not
+        Permitted, Insufficient Authentication) is dropped from the batch, to
+        be read one by one, and the rest requested again.
+        """
+        while len(handles) > 1 and self.procedures[procedure] is not None:
+            sock = att_bearer_sock(self.gatt_client)
+            if sock is None:
+                return []
+
+            self.num_requests += 1
+            try:
+                rsp = att_request(sock, struct.pack('<B{}H'.format(len(handles)),
+                                                    self.procedures[procedure], *handles))
+                break
+            except (TimeoutError, ConnectionError) as e:
+                logger.debug("Read Multiple ({}) failed, {}: {}".format(
+                    procedure, e.__class__.__name__, e))
+                if self.reconnect is not None:
+                    self.reconnect()
+                self.timeouts += 1
+                if self.timeouts >= MAX_BATCH_TIMEOUTS:
+                    logger.debug("Too many batches timed out, no more Read Multiple")
+                    self.procedures = {procedure: None for procedure in PROCEDURE_OPCODES}
+                return []
+            except AttErrorRsp as e:
+                logger.debug("Read Multiple ({}) failed, {}".format(procedure, e))
+                if e.error_code == ATT_REQUEST_NOT_SUPPORTED:
+                    self.procedures[procedure] = None
+                    return []
+                if e.handle not in handles:
+                    return []
+                self.refused.add(e.handle)
+                handles = [handle for handle in handles if handle != e.handle]
+        else:
+            return []
+
+        if procedure == 'variable':
+            batch_values = split_length_value_tuples(rsp)
+        else:
+            if len(rsp) != sum(fixed_lens[handle] for handle in handles):
+                # Not the length expected, unable to split.
+                return []
+            batch_values = []
+            offset = 0
+            for handle in handles:
+                batch_values.append(rsp[offset:offset+fixed_lens[handle]])
+                offset += fixed_lens[handle]
+
+        for handle, value in zip(handles, batch_values):
+            if value is not None:
+                values[handle] = bytes(value)
+        return handles
+
+
+__all__ = ['BatchReader', 'AttErrorRsp', 'FIXED_VALUE_LENS', 'uuid16', 'split_length_value_tuples',
+           'att_request']
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+"""Persistent cache of GATT databases
+
+The services, characteristics and descriptors discovered on an LE device are
+recorded per address in an SQLite database, without their values, along with
+the value of its Database Hash characteristic if it has one. A structural
+fingerprint of its primary services is recorded as well.
+
+When the device is scanned again, the cached database is used as long as the
+Database Hash read from the device (a single read) is unchanged. For a device
+without one, the primary services are discovered again and compared with the
+fingerprint. Only the values are read again.
+
+The services are pickled btgatt objects. Unpickling runs arbitrary code, so
+the cache is trusted only as far as its files: it is written by bluing itself,
+usually as root, and only loaded if it, its WAL and shared-memory files and
+their directory are owned by root or the current user and not writable by
+anyone else.
+"""
+
+import os
+import stat
+import time
+import pickle
+import sqlite3
+from hashlib import sha256
+from pathlib import Path
+from typing import NamedTuple
+
+from btgatt import Service
+from xpycommon.log import Logger
+
+from . import LE_GATT_CACHE, LOG_LEVEL
+from .gatt_batch import uuid16
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+# Seconds to wait for another writer to release the database
+LOCK_TIMEOUT = 10
+
+DATABASE_HASH_UUID = 0x2B2A
+
+
+class GattDbRecord(NamedTuple):
+    addr: str
+    db_hash: bytes | None # Value of the Database Hash characteristic
+    fingerprint: str # services_fingerprint() of the primary services
+    services: bytes # Pickled [btgatt.Service], without values
+    updated: float
+
+
+def addr2int(addr: str) -> int:
+    return int(addr.replace(':', ''), base=16)
+
+
+def services_fingerprint(services: list[Service]) -> str:
+    """A digest of the handle range and the UUID of each primary service"""
+    digest = sha256()
+    for service in services:
+        digest.update("{:04x}-{:04x}-{};".format(
+            service.start_handle, service.end_handle, service.declar.value).encode())
+    return digest.hexdigest()
+
+
+def find_db_hash_charact(services: list[Service]):
+    """The Database Hash characteristic, None if the device has none"""
+    for service in services:
+        for charact in service.get_characts():
+            if uuid16(charact.declar.value.uuid) == DATABASE_HASH_UUID:
+                return charact
+    return None
+
+
+class GattDbCache:
+    def __init__(self, path: Path = LE_GATT_CACHE):
+        self.path = path
+        self.conn = None
+
+    def __enter__(self) -> 'GattDbCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self, create: bool = False) -> sqlite3.Connection:
+        """
+        create - Whether to create the database if it does not exist. If not,
+                 FileNotFoundError is raised.
+        """
+        if self.conn is not None:
+            return self.conn
+
+        if not create and not self.path.exists():
+            raise FileNotFoundError("No GATT database cache: {}".format(self.path))
+        if self.path.exists():
+            check_trusted(self.path)
+
+        self.conn = sqlite3.connect(self.path, timeout=LOCK_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS gatt_dbs ("
+                          "addr INTEGER PRIMARY KEY, "
+                          "db_hash BLOB, "
+                          "fingerprint TEXT NOT NULL, "
+                          "services BLOB NOT NULL, "
+                          "updated REAL NOT NULL)")
+        return self.conn
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def get(self, addr: str) -> GattDbRecord | None:
+        """Raise FileNotFoundError if nothing has been cached yet."""
+        row = self.open().execute(
+            "SELECT db_hash, fingerprint, services, updated FROM gatt_dbs WHERE addr = ?",
+            (addr2int(addr),)).fetchone()
+        if row is None:
+            return None
+        return GattDbRecord(addr.upper(), *row)
+
+    def put(self, record: GattDbRecord):
+        conn = self.open(create=True)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO gatt_dbs (addr, db_hash, fingerprint, services, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (addr2int(record.addr), record.db_hash, record.fingerprint, record.services,
+                 record.updated))
+
+
+def sqlite_files(path: Path) -> list[Path]:
+    """The database file and the WAL and shared-memory files beside it"""
+    path = Path(path)
+    return [path] + [path.with_name(path.name + suffix) for suffix in ('-wal', '-shm')]
+
+
+def check_trusted(path: Path):
+    """Raise PermissionError if path may have been written by another user,
+    its pickles are not to be loaded then.
+
+    Its WAL and shared-memory files, whose pages are read as part of the
+    database, and its directory, in which they could be replaced, are
+    checked as well.
+    """
+    path = Path(path)
+    for checked in [path.parent] + sqlite_files(path):
+        try:
+            st = os.stat(checked)
+        except FileNotFoundError:
+            continue
+        if st.st_uid not in (0, os.getuid()) or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError("Not loading {}, {} is owned by another user or writable by "
+                                  "group/others".format(path, checked))
+
+
+def load_gatt_db(addr: str) -> tuple[GattDbRecord, list[Service]] | None:
+    """The cached record of addr and its unpickled services. Failures only
+    logged."""
+    try:
+        with GattDbCache() as cache:
+            record = cache.get(addr)
+        if record is None:
+            return None
+        # Fails if e.g. pickled by another version of btgatt
+        return record, pickle.loads(record.services)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Failed to load the cached GATT database, {}: {}".format(
+            e.__class__.__name__, e))
+        return None
+
+
+def store_gatt_db(addr: str, db_hash: bytes | None, fingerprint: str, services: bytes):
+    """
+    services - Pickled before any value is read
+
+    Failures only logged.
+    """
+    try:
+        with GattDbCache() as cache:
+            cache.put(GattDbRecord(addr.upper(), db_hash, fingerprint, services, time.time()))
+            # Not writable by others, see check_trusted()
+            for path in sqlite_files(cache.path):
+                if path.exists():
+                    os.chmod(path, 0o644)
+        logger.debug("Stored the GATT database of {} into {}".format(addr, LE_GATT_CACHE))
+    except (OSError, sqlite3.Error) as e:
+        # E.g. the package is installed in a read-only location.
+        logger.warning("Failed to store the GATT database, {}: {}".format(
+            e.__class__.__name__, e))
+
+
+__all__ = ['GattDbCache', 'GattDbRecord', 'load_gatt_db', 'store_gatt_db', 'services_fingerprint',
+           'find_db_hash_charact', 'check_trusted', 'DATABASE_HASH_UUID']
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
-import io
 import pickle
+from bisect import bisect_right
 import subprocess
 from subprocess import STDOUT
 from uuid import UUID
@@ -9,62 +9,26 @@ from uuid import UUID
 from xpycommon.ui import green, blue, yellow, red, INDENT
 from xpycommon.log import Logger
 
-import pkg_resources
 from halo import Halo
 from bthci import ADDR_TYPE_PUBLIC
 from btgatt import Service, CharactValueDeclar, ServiceUuids, GattAttrTypes, bt_base_uuid, \
     GattClient, ReadCharactValueError, ReadCharactDescriptorError, CharactProperties
 
 from .. import BlueScanner, ScanResult
+from ..registry import gatt_services as services_spec, \
+    gatt_characteristics as characteristics_spec, gatt_descriptors as descriptors_spec
 from .ui import LOG_LEVEL
 from .gatt_scan_bt_agent import GattScanBtAgent
+from .gatt_batch import BatchReader, uuid16
+from .gatt_cache import GattDbRecord, load_gatt_db, store_gatt_db, services_fingerprint, \
+    find_db_hash_charact
 
 
 logger = Logger(__name__, LOG_LEVEL)
 
-service_uuid_file = pkg_resources.resource_stream(__name__, "../res/gatt-service-uuid.txt")
-service_uuid_file = io.TextIOWrapper(service_uuid_file)
-
-char_uuid_file = pkg_resources.resource_stream(__name__, '../res/gatt-characteristic-uuid.txt')
-char_uuid_file = io.TextIOWrapper(char_uuid_file)
-
-descriptor_uuid_file = pkg_resources.resource_stream(__name__, '../res/gatt-descriptor-uuid.txt')
-descriptor_uuid_file = io.TextIOWrapper(descriptor_uuid_file)
-
-services_spec = {}
-characteristics_spec = {}
-descriptors_spec = {}
-
 BT_BASE_UUID = '00000000-0000-1000-8000-00805F9B34FB'
 BT_BASE_UUID_SUFFIX = "-0000-1000-8000-00805F9B34FB"
 
-for line in service_uuid_file:
-    items = line.strip().split('\t')
-    uuid = items.pop(2)
-    services_spec[uuid] = {
-        'Name': items[0],
-        'Uniform Type Identifier': items[1],
-        'Specification': items[2]
-    }
-
-for line in char_uuid_file:
-    items = line.strip().split('\t')
-    uuid = items.pop(2)
-    characteristics_spec[uuid] = {
-        'Name': items[0],
-        'Uniform Type Identifier': items[1],
-        'Specification': items[2]
-    }
-
-for line in descriptor_uuid_file:
-    items = line.strip().split('\t')
-    uuid = items.pop(2)
-    descriptors_spec[uuid] = {
-        'Name': items[0],
-        'Uniform Type Identifier': items[1],
-        'Specification': items[2]
-    }
-    
 
 def full_uuid_str_to_16_int(uuid: str):
     """return 16-bit int or original uuid """
@@ -135,6 +99,60 @@ def attr_permissions2str(permissions: dict):
     return permi_str
 
 
+def descriptor_ranges(services: list[Service]) -> list[tuple[int, int, object]]:
+    """The handle ranges the descriptors of each characteristic may be in,
+    [(start handle, end handle, characteristic)] in the order of handles.
+    From after the characteristic value to before the next characteristic
+    declaration, or to the end of the service."""
+    ranges = []
+    for service in services:
+        characts = service.get_characts()
+        for idx, charact in enumerate(characts):
+            start_handle = charact.declar.value.handle + 1
+            end_handle = characts[idx+1].declar.handle - 1 if idx + 1 < len(characts) \
+                else service.end_handle
+            if end_handle >= start_handle:
+                ranges.append((start_handle, end_handle, charact))
+    ranges.sort(key=lambda r: r[0])
+    return ranges
+
+
+def descriptor_queries(services: list[Service], ranges: list[tuple[int, int, object]]) -> list[tuple[int, int]]:
+    """The handle ranges to discover the descriptors in, [(start handle, end
+    handle)]. Adjacent descriptor ranges are merged into one as long as the
+    attributes between them are all of 16-bit types, i.e. declarations and
+    values of 16-bit UUIDs. A Find Information Response carries a single
+    format, so a 128-bit UUID in between would take responses of its own."""
+    uuid128_value_handles = sorted(
+        charact.declar.value.handle for service in services for charact in service.get_characts()
+        if uuid16(charact.declar.value.uuid) is None)
+
+    queries = []
+    for start_handle, end_handle, _ in ranges:
+        if len(queries) != 0:
+            prev_start_handle, prev_end_handle = queries[-1]
+            idx = bisect_right(uuid128_value_handles, prev_end_handle)
+            if idx == len(uuid128_value_handles) or uuid128_value_handles[idx] >= start_handle:
+                queries[-1] = (prev_start_handle, end_handle)
+                continue
+        queries.append((start_handle, end_handle))
+    return queries
+
+
+def assign_descriptors(ranges: list[tuple[int, int, object]], descriptors: list) -> int:
+    """Add each descriptor to the characteristic whose range it is in, the
+    other attributes found (e.g. declarations) are ignored. Return the number
+    of descriptors assigned."""
+    starts = [r[0] for r in ranges]
+    count = 0
+    for descriptor in descriptors:
+        idx = bisect_right(starts, descriptor.handle) - 1
+        if idx >= 0 and descriptor.handle <= ranges[idx][1]:
+            ranges[idx][2].add_descriptor_declar(descriptor)
+            count += 1
+    return count
+
+
 class GattScanResult(ScanResult):
     """A series of service definitions constitute the main part of this result."""
     def __init__(self, addr: str = None, addr_type: str = None):
@@ -288,7 +306,11 @@ class GattScanner(BlueScanner):
         self.bt_agent = GattScanBtAgent(io_cap)
         self.bt_agent.register()
 
-    def scan(self, addr: str, addr_type: int = ADDR_TYPE_PUBLIC) -> GattScanResult:
+    def scan(self, addr: str, addr_type: int = ADDR_TYPE_PUBLIC, use_cache: bool = True) -> GattScanResult:
+        """
+        use_cache - Whether to use the cached GATT database of addr if it is
+                    unchanged. Either way the values are read.
+        """
         logger.debug("Entered scan()")
 
         try:
@@ -307,186 +329,68 @@ class GattScanner(BlueScanner):
                 self.spinner.fail()
                 raise RuntimeError("Failed to connect remote device {}".format(addr))
             
-            try:
-                self.spinner.text = "Discovering all primary services"
-                services = self.gatt_client.discover_all_primary_services()
-            except TimeoutError:
+            cached, cached_services = None, None
+            if use_cache:
+                loaded = load_gatt_db(self.result.addr)
+                if loaded is not None:
+                    cached, cached_services = loaded
+            services = None
+            if cached is not None and cached.db_hash is not None:
+                services = self.check_db_hash(cached, cached_services)
+
+            discovered = services is None
+            if discovered:
+                services = self.discover_primary_services()
+                logger.debug("number of services: {}".format(len(services)))
+                for service in services:
+                    logger.debug("Service\n" +
+                                 "start_handle: 0x{:04x}\n".format(service.start_handle) + 
+                                 "end_handle:   0x{:04x}\n".format(service.end_handle) +
+                                 "UUID:         {}".format(service.uuid))
+
+                if cached is not None and cached.db_hash is None and \
+                        services_fingerprint(services) == cached.fingerprint:
+                    # The same primary services, the rest is assumed unchanged.
+                    logger.info("Primary services unchanged, using the cached GATT database\n"
+                                "    Without a Database Hash this is only a guess, use --no-cache "
+                                "if the characteristics or descriptors may have changed")
+                    services = cached_services
+                    discovered = False
+                else:
+                    self.discover_characts(services)
+                    self.discover_descriptors(services)
+
+                # 这里如果不重连，wireshark 会显示 server 返回的
+                # 第一个 ATT_READ_RSP PDU 为 malformed packet。
+                # 但是本身并不是 malformed packet，不知道为什么。
                 self.spinner.text = "Reconnecting"
                 self.gatt_client.reconnect()
-                
-                try:
-                    self.spinner.text = "Discovering all primary services"
-                    services = self.gatt_client.discover_all_primary_services()
-                except TimeoutError:
-                    raise RuntimeError("Can't discover primary service, the remote device may be not connectable")
-            
-            logger.debug("number of services: {}".format(len(services)))
+
             for service in services:
                 self.result.add_service(service)
-                logger.debug("Service\n" +
-                             "start_handle: 0x{:04x}\n".format(service.start_handle) + 
-                             "end_handle:   0x{:04x}\n".format(service.end_handle) +
-                             "UUID:         {}".format(service.uuid))
-        
-            self.spinner.text = "Discovering all characteristics of each service"
-            
-            for service in services:
-                try:
-                    self.spinner.text = "Discovering all characteristics of service 0x{:04x}".format(service.start_handle)
-                    characts = self.gatt_client.discover_all_characts_of_a_service(service)
-                    logger.debug("characts: {}".format(characts))
-                
-                    for charact in characts:
-                        logger.debug("Found characteristic declaration\n"
-                                     "    Handle: 0x{:04x}\n"
-                                     "    Type:   {}\n"
-                                     "    Value:\n"
-                                     "        Properties: 0x{:02X} - {}\n"
-                                     "        Handle:     0x{:04x}\n"
-                                     "        UUID:       {}".format(
-                                         charact.declar.handle, charact.declar.type, 
-                                         charact.declar.value.properties, charact.declar.get_property_names(), 
-                                         charact.declar.value.handle, charact.declar.value.uuid))
-                        service.add_charact(charact)
-                except TimeoutError as e:
-                    # When discovering all characteristics fo a service encounters a timeout,
-                    # reconnect and try once again
-                    self.spinner.text = "Reconnecting"
-                    self.gatt_client.reconnect()
-                    
-                    try:
-                        characts = self.gatt_client.discover_all_characts_of_a_service(service)
-                        for charact in characts:
-                            service.add_charact(charact)
-                    except TimeoutError as e:     
-                        logger.error("scan() \n" +
-                                     "{}\n".format(e.__class__.__name__) + 
-                                    "Discover all characteristics of a service (start 0x{:04x} - end 0x{:04x}".format(
-                                        service.start_handle, service.end_handle))
-            
-            # 这里如果不重连，wireshark 会显示 server 返回的
-            # 第一个 ATT_READ_RSP PDU 为 malformed packet。
-            # 但是本身并不是 malformed packet，不知道为什么。
-            self.spinner.text = "Reconnecting"
-            self.gatt_client.reconnect()
 
-            self.spinner.text = "Reading value of each characteristic"
-            
-            for service in services:
-                for charact in service.get_characts():
-                    if CharactProperties.READ.name in charact.declar.get_property_names():
-                        try:
-                            self.spinner.text = "Reading value of a characteristic, value handle = 0x{:04x}".format(charact.declar.value.handle)
-                            value = self.gatt_client.read_charact_value(charact)
-                            charact.set_value_declar(CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, value))
-                            # logger.info("Characteristics Value")
-                            # print("Handle: 0x{:04x}".format(charact.value_declar.handle))
-                            # print("Type:   {}".format(charact.value_declar.type))
-                            # print("Value:  {}".format(charact.value_declar.value))
-                        except TimeoutError:
-                            # When reading the characteristic value encounters a timeout,
-                            # reconnect and try to read once again
-                            self.spinner.text = "Reconnecting"
-                            print("reconnect")
-                            self.gatt_client.reconnect()
-                            
-                            try:
-                                value = self.gatt_client.read_charact_value(charact)
-                                charact.set_value_declar(CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, value))
-                            except TimeoutError:
-                                value_declar = CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, None)
-                                value_declar.set_read_error(ReadCharactValueError("Read Timeout"))
-                                charact.set_value_declar(value_declar)
-                            except ReadCharactValueError as e:
-                                value_declar = CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, None)
-                                value_declar.set_read_error(e)
-                                charact.set_value_declar(value_declar)
-                                
-                        except ReadCharactValueError as e:
-                            value_declar = CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, None)
-                            value_declar.set_read_error(e)
-                            charact.set_value_declar(value_declar)
-            
-            self.spinner.text = "Discovering descriptors of each characteristic"
-            
-            for service in services:
-                characts = service.get_characts()
-                if len(characts) == 0:
-                    continue
-                
-                for idx in range(0, len(characts) - 1):
-                    start_handle = characts[idx].declar.value.handle + 1
-                    end_handle = characts[idx+1].declar.value.handle - 1
-                    if end_handle < start_handle:
-                        continue
-                    
-                    try:
-                        self.spinner.text = "Discovering all descriptors of characteristic 0x{:04x}".format(characts[idx].declar.handle)
-                        descriptors = self.gatt_client.discover_all_charact_descriptors(start_handle, end_handle)
-                        logger.debug("Number of discovered descriptors: {}".format(len(descriptors)))
-                        for descriptor in descriptors:
-                            characts[idx].add_descriptor_declar(descriptor)
-                    except TimeoutError:
-                        self.spinner.text = "Reconnecting"
-                        self.gatt_client.reconnect()
-                        
-                        try:
-                            descriptors = self.gatt_client.discover_all_charact_descriptors(start_handle, end_handle)
-                            for descriptor in descriptors:
-                                characts[idx].add_descriptor_declar(descriptor)
-                        except TimeoutError:
-                            pass
-                
-                # Find descriptor of the last charactertisc in current service.
-                start_handle = characts[-1].declar.value.handle + 1
-                end_handle = service.end_handle
-                if end_handle < start_handle:
-                    continue
-                
+            if discovered:
+                # Pickled before any value is read, only the values change.
                 try:
-                    self.spinner.text = "Discovering all descriptors of characteristic 0x{:04x}".format(characts[-1].declar.handle)
-                    descriptors = self.gatt_client.discover_all_charact_descriptors(start_handle, end_handle)
-                    for descriptor in descriptors:
-                        characts[-1].add_descriptor_declar(descriptor)
-                except TimeoutError:
-                    self.spinner.text = "Reconnecting"
-                    self.gatt_client.reconnect()
-                    
-                    try:
-                        self.spinner.text = "Discovering all descriptors of characteristic 0x{:04x}".format(characts[-1].declar.handle)
-                        descriptors = self.gatt_client.discover_all_charact_descriptors(start_handle, end_handle)
-                        for descriptor in descriptors:
-                            characts[-1].add_descriptor_declar(descriptor)
-                    except TimeoutError:
-                        pass
-            
-            self.spinner.text = "Reading value of each descriptor"
-            
-            for service in services:
-                for characts in service.get_characts():
-                    for descriptor in characts.get_descriptors():
-                        try:
-                            self.spinner.text = "Reading value of the descriptor 0x{:04x}".format(descriptor.handle)
-                            value = self.gatt_client.read_charact_descriptor(descriptor.handle)
-                            descriptor.set_value(value)
-                        except TimeoutError:
-                            # When reading the descriptor encounters a timeout,
-                            # reconnect and try to read once again
-                            self.spinner.text = "Reconnecting"
-                            self.gatt_client.reconnect()
-
-                            try:
-                                value = self.gatt_client.read_charact_descriptor(descriptor.handle)
-                                descriptor.set_value(value)
-                            except TimeoutError:
-                                descriptor.set_read_error(ReadCharactDescriptorError("Read Timeout"))
-                                descriptor.set_value(None)
-                            except ReadCharactDescriptorError as e:
-                                descriptor.set_read_error(e)
-                                descriptor.set_value(None)
-                        except ReadCharactDescriptorError as e:
-                            descriptor.set_read_error(e)
-                            descriptor.set_value(None)
+                    services_blob = pickle.dumps(services)
+                except Exception as e:
+                    logger.warning("Failed to pickle the GATT database, {}: {}".format(
+                        e.__class__.__name__, e))
+                    services_blob = None
+
+            # Readable values are read with ATT Read Multiple (Variable
+            # Length) if supported, the rest one by one.
+            batch_reader = BatchReader(self.gatt_client, self.gatt_client.reconnect)
+            self.read_charact_values(services, batch_reader)
+            self.read_descriptor_values(services, batch_reader)
+
+            if discovered and services_blob is not None:
+                db_hash_charact = find_db_hash_charact(services)
+                db_hash = None
+                if db_hash_charact is not None and db_hash_charact.value_declar is not None and \
+                        db_hash_charact.value_declar.get_read_error() is None:
+                    db_hash = bytes(db_hash_charact.value_declar.value)
+                store_gatt_db(self.result.addr, db_hash, services_fingerprint(services), services_blob)
 
             # secondary_service_groups = req_groups(addr, addr_type, GattAttrTypes.SECONDARY_SERVICE)
             # include_groups = req_groups(addr, addr_type, GattAttrTypes.INCLUDE)
@@ -523,3 +427,190 @@ class GattScanner(BlueScanner):
                 stderr=STDOUT, timeout=60, shell=True)
         
         return self.result
+
+    def check_db_hash(self, cached: GattDbRecord, services: list[Service]) -> list[Service] | None:
+        """Read the Database Hash of the device, return the cached services if
+        it is unchanged, None otherwise."""
+        db_hash_charact = find_db_hash_charact(services)
+        if db_hash_charact is None:
+            return None
+
+        try:
+            self.spinner.text = "Reading Database Hash"
+            db_hash = self.gatt_client.read_charact_value(db_hash_charact)
+        except (TimeoutError, ReadCharactValueError) as e:
+            logger.debug("Failed to read Database Hash, {}: {}".format(e.__class__.__name__, e))
+            return None
+
+        if bytes(db_hash) != cached.db_hash:
+            logger.info("Database Hash changed, rediscovering the GATT database")
+            return None
+
+        logger.info("Database Hash unchanged, using the cached GATT database")
+        # Not to be read again with the other values
+        db_hash_charact.set_value_declar(CharactValueDeclar(
+            db_hash_charact.declar.value.handle, db_hash_charact.declar.value.uuid, db_hash))
+        return services
+
+    def discover_primary_services(self) -> list[Service]:
+        try:
+            self.spinner.text = "Discovering all primary services"
+            return self.gatt_client.discover_all_primary_services()
+        except TimeoutError:
+            self.spinner.text = "Reconnecting"
+            self.gatt_client.reconnect()
+
+            try:
+                self.spinner.text = "Discovering all primary services"
+                return self.gatt_client.discover_all_primary_services()
+            except TimeoutError:
+                raise RuntimeError("Can't discover primary service, the remote device may be not connectable")
+
+    def discover_characts(self, services: list[Service]):
+        self.spinner.text = "Discovering all characteristics of each service"
+
+        for service in services:
+            try:
+                self.spinner.text = "Discovering all characteristics of service 0x{:04x}".format(service.start_handle)
+                characts = self.gatt_client.discover_all_characts_of_a_service(service)
+                logger.debug("characts: {}".format(characts))
+
+                for charact in characts:
+                    logger.debug("Found characteristic declaration\n"
+                                 "    Handle: 0x{:04x}\n"
+                                 "    Type:   {}\n"
+                                 "    Value:\n"
+                                 "        Properties: 0x{:02X} - {}\n"
+                                 "        Handle:     0x{:04x}\n"
+                                 "        UUID:       {}".format(
+                                     charact.declar.handle, charact.declar.type, 
+                                     charact.declar.value.properties, charact.declar.get_property_names(), 
+                                     charact.declar.value.handle, charact.declar.value.uuid))
+                    service.add_charact(charact)
+            except TimeoutError as e:
+                # When discovering all characteristics fo a service encounters a timeout,
+                # reconnect and try once again
+                self.spinner.text = "Reconnecting"
+                self.gatt_client.reconnect()
+
+                try:
+                    characts = self.gatt_client.discover_all_characts_of_a_service(service)
+                    for charact in characts:
+                        service.add_charact(charact)
+                except TimeoutError as e:     
+                    logger.error("scan() \n" +
+                                 "{}\n".format(e.__class__.__name__) + 
+                                "Discover all characteristics of a service (start 0x{:04x} - end 0x{:04x}".format(
+                                    service.start_handle, service.end_handle))
+
+    def discover_descriptors(self, services: list[Service]):
+        self.spinner.text = "Discovering descriptors of each characteristic"
+
+        # Find Information only over the handles descriptors may be in, merged
+        # where nothing of a 128-bit UUID is in between. The descriptors found
+        # are assigned to the characteristics by handle.
+        ranges = descriptor_ranges(services)
+        count = 0
+        for start_handle, end_handle in descriptor_queries(services, ranges):
+            try:
+                self.spinner.text = "Discovering descriptors, 0x{:04x} - 0x{:04x}".format(
+                    start_handle, end_handle)
+                descriptors = self.gatt_client.discover_all_charact_descriptors(start_handle, end_handle)
+            except TimeoutError:
+                # When discovering descriptors encounters a timeout, reconnect
+                # and try once again
+                self.spinner.text = "Reconnecting"
+                self.gatt_client.reconnect()
+
+                try:
+                    descriptors = self.gatt_client.discover_all_charact_descriptors(start_handle, end_handle)
+                except TimeoutError:
+                    logger.debug("Timed out discovering descriptors, 0x{:04x} - 0x{:04x}".format(
+                        start_handle, end_handle))
+                    continue
+            count += assign_descriptors(ranges, descriptors)
+        logger.debug("Number of discovered descriptors: {}".format(count))
+
+    def read_charact_values(self, services: list[Service], batch_reader: BatchReader):
+        self.spinner.text = "Reading value of each characteristic"
+
+        # A characteristic with its value already read is skipped, e.g. the
+        # Database Hash checked against the cache.
+        readable_characts = [charact for service in services for charact in service.get_characts()
+                             if CharactProperties.READ.name in charact.declar.get_property_names() and
+                             charact.value_declar is None]
+        values = batch_reader.read([(charact.declar.value.handle, charact.declar.value.uuid)
+                                    for charact in readable_characts])
+
+        for charact in readable_characts:
+            if charact.declar.value.handle in values:
+                charact.set_value_declar(CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, 
+                                                            values[charact.declar.value.handle]))
+                continue
+
+            try:
+                self.spinner.text = "Reading value of a characteristic, value handle = 0x{:04x}".format(charact.declar.value.handle)
+                value = self.gatt_client.read_charact_value(charact)
+                charact.set_value_declar(CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, value))
+                # logger.info("Characteristics Value")
+                # print("Handle: 0x{:04x}".format(charact.value_declar.handle))
+                # print("Type:   {}".format(charact.value_declar.type))
+                # print("Value:  {}".format(charact.value_declar.value))
+            except TimeoutError:
+                # When reading the characteristic value encounters a timeout,
+                # reconnect and try to read once again
+                self.spinner.text = "Reconnecting"
+                print("reconnect")
+                self.gatt_client.reconnect()
+
+                try:
+                    value = self.gatt_client.read_charact_value(charact)
+                    charact.set_value_declar(CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, value))
+                except TimeoutError:
+                    value_declar = CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, None)
+                    value_declar.set_read_error(ReadCharactValueError("Read Timeout"))
+                    charact.set_value_declar(value_declar)
+                except ReadCharactValueError as e:
+                    value_declar = CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, None)
+                    value_declar.set_read_error(e)
+                    charact.set_value_declar(value_declar)
+
+            except ReadCharactValueError as e:
+                value_declar = CharactValueDeclar(charact.declar.value.handle, charact.declar.value.uuid, None)
+                value_declar.set_read_error(e)
+                charact.set_value_declar(value_declar)
+
+    def read_descriptor_values(self, services: list[Service], batch_reader: BatchReader):
+        self.spinner.text = "Reading value of each descriptor"
+
+        descriptors = [descriptor for service in services for charact in service.get_characts() 
+                       for descriptor in charact.get_descriptors()]
+        values = batch_reader.read([(descriptor.handle, descriptor.type) for descriptor in descriptors])
+
+        for descriptor in descriptors:
+            if descriptor.handle in values:
+                descriptor.set_value(values[descriptor.handle])
+                continue
+
+            try:
+                self.spinner.text = "Reading value of the descriptor 0x{:04x}".format(descriptor.handle)
+                value = self.gatt_client.read_charact_descriptor(descriptor.handle)
+                descriptor.set_value(value)
+            except TimeoutError:
+                # When reading the descriptor encounters a timeout,
+                # reconnect and try to read once again
+                self.spinner.text = "Reconnecting"
+                self.gatt_client.reconnect()
+
+                try:
+                    value = self.gatt_client.read_charact_descriptor(descriptor.handle)
+                    descriptor.set_value(value)
+                except TimeoutError:
+                    descriptor.set_read_error(ReadCharactDescriptorError("Read Timeout"))
+                    descriptor.set_value(None)
+                except ReadCharactDescriptorError as e:
+                    descriptor.set_read_error(e)
+                    descriptor.set_value(None)
+            except ReadCharactDescriptorError as e:
+                descriptor.set_read_error(e)
+                descriptor.set_value(None)
@@ -0,0 +1,637 @@
+#!/usr/bin/env python
+
+"""LE scanning directly on the HCI socket
+
+HciScanner is a drop-in replacement of bluepy.btle.Scanner for LeScanner. It
+enables LE scanning with HCI commands and decodes HCI_LE_Advertising_Report and
+HCI_LE_Extended_Advertising_Report events read from a raw HCI socket, instead of
+spawning bluepy-helper and parsing its text output.
+"""
+
+import time
+import socket
+import struct
+
+from xpycommon.log import Logger
+
+from ..gap_data import iter_ad_structs
+from . import LOG_LEVEL
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+# Not every Python is built with the Bluetooth constants, they are part of the
+# Linux ABI anyway.
+AF_BLUETOOTH = getattr(socket, 'AF_BLUETOOTH', 31)
+BTPROTO_HCI  = getattr(socket, 'BTPROTO_HCI', 1)
+SOL_HCI      = getattr(socket, 'SOL_HCI', 0)
+HCI_FILTER   = getattr(socket, 'HCI_FILTER', 2)
+
+HCI_COMMAND_PKT = 0x01
+HCI_EVENT_PKT   = 0x04
+
+# An HCI event packet: type (1), Event_Code (1), Parameter_Total_Length (1)
+# and up to 255 bytes of parameters.
+HCI_MAX_EVENT_SIZE = 258
+
+EVT_CMD_COMPLETE  = 0x0E
+EVT_CMD_STATUS    = 0x0F
+EVT_LE_META_EVENT = 0x3E
+
+EVT_LE_ADVERTISING_REPORT          = 0x02
+EVT_LE_EXTENDED_ADVERTISING_REPORT = 0x0D
+
+OGF_LE_CTL = 0x08
+OCF_LE_READ_LOCAL_SUPPORTED_FEATURES = 0x0003
+OCF_LE_SET_SCAN_PARAMETERS           = 0x000B
+OCF_LE_SET_SCAN_ENABLE               = 0x000C
+OCF_LE_ADD_DEVICE_TO_FILTER_ACCEPT_LIST      = 0x0011
+OCF_LE_REMOVE_DEVICE_FROM_FILTER_ACCEPT_LIST = 0x0012
+OCF_LE_SET_EXT_SCAN_PARAMETERS       = 0x0041
+OCF_LE_SET_EXT_SCAN_ENABLE           = 0x0042
+
+OP_LE_READ_LOCAL_SUPPORTED_FEATURES = (OGF_LE_CTL << 10) | OCF_LE_READ_LOCAL_SUPPORTED_FEATURES
+OP_LE_SET_SCAN_PARAMETERS           = (OGF_LE_CTL << 10) | OCF_LE_SET_SCAN_PARAMETERS
+OP_LE_SET_SCAN_ENABLE               = (OGF_LE_CTL << 10) | OCF_LE_SET_SCAN_ENABLE
+OP_LE_ADD_DEVICE_TO_FILTER_ACCEPT_LIST      = (OGF_LE_CTL << 10) | OCF_LE_ADD_DEVICE_TO_FILTER_ACCEPT_LIST
+OP_LE_REMOVE_DEVICE_FROM_FILTER_ACCEPT_LIST = (OGF_LE_CTL << 10) | OCF_LE_REMOVE_DEVICE_FROM_FILTER_ACCEPT_LIST
+OP_LE_SET_EXT_SCAN_PARAMETERS       = (OGF_LE_CTL << 10) | OCF_LE_SET_EXT_SCAN_PARAMETERS
+OP_LE_SET_EXT_SCAN_ENABLE           = (OGF_LE_CTL << 10) | OCF_LE_SET_EXT_SCAN_ENABLE
+
+# Bits of LE_Features
+LE_CODED_PHY_BIT          = 11
+LE_EXTENDED_ADVERTISING_BIT = 12
+
+# Scanning_PHYs of HCI_LE_Set_Extended_Scan_Parameters
+LE_SCAN_PHY_1M    = 0x01
+LE_SCAN_PHY_CODED = 0x04
+
+# HCI_LE_Advertising_Report Event_Type
+ADV_IND         = 0x00
+ADV_DIRECT_IND  = 0x01
+ADV_SCAN_IND    = 0x02
+ADV_NONCONN_IND = 0x03
+SCAN_RSP        = 0x04
+
+# HCI_LE_Extended_Advertising_Report Event_Type
+EXT_ADV_CONNECTABLE = 0x0001
+EXT_ADV_SCAN_RSP    = 0x0008
+EXT_ADV_DATA_STATUS_POS = 5
+EXT_ADV_DATA_STATUS_MSK = 0b11 << EXT_ADV_DATA_STATUS_POS
+EXT_ADV_DATA_COMPLETE   = 0b00
+EXT_ADV_DATA_INCOMPLETE = 0b01 # More data to come
+EXT_ADV_DATA_TRUNCATED  = 0b10
+
+PHYS = {
+    0x00: None,
+    0x01: 'LE 1M',
+    0x02: 'LE 2M',
+    0x03: 'LE Coded',
+}
+
+# No valid RSSI, TX power or SID
+RSSI_NOT_AVAILABLE     = 127
+TX_POWER_NOT_AVAILABLE = 127
+SID_NOT_AVAILABLE      = 0xFF
+
+# Distinct payloads remembered per device
+MAX_PAYLOADS = 8
+
+# Seconds after the last fragment of extended advertising data, when the rest
+# is no longer expected. The AuxPtr to the next fragment is at most 2.46 s away.
+FRAGMENT_TIMEOUT = 3
+# Advertising data of an advertising set is at most 1650 octets
+MAX_EXT_ADV_DATA_LEN = 1650
+# Advertising sets whose data is being reassembled at a time
+MAX_FRAGMENTED_SETS = 64
+
+# Events handled per pass of draining the socket, the deadline of process()
+# is checked between the passes
+MAX_DRAIN_EVENTS = 64
+
+LE_SCAN_PASSIVE = 0x00
+LE_SCAN_ACTIVE  = 0x01
+
+# In units of 0.625 ms, full duty cycle
+DEFAULT_SCAN_INTERVAL = 0x0010
+DEFAULT_SCAN_WINDOW   = 0x0010
+# Range of LE_Scan_Interval and LE_Scan_Window, 2.5 ms to 10.24 s
+MIN_SCAN_INTERVAL = 0x0004
+MAX_SCAN_INTERVAL = 0x4000
+
+COMMAND_DISALLOWED = 0x0C
+
+# HCI_LE_Advertising_Report, after Subevent_Code and Num_Reports:
+#     Event_Type, Address_Type, Address, Data_Length
+ADV_REPORT_HEADER = struct.Struct('<BB6sB')
+
+# HCI_LE_Extended_Advertising_Report, after Subevent_Code and Num_Reports:
+#     Event_Type, Address_Type, Address, Primary_PHY, Secondary_PHY,
+#     Advertising_SID, TX_Power, RSSI, Periodic_Advertising_Interval,
+#     Direct_Address_Type, Direct_Address, Data_Length
+EXT_ADV_REPORT_HEADER = struct.Struct('<HB6sBBBbbHB6sB')
+
+
+def str2bd_addr(bd_addr: bytes) -> str:
+    """Little-endian BD_ADDR to lower case 'xx:xx:xx:xx:xx:xx' as bluepy does"""
+    return ':'.join(['{:02x}'.format(b) for b in bd_addr[::-1]])
+
+
+def bd_addr2bytes(addr: str) -> bytes:
+    """'XX:XX:XX:XX:XX:XX' to little-endian BD_ADDR"""
+    return bytes.fromhex(addr.replace(':', ''))[::-1]
+
+
+class HciScanEntry:
+    """The part of bluepy.btle.ScanEntry used by bluing
+
+    Entries from extended advertising also carry primary_phy, secondary_phy,
+    sid and tx_power.
+    """
+    def __init__(self, addr: str, iface: int):
+        self.addr = addr
+        self.iface = iface
+        self.addrType = None
+        # None until a report carries a valid RSSI, RSSI_NOT_AVAILABLE is never
+        # stored.
+        self.rssi = None
+        self.connectable = False
+        self.scanData = {}
+        self.updateCount = 0
+        # Hash of each distinct payload received -> times it was received. An
+        # advertisement and its scan response are different payloads.
+        self.payload_counts = {}
+        # Hashes of the payloads whose AD structures are all in scanData
+        self.current_payloads = set()
+        self.primary_phy = None
+        self.secondary_phy = None
+        self.sid = None
+        self.tx_power = None
+
+    def _update(self, connectable: bool | None, addr_type: int, data: bytes, rssi: int) -> bool:
+        """Return whether the advertisement carries new data.
+
+        connectable - None for a scan response, which does not tell.
+        """
+        # Address_Type 0x02 and 0x03 are the identity addresses resolved by
+        # the controller.
+        self.addrType = 'random' if addr_type & 0x01 else 'public'
+        if rssi != RSSI_NOT_AVAILABLE:
+            self.rssi = rssi
+        if connectable is not None:
+            self.connectable = connectable
+
+        self.updateCount += 1
+
+        # The same payload is usually received again and again, it is only
+        # counted as long as its AD structures are still in scanData.
+        payload_hash = hash(data)
+        try:
+            self.payload_counts[payload_hash] += 1
+        except KeyError:
+            if len(self.payload_counts) >= MAX_PAYLOADS:
+                # Forget the oldest, e.g. a rotating payload
+                oldest = next(iter(self.payload_counts))
+                del self.payload_counts[oldest]
+                self.current_payloads.discard(oldest)
+            self.payload_counts[payload_hash] = 1
+        else:
+            if payload_hash in self.current_payloads:
+                return False
+
+        is_new_data = False
+        for ad_type, value in iter_ad_structs(data):
+            if self.scanData.get(ad_type) != value:
+                self.scanData[ad_type] = bytes(value)
+                is_new_data = True
+
+        if is_new_data:
+            # Other payloads may carry the values just replaced.
+            self.current_payloads.clear()
+        self.current_payloads.add(payload_hash)
+        return is_new_data
+
+
+class HciScanner:
+    """A drop-in replacement of bluepy.btle.Scanner built on the HCI socket"""
+    def __init__(self, iface: int = 0, extended: bool = None):
+        """
+        iface    - HCI device ID, e.g. 0 for hci0
+        extended - Whether to use the extended scanning commands, which are
+                   needed to receive extended advertising. None means to use
+                   them if the controller supports LE Extended Advertising.
+        """
+        self.iface = iface
+        self.extended = extended
+        self.delegate = None
+        self.scanned = {}
+        self.sock = None
+        self.scan_interval = DEFAULT_SCAN_INTERVAL
+        self.scan_window = DEFAULT_SCAN_WINDOW
+
+        # [(BD_ADDR, Address_Type)], if set, only these devices are reported
+        # by the controller.
+        self.accept_list = None
+        self.accept_list_added = []
+        # LeScanFilter, reports not accepted by it are dropped before anything
+        # else. Its addresses are put in the Filter Accept List if accept_list
+        # is not set.
+        self.scan_filter = None
+        # Whether the controller drops the duplicate advertisements. The RSSI
+        # and the data changes of a device are lost then.
+        self.filter_dup = False
+
+        # Set by start()
+        self.passive = False
+        self.features = 0
+        self.filter_policy = 0x00
+
+        self.buf = bytearray(HCI_MAX_EVENT_SIZE)
+        # Fragments of extended advertising data, keyed by (Address,
+        # Advertising_SID), with the time of the last one:
+        #     {key: (time, bytearray)}
+        self.fragments = {}
+
+    def withDelegate(self, delegate):
+        self.delegate = delegate
+        return self
+
+    def clear(self):
+        self.scanned = {}
+        self.fragments = {}
+
+    def getDevices(self):
+        return self.scanned.values()
+
+    def start(self, passive: bool = False):
+        try:
+            self.sock = socket.socket(AF_BLUETOOTH, socket.SOCK_RAW, BTPROTO_HCI)
+            self.sock.bind((self.iface,))
+        except (OSError, TypeError) as e:
+            # TypeError when Python is built without Bluetooth support and
+            # does not know the address format.
+            self.close()
+            raise RuntimeError("Failed to open the HCI socket of hci{}, {}: {}".format(
+                self.iface, e.__class__.__name__, e))
+
+        try:
+            # Only the events needed, so the kernel does not wake us up for
+            # ACL data and unrelated events.
+            self.sock.setsockopt(SOL_HCI, HCI_FILTER, struct.pack('<IIIH',
+                1 << HCI_EVENT_PKT,
+                (1 << EVT_CMD_COMPLETE) | (1 << EVT_CMD_STATUS),
+                1 << (EVT_LE_META_EVENT - 32),
+                0))
+
+            status, features = self.send_cmd(OP_LE_READ_LOCAL_SUPPORTED_FEATURES)
+            self.features = int.from_bytes(features, 'little') if status == 0x00 else 0
+            if self.extended is None:
+                self.extended = bool(self.features >> LE_EXTENDED_ADVERTISING_BIT & 0x01)
+            logger.debug("LE_Features: 0x{:016x}, extended scanning: {}".format(
+                self.features, self.extended))
+
+            # Scan parameters and the Filter Accept List can not be changed
+            # while scanning.
+            self.disable_scan()
+
+            if self.accept_list is None and self.scan_filter:
+                self.accept_list = self.scan_filter.accept_list()
+
+            self.filter_policy = 0x00 # Accept all
+            if self.accept_list and self.add_to_accept_list():
+                self.filter_policy = 0x01 # Only from the devices in the Filter Accept List
+
+            self.passive = passive
+            self.enable_scan()
+        except BaseException:
+            # E.g. a command timed out, the socket is not left open. The
+            # devices added to the Filter Accept List are only removed if the
+            # controller still responds.
+            if self.sock is not None:
+                try:
+                    self.remove_from_accept_list()
+                except OSError: # Including TimeoutError
+                    pass
+                finally:
+                    self.close()
+            raise
+
+    def set_duty_cycle(self, scan_interval: int, scan_window: int):
+        """Change the scan interval and window while scanning, in units of
+        0.625 ms. The reports received so far are kept."""
+        if not MIN_SCAN_INTERVAL <= scan_window <= scan_interval <= MAX_SCAN_INTERVAL:
+            raise ValueError("Invalid scan interval/window: 0x{:04x}/0x{:04x}".format(
+                scan_interval, scan_window))
+
+        self.scan_interval = scan_interval
+        self.scan_window = scan_window
+        if self.sock is not None:
+            self.disable_scan()
+            self.enable_scan()
+
+    def enable_scan(self):
+        scan_type = LE_SCAN_PASSIVE if self.passive else LE_SCAN_ACTIVE
+
+        if self.extended:
+            phys = LE_SCAN_PHY_1M
+            phy_params = struct.pack('<BHH', scan_type, self.scan_interval, self.scan_window)
+            if self.features >> LE_CODED_PHY_BIT & 0x01:
+                # Long range devices only advertise on the LE Coded PHY.
+                phys |= LE_SCAN_PHY_CODED
+                phy_params *= 2
+
+            status, _ = self.send_cmd(OP_LE_SET_EXT_SCAN_PARAMETERS, struct.pack('<BBB',
+                0x00, # Own_Address_Type: public
+                self.filter_policy, phys) + phy_params)
+            self.check_status('HCI_LE_Set_Extended_Scan_Parameters', status)
+
+            # Filter_Duplicates is disabled by default to get the RSSI of
+            # every advertisement. Duration and Period 0 to scan until disabled.
+            status, _ = self.send_cmd(OP_LE_SET_EXT_SCAN_ENABLE,
+                                      struct.pack('<BBHH', 0x01, self.filter_dup, 0, 0))
+            self.check_status('HCI_LE_Set_Extended_Scan_Enable', status)
+        else:
+            status, _ = self.send_cmd(OP_LE_SET_SCAN_PARAMETERS, struct.pack('<BHHBB',
+                scan_type, self.scan_interval, self.scan_window,
+                0x00, # Own_Address_Type: public
+                self.filter_policy))
+            self.check_status('HCI_LE_Set_Scan_Parameters', status)
+
+            status, _ = self.send_cmd(OP_LE_SET_SCAN_ENABLE,
+                                      struct.pack('<BB', 0x01, self.filter_dup))
+            self.check_status('HCI_LE_Set_Scan_Enable', status)
+
+    def stop(self):
+        if self.sock is None:
+            return
+
+        try:
+            self.disable_scan()
+            self.remove_from_accept_list()
+        finally:
+            self.close()
+
+    def disable_scan(self):
+        if self.extended:
+            self.send_cmd(OP_LE_SET_EXT_SCAN_ENABLE, struct.pack('<BBHH', 0x00, 0x00, 0, 0))
+        else:
+            self.send_cmd(OP_LE_SET_SCAN_ENABLE, struct.pack('<BB', 0x00, 0x00))
+
+    def add_to_accept_list(self) -> bool:
+        """Add self.accept_list to the Filter Accept List of the controller.
+        Return False if the controller does not take all of them."""
+        for addr, addr_type in self.accept_list:
+            status, _ = self.send_cmd(OP_LE_ADD_DEVICE_TO_FILTER_ACCEPT_LIST,
+                                      struct.pack('<B6s', addr_type, bd_addr2bytes(addr)))
+            if status != 0x00:
+                logger.debug("HCI_LE_Add_Device_To_Filter_Accept_List returned status "
+                             "0x{:02x}, scan without the Filter Accept List".format(status))
+                self.remove_from_accept_list()
+                return False
+            self.accept_list_added.append((addr, addr_type))
+        return True
+
+    def remove_from_accept_list(self):
+        """Only the devices added by us are removed, the others may be there
+        for the kernel."""
+        while self.accept_list_added:
+            addr, addr_type = self.accept_list_added.pop()
+            self.send_cmd(OP_LE_REMOVE_DEVICE_FROM_FILTER_ACCEPT_LIST,
+                          struct.pack('<B6s', addr_type, bd_addr2bytes(addr)))
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def scan(self, timeout: float = 10, passive: bool = False):
+        self.clear()
+        self.start(passive=passive)
+        try:
+            self.process(timeout)
+        finally:
+            self.stop()
+        return self.getDevices()
+
+    def process(self, timeout: float = 10):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            self.sock.settimeout(remaining)
+            try:
+                self.handle_event(self.sock.recv_into(self.buf))
+            except socket.timeout:
+                break
+            except InterruptedError:
+                continue
+
+            # In a crowded environment the events queue up in the socket,
+            # drain them without waiting for the socket again. They may keep
+            # coming as fast as handled, so a pass is capped and the deadline
+            # checked in between.
+            self.sock.setblocking(False)
+            for _ in range(MAX_DRAIN_EVENTS):
+                try:
+                    self.handle_event(self.sock.recv_into(self.buf))
+                except (BlockingIOError, InterruptedError):
+                    break
+
+    def handle_event(self, size: int) -> memoryview | None:
+        """Handle an HCI event packet of size bytes in self.buf. Return the
+        parameters of it if it is not an advertising report."""
+        if size < 3 or self.buf[0] != HCI_EVENT_PKT:
+            return None
+
+        pkt = memoryview(self.buf)[:size]
+        if pkt[1] == EVT_LE_META_EVENT and size >= 5:
+            if pkt[3] == EVT_LE_ADVERTISING_REPORT:
+                self.handle_adv_report(pkt[4:])
+                return None
+            elif pkt[3] == EVT_LE_EXTENDED_ADVERTISING_REPORT:
+                self.handle_ext_adv_report(pkt[4:])
+                return None
+
+        return pkt[1:]
+
+    def handle_adv_report(self, params: memoryview):
+        """
+        params - Parameters of HCI_LE_Advertising_Report after Subevent_Code
+        """
+        num_reports = params[0]
+        offset = 1
+        for _ in range(num_reports):
+            try:
+                event_type, addr_type, bd_addr, data_len = \
+                    ADV_REPORT_HEADER.unpack_from(params, offset)
+                offset += ADV_REPORT_HEADER.size
+                data = bytes(params[offset:offset+data_len])
+                rssi = struct.unpack_from('<b', params, offset + data_len)[0]
+                offset += data_len + 1
+            except struct.error:
+                logger.debug("Truncated HCI_LE_Advertising_Report: {}".format(bytes(params)))
+                return
+
+            if event_type == SCAN_RSP:
+                connectable = None
+            else:
+                connectable = event_type in (ADV_IND, ADV_DIRECT_IND)
+
+            self.on_report(connectable, addr_type, bd_addr, data, rssi)
+
+    def handle_ext_adv_report(self, params: memoryview):
+        """
+        params - Parameters of HCI_LE_Extended_Advertising_Report after
+                 Subevent_Code
+
+        An event may carry several reports. The advertising data of a device
+        may also be fragmented over several reports, these fragments are
+        reassembled before the report is passed on.
+        """
+        num_reports = params[0]
+        offset = 1
+        header_size = EXT_ADV_REPORT_HEADER.size
+        for _ in range(num_reports):
+            try:
+                event_type, addr_type, bd_addr, primary_phy, secondary_phy, sid, \
+                    tx_power, rssi, _, _, _, data_len = \
+                    EXT_ADV_REPORT_HEADER.unpack_from(params, offset)
+            except struct.error:
+                logger.debug("Truncated HCI_LE_Extended_Advertising_Report: {}".format(
+                    bytes(params)))
+                return
+            offset += header_size
+            data = params[offset:offset+data_len]
+            offset += data_len
+
+            data_status = (event_type & EXT_ADV_DATA_STATUS_MSK) >> EXT_ADV_DATA_STATUS_POS
+            key = (bytes(bd_addr), sid)
+            now = time.monotonic()
+            fragments = self.pop_fragments(key, now)
+            if data_status == EXT_ADV_DATA_INCOMPLETE:
+                if fragments is None:
+                    fragments = bytearray()
+                fragments += data
+                if len(fragments) > MAX_EXT_ADV_DATA_LEN:
+                    logger.debug("Advertising data from {} too long, dropped".format(
+                        str2bd_addr(bd_addr)))
+                    continue
+                self.put_fragments(key, now, fragments)
+                continue
+
+            if fragments is not None:
+                fragments += data
+                data = bytes(fragments)
+            else:
+                data = bytes(data)
+
+            if data_status == EXT_ADV_DATA_TRUNCATED:
+                logger.debug("Truncated advertising data from {}".format(str2bd_addr(bd_addr)))
+
+            if event_type & EXT_ADV_SCAN_RSP:
+                connectable = None
+            else:
+                connectable = bool(event_type & EXT_ADV_CONNECTABLE)
+
+            self.on_report(connectable, addr_type, bd_addr, data, rssi,
+                           (primary_phy, secondary_phy, sid, tx_power))
+
+    def pop_fragments(self, key: tuple[bytes, int], now: float) -> bytearray | None:
+        """Remove and return the fragments received for key, None if there are
+        none or the last one is older than FRAGMENT_TIMEOUT."""
+        try:
+            last_time, fragments = self.fragments.pop(key)
+        except KeyError:
+            return None
+        if now - last_time > FRAGMENT_TIMEOUT:
+            logger.debug("Incomplete advertising data from {} dropped".format(
+                str2bd_addr(key[0])))
+            return None
+        return fragments
+
+    def put_fragments(self, key: tuple[bytes, int], now: float, fragments: bytearray):
+        if len(self.fragments) >= MAX_FRAGMENTED_SETS:
+            # The most recently updated ones are last.
+            self.fragments = {k: v for k, v in self.fragments.items()
+                              if now - v[0] <= FRAGMENT_TIMEOUT}
+            while len(self.fragments) >= MAX_FRAGMENTED_SETS:
+                del self.fragments[next(iter(self.fragments))]
+        self.fragments[key] = (now, fragments)
+
+    def on_report(self, connectable: bool | None, addr_type: int, bd_addr: bytes,
+                  data: bytes, rssi: int, ext: tuple = None):
+        """
+        ext - Primary_PHY, Secondary_PHY, Advertising_SID and TX_Power of an
+              extended advertising report
+        """
+        addr = str2bd_addr(bd_addr)
+        if self.scan_filter is not None and not self.scan_filter.accept(
+                addr, 'random' if addr_type & 0x01 else 'public',
+                None if rssi == RSSI_NOT_AVAILABLE else rssi):
+            return
+
+        entry = self.scanned.get(addr)
+        if entry is None:
+            entry = self.scanned[addr] = HciScanEntry(addr, self.iface)
+        is_new_data = entry._update(connectable, addr_type, data, rssi)
+
+        if ext is not None:
+            primary_phy, secondary_phy, sid, tx_power = ext
+            entry.primary_phy = PHYS.get(primary_phy)
+            entry.secondary_phy = PHYS.get(secondary_phy)
+            if sid != SID_NOT_AVAILABLE:
+                entry.sid = sid
+            if tx_power != TX_POWER_NOT_AVAILABLE:
+                entry.tx_power = tx_power
+
+        if self.delegate is not None:
+            self.delegate.handleDiscovery(entry, entry.updateCount <= 1, is_new_data)
+
+    def send_cmd(self, opcode: int, params: bytes = b'', timeout: float = 2) -> tuple[int, bytes]:
+        """Send an HCI command, return the status and the other return
+        parameters of it."""
+        self.sock.send(struct.pack('<BHB', HCI_COMMAND_PKT, opcode, len(params)) + params)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("No completion of HCI command 0x{:04x}".format(opcode))
+
+            self.sock.settimeout(remaining)
+            try:
+                # Reports received while waiting are not dropped.
+                evt = self.handle_event(self.sock.recv_into(self.buf))
+            except socket.timeout:
+                continue
+            except InterruptedError:
+                continue
+
+            if evt is None or len(evt) < 6:
+                continue
+
+            if evt[0] == EVT_CMD_COMPLETE:
+                # Num_HCI_Command_Packets, Command_Opcode, Status, ...
+                if struct.unpack_from('<H', evt, 3)[0] == opcode:
+                    return evt[5], bytes(evt[6:])
+            elif evt[0] == EVT_CMD_STATUS:
+                # Status, Num_HCI_Command_Packets, Command_Opcode
+                if struct.unpack_from('<H', evt, 4)[0] == opcode:
+                    return evt[2], b''
+
+    def check_status(self, cmd_name: str, status: int):
+        if status == 0x00:
+            return
+
+        msg = "{} returned status 0x{:02x}".format(cmd_name, status)
+        if status == COMMAND_DISALLOWED:
+            msg += ", the controller may be driven with the {} scanning " \
+                   "commands by the kernel".format('legacy' if self.extended else 'extended')
+
+        self.stop()
+        raise RuntimeError(msg)
+
+
+__all__ = ['HciScanner', 'HciScanEntry']
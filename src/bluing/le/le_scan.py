@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
 import sys
-import pickle
+import time
+import sqlite3
 
 from bluepy.btle import Scanner
 from bluepy.btle import DefaultDelegate
@@ -9,28 +10,40 @@ from halo import Halo
 from serial import Serial
 
 from xpycommon.bluetooth import IoCapabilities
-from bthci import HCI, ControllerErrorCodes, HciRuntimeError, ADDR_TYPE_PUBLIC
+from bthci import HCI, ControllerErrorCodes, HciRuntimeError, ADDR_TYPE_PUBLIC, ADDR_TYPE_RANDOM
 from btsm import SecurityManager
 from btsm.commands import OOBDataFlags, BondingFlags, AuthReq, KeyDist
 from xpycommon.log import Logger
-from xpycommon.ui import blue, green, red, INDENT
+from xpycommon.ui import blue, green, red, yellow
 
 from .. import ScanResult
 from ..common import bdaddr_to_company_name
-from ..gap_data import SERVICE_DATA_128_BIT_UUID, SERVICE_DATA_16_BIT_UUID, SERVICE_DATA_32_BIT_UUID, gap_type_names, company_names, \
-    COMPLETE_LIST_OF_16_BIT_SERVICE_CLASS_UUIDS, INCOMPLETE_LIST_OF_16_BIT_SERVICE_CLASS_UUIDS, \
-    COMPLETE_LIST_OF_32_BIT_SERVICE_CLASS_UUIDS, INCOMPLETE_LIST_OF_32_BIT_SERVICE_CLASS_UUIDS,\
-    COMPLETE_LIST_OF_128_BIT_SERVICE_CLASS_UUIDS, INCOMPLETE_LIST_OF_128_BIT_SERVICE_CLASS_UUIDS, \
-    TX_POWER_LEVEL, MANUFACTURER_SPECIFIC_DATA, FLAGS
+from ..gap_data import AdStruct, pp_ad_struct
+from ..feature_bits import LE_FEATURES, pp_feature_page
+from ..fingerprint_cache import Fingerprint, DEFAULT_MAX_AGE, TRANSPORT_LE, \
+                                load_fingerprint, store_fingerprints
 
-from . import LE_DEVS_SCAN_RESULT_CACHE, LOG_LEVEL
+from . import LOG_LEVEL
 from .serial_protocol import serial_reset
 from .serial_protocol import SerialEventHandler
+from .dev_table import LeDeviceTable
+from .hci_scan import HciScanner, MIN_SCAN_INTERVAL
+from .scan_filter import LeScanFilter
+from .ranking import rank_devices_info, dev_vendor, adv_rate
+from .addr_type_cache import LeAddrTypeCache, store_addr_types
 
 logger = Logger(__name__, LOG_LEVEL)
 
 microbit_infos = {}
 
+# Adaptive duty cycling of LeScanner.scan_adaptive()
+ADAPTIVE_SLICE    = 1   # sec
+ADAPTIVE_PLATEAU  = 3   # Slices without new devices before backing off
+MIN_DUTY_CYCLE    = 1/8
+
+# LeScanner.find_dev() checks whether the target is discovered this often, sec
+FIND_DEV_SLICE = 0.1
+
 
 # 这个字典暂时没用，以后可能用来判断收到的 advertising 类型
 HCI_LE_ADVERTISING_REPORT_EVENT_EVENT_TYPE_DESCPS = {
@@ -41,45 +54,187 @@ HCI_LE_ADVERTISING_REPORT_EVENT_EVENT_TYPE_DESCPS = {
     0x04: "Scan Response (SCAN_RSP, 0x04)"
 }
 
-class AdStruct:
-    def __init__(self, type: int, value: bytes) -> None:
-        self.length = None
-        self.type = type
-        self.value = value
-
-
-class LEDelegate(DefaultDelegate):
-    def __init__(self):
-        DefaultDelegate.__init__(self)
-    
-    def handleDiscovery(self, scanEntry, isNewDev, isNewData):
-        # a callback function
-        if isNewDev:
-            #print("[LE scan] discovered new device")
-            pass
-        elif isNewData:
-            #print("Received new data from " + scanEntry.addr)
-            pass
-
-
 class LeDeviceInfo:
+    __slots__ = ('addr_int', 'addr_type', 'connectable', 'rssi', 'ad_structs',
+                 'primary_phy', 'secondary_phy', 'sid', 'tx_power', 'heard_by',
+                 'discovery_latency', 'last_seen', 'adv_count')
+
     def __init__(self, addr: str, addr_type: str, connectable : bool, rssi : int) -> None:
         """
-        addr - Upper case
+        addr - 'XX:XX:XX:XX:XX:XX', kept as an integer
         """
-        self.addr = addr.upper()
+        self.addr_int = int(addr.replace(':', ''), base=16)
         self.addr_type = addr_type
         self.connectable = connectable
         self.rssi = rssi
         self.ad_structs = []
-        
+
+        # Only known from extended advertising
+        self.primary_phy = None
+        self.secondary_phy = None
+        self.sid = None
+        self.tx_power = None
+
+        # {HCI device: RSSI}, when scanned on several HCI devices
+        self.heard_by = None
+
+        # Seconds from the start of the scan to the first and the last report
+        # of the device
+        self.discovery_latency = None
+        self.last_seen = None
+        self.adv_count = 0
+
+    @property
+    def vendor(self) -> str:
+        return dev_vendor(self.addr, self.addr_type, self.ad_structs)
+
+    @property
+    def adv_rate(self) -> float:
+        """Advertisements per second"""
+        if self.discovery_latency is None or self.last_seen is None:
+            return 0.0
+        return adv_rate(self.adv_count, self.discovery_latency, self.last_seen)
+
+    @property
+    def addr(self) -> str:
+        """Upper case"""
+        addr = "{:012X}".format(self.addr_int)
+        return ':'.join([addr[i:i+2] for i in range(0, 12, 2)])
+
     def add_ad_structs(self, ad: AdStruct):
         self.ad_structs.append(ad)
 
+    @classmethod
+    def from_scan_entry(cls, entry) -> 'LeDeviceInfo':
+        """Build from a bluepy ScanEntry or an HciScanEntry"""
+        dev_info = cls(entry.addr, entry.addrType.lower(), entry.connectable, entry.rssi)
+        # The raw value of each AD type, no need for the text bluepy makes of it.
+        for adtype, val in entry.scanData.items():
+            dev_info.add_ad_structs(AdStruct(adtype, bytes(val)))
+
+        # HciScanEntry of extended advertising
+        dev_info.primary_phy = getattr(entry, 'primary_phy', None)
+        dev_info.secondary_phy = getattr(entry, 'secondary_phy', None)
+        dev_info.sid = getattr(entry, 'sid', None)
+        dev_info.tx_power = getattr(entry, 'tx_power', None)
+        dev_info.adv_count = entry.updateCount
+        return dev_info
+
+    def to_dict(self) -> dict:
+        return {
+            'addr': self.addr,
+            'addr_type': self.addr_type,
+            'connectable': self.connectable,
+            'rssi': self.rssi,
+            'primary_phy': self.primary_phy,
+            'secondary_phy': self.secondary_phy,
+            'sid': self.sid,
+            'tx_power': self.tx_power,
+            'heard_by': self.heard_by,
+            'discovery_latency': self.discovery_latency,
+            'last_seen': self.last_seen,
+            'adv_count': self.adv_count,
+            'ad_structs': [{'type': ad.type, 'value': ad.value_text()} for ad in self.ad_structs]
+        }
+
+
+class LEDelegate(DefaultDelegate):
+    def __init__(self, sinks: list = None, dev_table: LeDeviceTable = None,
+                 scan_filter: LeScanFilter = None):
+        """
+        sinks       - LeScanSink(s) that new devices and changed advertisements  
+                      are emitted to as soon as they are discovered.
+        dev_table   - If provided, every advertising report is accounted in it.
+        scan_filter - If provided, the reports it does not accept are ignored.
+        """
+        DefaultDelegate.__init__(self)
+        self.sinks = [] if sinks is None else sinks
+        self.dev_table = dev_table
+        self.scan_filter = scan_filter
+
+        # When the scan started and {addr: when it was first/last reported},
+        # by time.monotonic()
+        self.start = time.monotonic()
+        self.first_seen = {}
+        self.last_seen = {}
+    
+    def handleDiscovery(self, scanEntry, isNewDev, isNewData):
+        # a callback function, called for each HCI_LE_Advertising_Report
+        #
+        # A repeated advertisement is only counted. The AD structures are only
+        # decoded and emitted when they change.
+        if self.scan_filter is not None and not self.scan_filter.accept(
+                scanEntry.addr, scanEntry.addrType, scanEntry.rssi):
+            return
+
+        # The dev_table keeps its own times, and evicts devices.
+        if self.dev_table is None:
+            now = time.monotonic()
+            if scanEntry.addr not in self.first_seen:
+                self.first_seen[scanEntry.addr] = now
+            self.last_seen[scanEntry.addr] = now
+
+        dev_info = None
+
+        if self.dev_table is not None:
+            record, isNewDev = self.dev_table.update(
+                scanEntry.addr.upper(), scanEntry.addrType.lower(), scanEntry.rssi)
+            if isNewDev or isNewData:
+                record.change_count += 1
+                record.dev_info = LeDeviceInfo.from_scan_entry(scanEntry)
+                # The vendor may come with the new AD structures.
+                self.dev_table.rank(record)
+            dev_info = record.dev_info
+
+        if not self.sinks or not (isNewDev or isNewData):
+            return
+
+        if dev_info is None:
+            dev_info = LeDeviceInfo.from_scan_entry(scanEntry)
+        dev_info.discovery_latency = self.discovery_latency(scanEntry.addr)
+        for sink in self.sinks:
+            sink.emit(dev_info, isNewDev)
+
+    def discovery_latency(self, addr: str) -> float | None:
+        """
+        addr - In lower case, as bluepy.btle.ScanEntry.addr
+        """
+        try:
+            return self.first_seen[addr] - self.start
+        except KeyError:
+            return None
+
+    def last_seen_after(self, addr: str) -> float | None:
+        """Seconds from the start of the scan to the last report of addr"""
+        try:
+            return self.last_seen[addr] - self.start
+        except KeyError:
+            return None
+
+
+class TargetDelegate(DefaultDelegate):
+    """Record the target device once it is discovered.
+
+    Nothing is raised from the callback, it is also called while the scanner
+    waits for its HCI commands to complete, e.g. in stop().
+    """
+    def __init__(self, addr: str):
+        DefaultDelegate.__init__(self)
+        self.addr = addr.lower()
+        self.found = None # The ScanEntry of the target
+
+    def handleDiscovery(self, scanEntry, isNewDev, isNewData):
+        if self.found is None and scanEntry.addr == self.addr:
+            self.found = scanEntry
+
 
 class LeDevicesScanResult(ScanResult):
-    def __init__(self) -> None:
+    def __init__(self, iface: str = None) -> None:
+        """
+        iface - The HCI device the devices were scanned on
+        """
         super().__init__('LE Devices')
+        self.iface = iface
         self.devices_info = []
     
     def add_device_info(self, info: LeDeviceInfo):
@@ -87,103 +242,22 @@ class LeDevicesScanResult(ScanResult):
         
     def print(self):
         for dev_info in self.devices_info:
-            print('Addr:       ', blue(dev_info.addr), 
-                  "("+bdaddr_to_company_name(dev_info.addr)+")" if dev_info.addr_type == 'public' else "")
-            print('Addr type:  ', blue(dev_info.addr_type))
-            print('Connectable:', 
-                green('True') if dev_info.connectable else red('False'))
-            print("RSSI:        {} dBm".format(dev_info.rssi))
-            print("General Access Profile:")
-            
-            # TODO: Unify the gap type name parsings of BR and LE
-            for ad in dev_info.ad_structs:
-                try:
-                    type_names = gap_type_names[ad.type]
-                except KeyError:
-                    type_names = "0x{:02X} ".format(ad.type)+"("+ red("Unknown")+")"
-
-                print(INDENT+"{}: ".format(type_names), end='')
-                # print(INDENT+"0x{:02X} ({}): ".format(ad.type, type_names), end='')
-                
-                # Parses AD structure based on https://www.bluetooth.com/specifications/specs/
-                # -> Core Specification Supplement
-                if ad.type == COMPLETE_LIST_OF_16_BIT_SERVICE_CLASS_UUIDS or \
-                    ad.type == INCOMPLETE_LIST_OF_16_BIT_SERVICE_CLASS_UUIDS:
-                    print()
-                    for uuid in ad.value.split(','):
-                        if len(uuid) == 36:
-                            # 这里拿到的是完整的 128-bit uuid，但我们需要 16-bit uuid。
-                            print(INDENT*2 + blue("0x"+uuid[4:8].upper()))
-                        else:
-                            print(INDENT*2 + blue(uuid))
-                elif ad.type == COMPLETE_LIST_OF_32_BIT_SERVICE_CLASS_UUIDS or \
-                    ad.type == INCOMPLETE_LIST_OF_32_BIT_SERVICE_CLASS_UUIDS:
-                    print()
-                    for uuid in ad.value.split(','): 
-                        if len(uuid) == 36:
-                            # 这里拿到的是完整的 128-bit uuid，但我们需要 32-bit uuid。
-                            print(INDENT*2 + blue("0x"+uuid[0:8].upper()))
-                        else:
-                            print(INDENT*2 + blue(uuid))
-                elif ad.type == COMPLETE_LIST_OF_128_BIT_SERVICE_CLASS_UUIDS or \
-                    ad.type == INCOMPLETE_LIST_OF_128_BIT_SERVICE_CLASS_UUIDS:
-                        print()
-                        for uuid in ad.value.split(','): 
-                            print(INDENT*2 + blue(uuid).upper())
-                elif ad.type == SERVICE_DATA_16_BIT_UUID:
-                    print()
-                    print(INDENT*2 + "UUID: 0x{}".format(ad.value[0:2*2].upper()))
-                    print(INDENT*2 + "Data:", ad.value[2*2:])
-                elif ad.type == SERVICE_DATA_32_BIT_UUID:
-                    print()
-                    print(INDENT*2 + "UUID: {}".format(ad.value[0:4*2].upper()))
-                    print(INDENT*2 + "Data:", ad.value[4*2:])
-                elif ad.type == SERVICE_DATA_128_BIT_UUID:
-                    print()
-                    print(INDENT*2 + "UUID: {}".format(ad.value[0:16*2].upper()))
-                    print(INDENT*2 + "Data: ", ad.value[16*2:])
-                elif ad.type == FLAGS:
-                    print()
-                    try:
-                        value = bytes.fromhex(ad.value)
-                        print(INDENT*2 + "LE Limited Discoverable Mode\n" if value[0] & 0x01 else "", end="")
-                        print(INDENT*2 + "LE General Discoverable Mode\n" if value[0] & 0x02 else "", end="")
-                        print(INDENT*2 + "BR/EDR Not Supported\n" if value[0] & 0x04 else "", end="") # Bit 37 of LMP Feature Mask Definitions (Page 0)
-                        print(INDENT*2 + "Simultaneous LE + BR/EDR to Same Device Capable (Controller)\n" if value[0] & 0x08 else "", end="") # Bit 49 of LMP Feature Mask Definitions (Page 0)
-                        print(INDENT*2 + "Simultaneous LE + BR/EDR to Same Device Capable (Host)\n" if value[0] & 0x10 else "", end="") # Bit 66 of LMP Feature Mask Definitions (Page 1)
-                    except (ValueError, IndexError) as e:
-                        logger.debug("LeDevicesScanResult.print(), parse ad.type == FLAGS")
-                        print(ad.value, "("+red("Raw")+")")
-                elif ad.type == MANUFACTURER_SPECIFIC_DATA:
-                    value = bytes.fromhex(ad.value)
-                    company_id = int.from_bytes(value[0:2], 'little', signed=False)
-                    try:
-                        company_name = blue(company_names[company_id])
-                    except KeyError:
-                        company_name = red("Unknown")
-                    
-                    if len(value) >= 2:
-                        print()
-                        print(INDENT*2+"Company ID:", '0x{:04X} ({})'.format(company_id,company_name))
-                        try:
-                            
-                            print(INDENT*2+'Data:      ', ''.join(["{:02X}".format(b) for b in value[2:]]))
-                        except IndexError:
-                            print(INDENT*2+'Data:', None)
-                    else:
-                        print(value)
-                elif ad.type == TX_POWER_LEVEL:
-                    value = int.from_bytes(bytes.fromhex(ad.value), 'little', signed=True)
-                    print(value, "dBm", "(pathloss {} dBm)".format(value - dev_info.rssi))
-                else:
-                    print(ad.value)
-
-            print()  
-            print() # Two empty lines before next LE device information
+            pp_le_dev_info(dev_info)
+
+    def source_iface(self, dev_info: LeDeviceInfo) -> str:
+        """The HCI device that heard dev_info with the strongest RSSI, self.iface
+        if none of them reported one"""
+        if dev_info.heard_by:
+            rssis = {iface: rssi for iface, rssi in dev_info.heard_by.items() if rssi is not None}
+            if rssis:
+                return max(rssis, key=rssis.get)
+        return self.iface
 
     def store(self):
-        with open(LE_DEVS_SCAN_RESULT_CACHE, 'wb') as result_file:
-            pickle.dump(self, result_file)
+        """Merge the address types into the LE address type cache"""
+        now = time.time()
+        store_addr_types((dev_info.addr, dev_info.addr_type, now, self.source_iface(dev_info))
+                         for dev_info in self.devices_info)
 
 
 class LeScanner:
@@ -194,19 +268,57 @@ class LeScanner:
     2. LL features scanning
     3. Advertising physical channel PDU sniffing.
     """
-    def __init__(self, iface: str ='hci0', microbit_devpaths=None):
+    def __init__(self, iface: str ='hci0', microbit_devpaths=None, backend: str = 'bluepy',
+                 scan_interval: int = None, scan_window: int = None):
         """
         hci               - HCI device for scaning LE devices and LL features.
         microbit_devpaths - When sniffing advertising physical channel PDU, we 
                             need at least one micro:bit.
+        backend           - 'bluepy' or 'hci'. The LE devices scanning is done
+                            by bluepy-helper, or by bluing itself on the HCI
+                            socket.
+        scan_interval     - LE scan interval and window in units of 0.625 ms, 
+        scan_window         only supported by the hci backend. None for the
+                            default full duty cycle.
         """
-        self.devs_scan_result = LeDevicesScanResult()
+        if backend not in ('bluepy', 'hci'):
+            raise ValueError("Invalid LE scan backend: {}".format(backend))
+
+        self.devs_scan_result = LeDevicesScanResult(iface)
         self.iface = iface
         self.devid = HCI.hcistr2devid(self.iface)
         self.microbit_devpaths = microbit_devpaths
+        self.backend = backend
+        self.scan_interval = scan_interval
+        self.scan_window = scan_window
+
+    def new_scanner(self, scan_filter: LeScanFilter = None,
+                    filter_dup: bool = False) -> Scanner | HciScanner:
+        """
+        scan_filter - With the hci backend, the scanner filters the reports
+                      and pushes the addresses down to the controller. The
+                      delegate has to filter them with the bluepy backend.
+        filter_dup  - Let the controller drop duplicate advertisements, only
+                      supported by the hci backend
+        """
+        if self.backend == 'hci':
+            scanner = HciScanner(self.devid)
+            scanner.scan_filter = scan_filter
+            scanner.filter_dup = filter_dup
+            if self.scan_interval is not None:
+                scanner.scan_interval = self.scan_interval
+            if self.scan_window is not None:
+                scanner.scan_window = self.scan_window
+            return scanner
+        else:
+            if filter_dup:
+                logger.warning("Duplicate filtering is only supported by the hci backend")
+            if self.scan_interval is not None or self.scan_window is not None:
+                logger.warning("Scan interval and window are only supported by the hci backend")
+            return Scanner(self.devid)
 
     @staticmethod
-    def determine_addr_type(iface: str, addr: str):
+    def determine_addr_type(iface: str, addr: str, backend: str = 'bluepy', timeout: int = 8):
         """For user not provide the remote LE address type."""
         logger.debug("Entered determine_addr_type(cls, iface={}, addr={})".format(
             iface, addr))
@@ -217,140 +329,328 @@ class LeScanner:
                 return atype
         except FileNotFoundError:
             logger.warning("No cached LE device information available")
+        except sqlite3.Error as e:
+            logger.warning("Failed to read the cached LE device information, {}: {}".format(
+                e.__class__.__name__, e))
         else:
             logger.info("The cached LE device information dose not match")
         
-        logger.info("Start scanning nearby LE devices")
-                
-        le_devs_scan_result = LeScanner(iface).scan_devs(scan_type='passive')
-        le_devs_scan_result.store()
-        for dev_info in le_devs_scan_result.devices_info:
-            if addr == dev_info.addr:
-                return dev_info.addr_type
+        logger.info("Start scanning for {}".format(blue(addr)))
+
+        dev_info = LeScanner(iface, backend=backend).find_dev(addr, timeout)
+        if dev_info is not None:
+            return dev_info.addr_type
 
         raise RuntimeError("Failed to automatically determine the LE address type")
     
+    def resolve_addr_type(self, addr: str) -> int:
+        """determine_addr_type() on this HCI device, a failure is assumed to
+        be public."""
+        logger.info("Automatically determining the address type of {}".format(blue(addr)))
+        try:
+            addr_type = LeScanner.determine_addr_type(self.iface, addr, self.backend)
+            logger.info("{} is a {} address".format(blue(addr), blue(addr_type)))
+        except Exception as e:
+            logger.warning("{}: {}\n"
+                           "    Assumed to be {}".format(e.__class__.__name__, e, yellow('public')))
+            addr_type = 'public'
+
+        return ADDR_TYPE_RANDOM if addr_type.lower() == 'random' else ADDR_TYPE_PUBLIC
+
+    def find_dev(self, addr: str, timeout: int = 8, scan_type: str = 'passive') -> LeDeviceInfo | None:
+        """Scan until the device of addr is discovered, at most timeout seconds.
+
+        Return None if it is not discovered. With the hci backend, addr is put
+        in the Filter Accept List of the controller as both a public and a
+        random address, so the other devices nearby are not even reported.
+        """
+        delegate = TargetDelegate(addr)
+        scanner = self.new_scanner().withDelegate(delegate)
+        if self.backend == 'hci':
+            scanner.accept_list = [(addr, ADDR_TYPE_PUBLIC), (addr, ADDR_TYPE_RANDOM)]
+
+        logger.debug("LE {} scanning on {} for {} until {} is discovered".format(
+            scan_type, self.iface, timeout, addr))
+
+        start = time.monotonic()
+        deadline = start + timeout
+        scanner.clear()
+        try:
+            scanner.start(passive=(scan_type == 'passive'))
+            # The target may already be reported while the scan is enabled.
+            while delegate.found is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                scanner.process(min(remaining, FIND_DEV_SLICE))
+            elapsed = time.monotonic() - start
+        finally:
+            scanner.stop()
+
+        if delegate.found is None:
+            return None
+
+        dev_info = LeDeviceInfo.from_scan_entry(delegate.found)
+        logger.debug("{} discovered in {:.2f} sec".format(addr, elapsed))
+        store_addr_types([(dev_info.addr, dev_info.addr_type, time.time(), self.iface)])
+        return dev_info
+
     @staticmethod
     def cached_addr_to_atype(addr: str) -> str | None:
-        addr = addr.upper()
+        """Raise FileNotFoundError if no LE device has been cached yet."""
+        with LeAddrTypeCache() as cache:
+            record = cache.get(addr)
 
-        with open(LE_DEVS_SCAN_RESULT_CACHE, 'rb') as le_devs_scan_result_cache:
-            le_devs_scan_result = pickle.load(le_devs_scan_result_cache)
-            for dev_info in le_devs_scan_result.devices_info:
-                if addr == dev_info.addr:
-                    return dev_info.addr_type
+        if record is None:
+            return None
 
-    def scan_devs(self, timeout=8, scan_type='active', sort='rssi') -> LeDevicesScanResult:
+        logger.debug("{} is cached as {}, last seen on {} {:.0f} sec ago".format(
+            record.addr, record.addr_type, record.source, time.time() - record.last_seen))
+        return record.addr_type
+
+    def scan_devs(self, timeout=8, scan_type='active', sort='rssi', sinks: list = None,
+                  spinner: bool = True, scan_filter: LeScanFilter = None,
+                  filter_dup: bool = False, adaptive: bool = False,
+                  top: int = None) -> LeDevicesScanResult:
         """Perform LE Devices scanning and return scan reuslt as LeDevicesScanResult
 
-        scan_type  - 'active' or 'passive'
+        scan_type   - 'active' or 'passive'
+        sort        - One of ranking.SORT_KEYS, or None to keep the order of
+                      discovery
+        top         - Only keep the top ranked devices
+        sinks       - LeScanSink(s). If provided, each new device and each changed 
+                      advertisement is emitted to them as soon as it is received,
+                      instead of only being available after the scan.
+        spinner     - Whether to show a spinner while scanning
+        scan_filter - Only the devices it accepts are scanned
+        filter_dup  - Let the controller drop duplicate advertisements
+        adaptive    - Back off the duty cycle once no new devices are discovered,
+                      see scan_adaptive(). Only supported by the hci backend.
         """
-        if scan_type == 'active':
+        if adaptive and self.backend != 'hci':
+            logger.warning("Adaptive duty cycling is only supported by the hci backend")
+            adaptive = False
+
+        if scan_type == 'active' and spinner:
             logger.warning("You might want to spoof your LE address before doing "
                            "an active scan")
 
-        scanner = Scanner(self.devid).withDelegate(LEDelegate())
+        if not scan_filter:
+            scan_filter = None
+        scanner = self.new_scanner(scan_filter, filter_dup)
+        # The HciScanner filters the reports itself.
+        delegate_filter = scan_filter if self.backend == 'bluepy' else None
+        delegate = LEDelegate(sinks, scan_filter=delegate_filter)
+        scanner.withDelegate(delegate)
         #print("[Debug] timeout =", timeout)
         
-        spinner = Halo(text="Scanning", placement='right')
+        # The spinner would be mixed with the streamed output.
+        spinner = Halo(text="Scanning", placement='right', 
+                       enabled=spinner and not any(sink.console for sink in sinks or []))
 
         # scan() 返回的 devs 是 dictionary view。
         logger.info('LE {} scanning on {} for {} sec'.format(
             blue(scan_type), blue(self.iface), blue("{}".format(timeout))))
 
-        if scan_type == 'active': # Active scan 会在 LL 发送 SCAN_REQ PDU
-            spinner.start()
-            devs = scanner.scan(timeout)
-            spinner.stop()
-        elif scan_type == 'passive':
-            spinner.start()
-            devs = scanner.scan(timeout, passive=True)
-            spinner.stop()
-        else:
+        if scan_type not in ('active', 'passive'):
             logger.error('Unknown LE scan type')
             return
 
-        if sort == 'rssi':
-            devs = list(devs) # 将 dictionary view 转换为 list
-            devs.sort(key=lambda d:d.rssi)
-        
+        passive = scan_type == 'passive' # Active scan 会在 LL 发送 SCAN_REQ PDU
+        spinner.start()
+        delegate.start = time.monotonic()
+        try:
+            if adaptive:
+                devs = self.scan_adaptive(scanner, delegate, timeout, passive)
+            else:
+                devs = scanner.scan(timeout, passive=passive)
+        finally:
+            spinner.stop()
+
+        if delegate_filter is not None:
+            devs = [dev for dev in devs 
+                    if delegate_filter.accept(dev.addr, dev.addrType, dev.rssi)]
+
+        devices_info = []
         for dev in devs:
-            dev_info = LeDeviceInfo(dev.addr.upper(), dev.addrType.lower(), dev.connectable, dev.rssi)
+            # 每个 dev 透露的所有 GAP 数据（AD structure）都存入了 dev_info。
+            # 
+            # 如果 bluepy.scan() 执行的是 active scan，那么这些 GAP 数据
+            # 可能同时包含 AdvData 与 ScanRspData。其中 AdvData 由 remote LE 
+            # dev 主动返回，ScanRspData 由 remote BLE dev 响应 SCAN_REQ 返回。
+            #
+            # 虽然 LL 分开定义了 Advertising PDUs (ADV_IND, ADV_DIRECT_IND...)
+            # 和 Scanning PDUs (SCAN_REQ, SCAN_RSP)。但它们分别包含的 AdvData 
+            # 与 ScanRspData 到了 HCI 层都被放在了 HCI_LE_Advertising_Report 
+            # event 中。HCI_LE_Advertising_Report 的 Event_Type 标识了这些数
+            # 据具体来源于哪个 LL 层的 PDU。另外 ScanRspData 与 AdvData 的格式
+            # 完全相同，都是 GAP 协议标准定义的 AD structure。
+            #
+            # 在 LL 定义的 Advertising PDUs 中 ADV_DIRECT_IND 一定不会包含 
+            # AdvData。其余的 ADV_IND，ADV_NONCONN_IND 以及 ADV_SCAN_IND 都
+            # 可能包含 AdvData。
+            dev_info = LeDeviceInfo.from_scan_entry(dev)
+            dev_info.discovery_latency = delegate.discovery_latency(dev.addr)
+            dev_info.last_seen = delegate.last_seen_after(dev.addr)
+            devices_info.append(dev_info)
+
+        log_discovery_latency(devices_info)
+
+        # The top K are selected with a heap, instead of sorting all devices.
+        for dev_info in rank_devices_info(devices_info, sort, top):
             self.devs_scan_result.add_device_info(dev_info)
-            
-            # print('Addr:       ', blue(dev.addr.upper()))
-            # print('Addr type:  ', blue(dev.addrType))
-            # print('Connectable:', 
-            #     green('True') if dev.connectable else red('False'))
-            # print("RSSI:        %d dB" % dev.rssi)
-            # print("General Access Profile:")
-            for (adtype, desc, val) in dev.getScanData():
-                ad_struct = AdStruct(adtype, val)
-                dev_info.add_ad_structs(ad_struct)
-                # 打印当前 remote LE dev 透露的所有 GAP 数据（AD structure）。
-                # 
-                # 如果 bluepy.scan() 执行的是 active scan，那么这些 GAP 数据
-                # 可能同时包含 AdvData 与 ScanRspData。其中 AdvData 由 remote LE 
-                # dev 主动返回，ScanRspData 由 remote BLE dev 响应 SCAN_REQ 返回。
-                #
-                # 虽然 LL 分开定义了 Advertising PDUs (ADV_IND, ADV_DIRECT_IND...)
-                # 和 Scanning PDUs (SCAN_REQ, SCAN_RSP)。但它们分别包含的 AdvData 
-                # 与 ScanRspData 到了 HCI 层都被放在了 HCI_LE_Advertising_Report 
-                # event 中。HCI_LE_Advertising_Report 的 Event_Type 标识了这些数
-                # 据具体来源于哪个 LL 层的 PDU。另外 ScanRspData 与 AdvData 的格式
-                # 完全相同，都是 GAP 协议标准定义的 AD structure。
-                #
-                # 在 LL 定义的 Advertising PDUs 中 ADV_DIRECT_IND 一定不会包含 
-                # AdvData。其余的 ADV_IND，ADV_NONCONN_IND 以及 ADV_SCAN_IND 都
-                # 可能包含 AdvData。
-                #
-                # 另外 getScanData() 返回的 desc 还可以通过 ScanEntry.getDescription() 
-                # 单独获取；val 还可以通过 ScanEntry.getValueText() 单独获取；
-                # adtype 表示当前一条 GAP 数据（AD structure）的类型。
-            
         return self.devs_scan_result
 
+    @staticmethod
+    def scan_adaptive(scanner: HciScanner, delegate: LEDelegate, timeout: float,
+                      passive: bool = False):
+        """Scan at the full duty cycle of scanner.scan_window/scan_interval
+        first. After ADAPTIVE_PLATEAU slices of ADAPTIVE_SLICE seconds without
+        a new device, the scan window is halved, down to MIN_DUTY_CYCLE. A new
+        device brings the full duty cycle back."""
+        scan_interval = scanner.scan_interval
+        full_window = scanner.scan_window
+        min_window = max(MIN_SCAN_INTERVAL, int(scan_interval * MIN_DUTY_CYCLE))
+
+        start = time.monotonic()
+        deadline = start + timeout
+        idle_slices = 0
+        airtime = 0 # Seconds spent listening
+
+        scanner.clear()
+        scanner.start(passive=passive)
+        try:
+            while True:
+                slice_start = time.monotonic()
+                remaining = deadline - slice_start
+                if remaining <= 0:
+                    break
+
+                discovered = len(delegate.first_seen)
+                scanner.process(min(ADAPTIVE_SLICE, remaining))
+                airtime += (time.monotonic() - slice_start) * scanner.scan_window / scan_interval
+
+                if len(delegate.first_seen) > discovered:
+                    idle_slices = 0
+                    if scanner.scan_window < full_window:
+                        scanner.set_duty_cycle(scan_interval, full_window)
+                        logger.debug("New devices discovered, duty cycle back to {:.0%}".format(
+                            full_window / scan_interval))
+                    continue
+
+                idle_slices += 1
+                if idle_slices >= ADAPTIVE_PLATEAU and scanner.scan_window > min_window:
+                    idle_slices = 0
+                    scanner.set_duty_cycle(scan_interval, max(scanner.scan_window // 2, min_window))
+                    logger.debug("No new devices for {} sec, duty cycle down to {:.0%}".format(
+                        ADAPTIVE_PLATEAU * ADAPTIVE_SLICE, scanner.scan_window / scan_interval))
+        finally:
+            scanner.stop()
+
+        logger.info("Average duty cycle {:.0%}".format(airtime / max(time.monotonic() - start, 1e-3)))
+        return scanner.getDevices()
+
+
+    def monitor(self, scan_type='passive', max_devs: int = 1000, idle_timeout: int = 300,
+                report_interval: int = 10, sinks: list = None, rssi_history: int = 64,
+                scan_filter: LeScanFilter = None, filter_dup: bool = False,
+                sort: str = 'rssi', top: int = None):
+        """Scan LE devices indefinitely, until KeyboardInterrupt.
+
+        Devices are tracked in a bounded LeDeviceTable which is printed every
+        report_interval seconds. Devices not seen for idle_timeout seconds
+        are evicted, so the memory usage stays flat over long runs. The RSSI
+        statistics are over the latest rssi_history advertisements of a device.
+        Only the devices accepted by scan_filter are tracked.
+
+        The table is ranked by sort as the reports arrive, only the top ones
+        are printed if top is given.
+        """
+        if not scan_filter:
+            scan_filter = None
+        scanner = self.new_scanner(scan_filter, filter_dup)
+        delegate_filter = scan_filter if self.backend == 'bluepy' else None
+        # Address types of the evicted devices, to be merged into the cache
+        evicted = []
+
+        def forget(record):
+            # The scanner keeps its own ScanEntry of every device ever seen.
+            scanner.scanned.pop(record.addr.lower(), None)
+            evicted.append((record.addr, record.addr_type, record.last_seen, self.iface))
+
+        dev_table = LeDeviceTable(max_devs, idle_timeout, forget, rssi_history, sort)
+        scanner.withDelegate(LEDelegate(sinks, dev_table, delegate_filter))
+
+        logger.info('LE {} monitoring on {}, tracking up to {} devices, idle timeout {} sec'.format(
+            blue(scan_type), blue(self.iface), blue(str(max_devs)), blue(str(idle_timeout))))
+
+        scanner.clear()
+        scanner.start(passive=(scan_type == 'passive'))
+        try:
+            while True:
+                scanner.process(report_interval)
+                if delegate_filter is not None:
+                    # bluepy keeps a ScanEntry of the devices filtered out too.
+                    for addr in [addr for addr in scanner.scanned if addr.upper() not in dev_table]:
+                        del scanner.scanned[addr]
+                now = time.time()
+                dev_table.evict_idle(now)
+                if evicted:
+                    store_addr_types(evicted)
+                    evicted.clear()
+                if not any(sink.console for sink in sinks or []):
+                    dev_table.print(now, top)
+        finally:
+            scanner.stop()
+            store_addr_types(evicted + [(record.addr, record.addr_type, record.last_seen, self.iface)
+                                        for record in dev_table])
+
 
-    def read_ll_feature_set(self, paddr: str, patype: int = ADDR_TYPE_PUBLIC, timeout: int = 10):
+    def read_ll_feature_set(self, paddr: str, patype: int | None = ADDR_TYPE_PUBLIC, 
+                            timeout: int = 10, max_age: float = DEFAULT_MAX_AGE):
         """LL feature scanning
 
         paddr   - Peer addresss for scanning LL features.
-        patype  - Peer address type, ADDR_TYPE_PUBLIC or ADDR_TYPE_RANDOM.
+        patype  - Peer address type, ADDR_TYPE_PUBLIC or ADDR_TYPE_RANDOM. None
+                  to determine it, only if paddr is not served from the cache.
         timeout - sec
+        max_age - The features read within this many seconds are served from
+                  the fingerprint cache, 0 to always read them.
         """
-        logger.info("Reading LL FeatureSet of {} on {}".format(blue(paddr), blue(self.iface)))
-        
-        spinner = Halo(text="Reading", placement='right')
-        hci = HCI(self.iface)
-        
-        spinner.start()
+        fingerprint = load_fingerprint(paddr, TRANSPORT_LE, max_age)
+        if fingerprint is not None:
+            logger.info("LL FeatureSet of {} read {} sec ago, from the fingerprint cache".format(
+                blue(paddr), blue("{:.0f}".format(time.time() - fingerprint.updated))))
+            features = fingerprint.features[0]
+        else:
+            hci = HCI(self.iface)
+            hci.clean_up_running()
+            hci.close()
 
-        try:
-            le_conn_complete = hci.le_create_connection(paddr, patype, timeout=timeout)
-            if le_conn_complete.status != ControllerErrorCodes.SUCCESS:
-                logger.error("Failed to connect {} {} LE address\n"
-                             "    status: 0x{:02x} - {}".format(le_conn_complete.status, ControllerErrorCodes[le_conn_complete.status]))
-        except Exception as e:
-            spinner.fail()
-            logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
-            sys.exit(1)
+            if patype is None:
+                patype = self.resolve_addr_type(paddr)
+
+            logger.info("Reading LL FeatureSet of {} on {}".format(blue(paddr), blue(self.iface)))
+            
+            spinner = Halo(text="Reading", placement='right')
+            hci = HCI(self.iface)
+            
+            spinner.start()
 
-        le_read_remote_features_complete = hci.le_read_remote_features(le_conn_complete.conn_handle)
-        if le_read_remote_features_complete.status != ControllerErrorCodes.SUCCESS:
             try:
-                hci.disconnect(le_conn_complete.conn_handle)
-            except HciRuntimeError as e:
-                logger.warning("HciRuntimeError, {}".format(e))
+                features = read_ll_features(hci, paddr, patype, timeout)
+            except Exception as e:
+                spinner.fail()
+                logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
+                sys.exit(1)
+            finally:
+                hci.close()
+                
+            spinner.stop()
+            store_fingerprints([ll_fingerprint(paddr, patype, features)])
 
-            logger.error("Failed to le read remote features\n"
-                         "    status: 0x{:02x} - {}".format(le_read_remote_features_complete.status, ControllerErrorCodes[le_read_remote_features_complete.status].name))
-            sys.exit(1)
-            
-        spinner.stop()
         print(blue('LE LL Features:'))
-        pp_le_feature_set(le_read_remote_features_complete.le_features)
-
-        hci.disconnect(le_conn_complete.conn_handle)
+        pp_le_feature_set(features)
         return
 
 
@@ -371,14 +671,8 @@ class LeScanner:
             logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
             sys.exit(1)
         
-        auth_req = AuthReq(BondingFlags.NO_BONDING, False, True, False, False)
-        initiator_key_dist = KeyDist(True, True, True, True)
-        responder_key_dist = KeyDist(True, True, True, True)
-        
         try:
-            self.sm.pairing_request(IoCapabilities.NoInputNoOutput, OOBDataFlags.NOT_PRESENT, 
-                                    int(auth_req), 16, initiator_key_dist, responder_key_dist)
-            pairing_response = self.sm.wait_pairing_response(timeout)
+            pairing_response = request_pairing_feature(self.sm, timeout)
             print('\r' + pairing_response.to_human_readable_str(title=blue("Pairing Response")))
         except Exception as e:
             spinner.fail()
@@ -442,53 +736,98 @@ class LeScanner:
        
 
 
+def request_pairing_feature(sm: SecurityManager, timeout: int = 10):
+    """Send a Pairing Request over the connected sm and return the Pairing
+    Response. No bonding, the pairing is not carried on."""
+    auth_req = AuthReq(BondingFlags.NO_BONDING, False, True, False, False)
+    initiator_key_dist = KeyDist(True, True, True, True)
+    responder_key_dist = KeyDist(True, True, True, True)
+
+    sm.pairing_request(IoCapabilities.NoInputNoOutput, OOBDataFlags.NOT_PRESENT, 
+                       int(auth_req), 16, initiator_key_dist, responder_key_dist)
+    return sm.wait_pairing_response(timeout)
+
+
+def read_ll_features(hci: HCI, paddr: str, patype: int = ADDR_TYPE_PUBLIC,
+                     timeout: int = 10) -> bytes:
+    """Connect paddr, read its LE features and disconnect. The HCI is left
+    open to be used for the next peer.
+
+    Raise RuntimeError if the controller reports a failure.
+    """
+    le_conn_complete = hci.le_create_connection(paddr, patype, timeout=timeout)
+    if le_conn_complete.status != ControllerErrorCodes.SUCCESS:
+        raise RuntimeError("Failed to connect {}, status: 0x{:02x} - {}".format(
+            paddr, le_conn_complete.status,
+            ControllerErrorCodes[le_conn_complete.status].name))
+
+    try:
+        le_read_remote_features_complete = hci.le_read_remote_features(le_conn_complete.conn_handle)
+        if le_read_remote_features_complete.status != ControllerErrorCodes.SUCCESS:
+            raise RuntimeError("Failed to le read remote features, status: 0x{:02x} - {}".format(
+                le_read_remote_features_complete.status,
+                ControllerErrorCodes[le_read_remote_features_complete.status].name))
+        return le_read_remote_features_complete.le_features
+    finally:
+        try:
+            hci.disconnect(le_conn_complete.conn_handle)
+        except HciRuntimeError as e:
+            logger.warning("HciRuntimeError, {}".format(e))
+
+
+def ll_fingerprint(paddr: str, patype: int, features: bytes) -> Fingerprint:
+    return Fingerprint(paddr.upper(), TRANSPORT_LE, patype, None, None, None, {0: features},
+                       time.time())
+
+
+def log_discovery_latency(devices_info: list[LeDeviceInfo]):
+    latencies = sorted(dev_info.discovery_latency for dev_info in devices_info
+                       if dev_info.discovery_latency is not None)
+    if not latencies:
+        return
+
+    logger.info("Discovery latency of {} devices: median {:.2f} sec, 90th percentile "
+                "{:.2f} sec, max {:.2f} sec".format(
+                    len(latencies), latencies[len(latencies) // 2],
+                    latencies[min(int(len(latencies) * 0.9), len(latencies) - 1)], latencies[-1]))
+
+
+def pp_le_dev_info(dev_info: LeDeviceInfo):
+    """Print an LE device and all AD structures it reported"""
+    print('Addr:       ', blue(dev_info.addr), 
+          "("+bdaddr_to_company_name(dev_info.addr)+")" if dev_info.addr_type == 'public' else "")
+    print('Addr type:  ', blue(dev_info.addr_type))
+    print('Connectable:', 
+        green('True') if dev_info.connectable else red('False'))
+    print("RSSI:        {}".format('N/A' if dev_info.rssi is None else
+                                   "{} dBm".format(dev_info.rssi)))
+    if dev_info.primary_phy is not None:
+        print('PHY:        ', blue(dev_info.primary_phy) if dev_info.secondary_phy is None else \
+              "{} (secondary {})".format(blue(dev_info.primary_phy), blue(dev_info.secondary_phy)))
+    if dev_info.sid is not None:
+        print('SID:        ', dev_info.sid)
+    if dev_info.tx_power is not None:
+        print("TX power:    {} dBm".format(dev_info.tx_power))
+    if dev_info.discovery_latency is not None:
+        print("Discovered:  {:.2f} sec after the scan started".format(dev_info.discovery_latency))
+    if dev_info.heard_by is not None:
+        print('Heard by:   ', ', '.join(["{} ({})".format(blue(iface), 'N/A' if rssi is None else
+                                                          "{} dBm".format(rssi))
+                                         for iface, rssi in dev_info.heard_by.items()]))
+    print("General Access Profile:")
+    
+    for ad in dev_info.ad_structs:
+        pp_ad_struct(ad.type, ad.value, dev_info.rssi)
+
+    print()  
+    print() # Two empty lines before next LE device information
+
+
 def pp_le_feature_set(features: bytes):
     """
     待处理 Valid from Controller to Controller, Masked to Peer, Host Controlled
     """
-    for i in range(8):
-        b  = features[i]
-        if i == 0:
-            print('    LE Encryption:', green('True') if b & 0x01 else red('False'))
-            print('    Connection Parameters Request Procedure:', green('True') if (b >> 1) & 0x01 else red('False'))
-            print('    Extended Reject Indication:', green('True') if (b >> 2) & 0x01 else red('False'))
-            print('    Slave-initiated Features Exchange:', green('True') if (b >> 3) & 0x01 else red('False'))
-            print('    LE Ping:', green('True') if (b >> 4) & 0x01 else red('False'))
-            print('    LE Data Packet Length Extension:', green('True') if (b >> 5) & 0x01 else red('False'))
-            print('    LL Privacy:', green('True') if (b >> 6) & 0x01 else red('False'))
-            print('    Extended Scanner Filter Policies:', green('True') if (b >> 7) & 0x01 else red('False'))
-        elif i == 1:
-            print('    LE 2M PHY:', green('True') if b & 0x01 else red('False'))
-            print('    Stable Modulation Index - Transmitter:', green('True') if (b >> 1) & 0x01 else red('False'))
-            print('    Stable Modulation Index - Receiver:', green('True') if (b >> 2) & 0x01 else red('False'))
-            print('    LE Coded PHY:', green('True') if (b >> 3) & 0x01 else red('False'))
-            print('    LE Extended Advertising:', green('True') if (b >> 4) & 0x01 else red('False'))
-            print('    LE Periodic Advertising:', green('True') if (b >> 5) & 0x01 else red('False'))
-            print('    Channel Selection Algorithm #2:', green('True') if (b >> 6) & 0x01 else red('False'))
-            print('    LE Power Class 1:', green('True') if (b >> 7) & 0x01 else red('False'))
-        elif i == 2:
-            print('    Minimum Number of Used Channels Procedure:', green('True') if b & 0x01 else red('False'))
-            print('    Connection CTE Request:', green('True') if (b >> 1) & 0x01 else red('False'))
-            print('    Connection CTE Response:', green('True') if (b >> 2) & 0x01 else red('False'))
-            print('    Connectionless CTE Transmitter:', green('True') if (b >> 3) & 0x01 else red('False'))
-            print('    Connectionless CTE Receiver:', green('True') if (b >> 4) & 0x01 else red('False'))
-            print('    Antenna Switching During CTE Transmission (AoD):', green('True') if (b >> 5) & 0x01 else red('False'))
-            print('    Antenna Switching During CTE Reception (AoA):', green('True') if (b >> 6) & 0x01 else red('False'))
-            print('    Receiving Constant Tone Extensions:', green('True') if (b >> 7) & 0x01 else red('False'))
-        elif i == 3:
-            print('    Periodic Advertising Sync Transfer - Sender:', green('True') if b & 0x01 else red('False'))
-            print('    Periodic Advertising Sync Transfer - Recipient:', green('True') if (b >> 1) & 0x01 else red('False'))
-            print('    Sleep Clock Accuracy Updates:', green('True') if (b >> 2) & 0x01 else red('False'))
-            print('    Remote Public Key Validation:', green('True') if (b >> 3) & 0x01 else red('False'))
-            print('    Connected Isochronous Stream - Master:', green('True') if (b >> 4) & 0x01 else red('False'))
-            print('    Connected Isochronous Stream - Slave:', green('True') if (b >> 5) & 0x01 else red('False'))
-            print('    Isochronous Broadcaster:', green('True') if (b >> 6) & 0x01 else red('False'))
-            print('    Synchronized Receiver:', green('True') if (b >> 7) & 0x01 else red('False'))
-        elif i == 4:
-            print('    Isochronous Channels (Host Support):', green('True') if b & 0x01 else red('False'))
-            print('    LE Power Control Request:', green('True') if (b >> 1) & 0x01 else red('False'))
-            print('    LE Power Change Indication:', green('True') if (b >> 2) & 0x01 else red('False'))
-            print('    LE Path Loss Monitoring:', green('True') if (b >> 3) & 0x01 else red('False'))
+    pp_feature_page(LE_FEATURES.decode(features))
 
 
 def __test():
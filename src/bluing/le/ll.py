@@ -74,6 +74,121 @@ CONNECT_IND     = 0b0101
 # AUX_CONNECT_RSP
 
 
+# Extended Header Flags of the Common Extended Advertising Payload Format
+EXT_HEADER_FIELDS = (
+    # (Flag bit, field, size)
+    (0, 'AdvA',     6),
+    (1, 'TargetA',  6),
+    (2, 'CTEInfo',  1),
+    (3, 'ADI',      2),
+    (4, 'AuxPtr',   3),
+    (5, 'SyncInfo', 18),
+    (6, 'TxPower',  1),
+)
+
+adv_modes = {
+    0b00: 'Non-connectable and non-scannable',
+    0b01: 'Connectable and non-scannable',
+    0b10: 'Non-connectable and scannable',
+    0b11: 'Reserved'
+}
+
+aux_phys = {
+    0b000: 'LE 1M',
+    0b001: 'LE 2M',
+    0b010: 'LE Coded'
+}
+
+
+def parse_common_ext_adv_payload(payload: bytes) -> dict | None:
+    '''Parse the extended header of the Common Extended Advertising Payload
+
+    ref
+    BLUETOOTH CORE SPECIFICATION Version 5.2 | Vol 6, Part B page 2877,
+    2.3.4 Common Extended Advertising Payload Format
+
+    +-------------------------------------------------------------------+
+    | Extended Header Length | AdvMode | Extended Header | AdvData      |
+    |------------------------|---------|-----------------|--------------|
+    | 6 b                    | 2 b     | 0-63 B          | 0-254 B      |
+    +-------------------------------------------------------------------+
+
+    Return None if the payload is malformed.
+    '''
+    if len(payload) < 1:
+        return None
+
+    ext_header_len = payload[0] & 0b00111111
+    result = {
+        'AdvMode': (payload[0] >> 6) & 0b11,
+        'AdvData': payload[1+ext_header_len:]
+    }
+    if ext_header_len == 0:
+        return result
+    if len(payload) < 1 + ext_header_len:
+        return None
+
+    flags = payload[1]
+    offset = 2
+    for bit, field, size in EXT_HEADER_FIELDS:
+        if not flags >> bit & 0b1:
+            continue
+        if offset + size > 1 + ext_header_len:
+            return None
+        result[field] = payload[offset:offset+size]
+        offset += size
+    result['ACAD'] = payload[offset:1+ext_header_len]
+
+    for field in ('AdvA', 'TargetA'):
+        if field in result:
+            result[field] = result[field][::-1]
+
+    if 'ADI' in result:
+        adi = int.from_bytes(result['ADI'], 'little')
+        result['ADI'] = {
+            'DID': adi & 0x0FFF,
+            'SID': adi >> 12
+        }
+
+    if 'AuxPtr' in result:
+        aux_ptr = int.from_bytes(result['AuxPtr'], 'little')
+        result['AuxPtr'] = {
+            'Channel Index': aux_ptr & 0b111111,
+            'CA': (aux_ptr >> 6) & 0b1,
+            # 0: 30 us, 1: 300 us
+            'Offset Units': (aux_ptr >> 7) & 0b1,
+            'AUX Offset': (aux_ptr >> 8) & 0x1FFF,
+            'AUX PHY': (aux_ptr >> 21) & 0b111
+        }
+
+    if 'TxPower' in result:
+        result['TxPower'] = int.from_bytes(result['TxPower'], 'little', signed=True)
+
+    return result
+
+
+def pp_common_ext_adv_payload(ext_header: dict, tx_add: int, rx_add: int):
+    print("AdvMode: {}".format(adv_modes[ext_header['AdvMode']]))
+    if 'AdvA' in ext_header:
+        print("{} AdvA: {}".format(
+            'public' if tx_add == 0b0 else 'random', ':'.join('%02X'%b for b in ext_header['AdvA'])))
+    if 'TargetA' in ext_header:
+        print("{} TargetA: {}".format(
+            'public' if rx_add == 0b0 else 'random', ':'.join('%02X'%b for b in ext_header['TargetA'])))
+    if 'ADI' in ext_header:
+        print("ADI: DID 0x{:03X}, SID {}".format(ext_header['ADI']['DID'], ext_header['ADI']['SID']))
+    if 'AuxPtr' in ext_header:
+        aux_ptr = ext_header['AuxPtr']
+        print("AuxPtr: channel {}, {}, offset {} us".format(
+            aux_ptr['Channel Index'],
+            aux_phys.get(aux_ptr['AUX PHY'], 'Reserved'),
+            aux_ptr['AUX Offset'] * (300 if aux_ptr['Offset Units'] else 30)))
+    if 'TxPower' in ext_header:
+        print("TxPower: {} dBm".format(ext_header['TxPower']))
+    if ext_header['AdvData']:
+        print("AdvData: {}".format(ext_header['AdvData']))
+
+
 def pp_adv_phych_pdu(pdu:bytes, ch:int) -> list:
     '''Parse and print advertising physical channel PDU
 
@@ -158,7 +273,21 @@ def pp_adv_phych_pdu(pdu:bytes, ch:int) -> list:
         # print("AdvData:", payload[6:])
     elif pdu_type == ADV_EXT_IND:
         print("[{}]".format(yellow('ADV_EXT_IND')))
-        print("raw: {}".format(payload))
+        ext_header = parse_common_ext_adv_payload(payload)
+        if ext_header is None:
+            print("raw: {}".format(payload))
+        else:
+            if 'AdvA' in ext_header:
+                addrs.append({
+                    'BD_ADDR': ext_header['AdvA'],
+                    'type': 'public' if tx_add == 0b0 else 'random'
+                })
+            if 'TargetA' in ext_header:
+                addrs.append({
+                    'BD_ADDR': ext_header['TargetA'],
+                    'type': 'public' if rx_add == 0b0 else 'random'
+                })
+            pp_common_ext_adv_payload(ext_header, tx_add, rx_add)
     elif pdu_type == SCAN_REQ:
         scan_a = payload[:6][::-1]
         adv_a = payload[6:][::-1]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+"""LE devices scanning on several HCI devices at the same time
+
+Each HCI device scans in its own thread, both bluepy-helper and the HCI socket
+wait outside of the GIL. The results are merged by address into one
+LeDevicesScanResult, recording the RSSI each HCI device heard a device with.
+"""
+
+from threading import Thread, Lock
+
+from halo import Halo
+from xpycommon.log import Logger
+from xpycommon.ui import blue
+
+from . import LOG_LEVEL
+from .le_scan import LeScanner, LeDeviceInfo, LeDevicesScanResult
+from .scan_sink import LeScanSink
+from .scan_filter import LeScanFilter
+from .ranking import rank_devices_info
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+
+class MergingSink(LeScanSink):
+    """Emits the devices discovered on several HCI devices to the sinks, one
+    thread at a time. A device is only new the first time any HCI device
+    discovers it."""
+    def __init__(self, sinks: list[LeScanSink]):
+        self.sinks = sinks
+        self.console = any(sink.console for sink in sinks)
+        self.lock = Lock()
+        self.discovered = set()
+
+    def for_iface(self, iface: str) -> LeScanSink:
+        return IfaceSink(self, iface)
+
+    def emit(self, dev_info: LeDeviceInfo, is_new_dev: bool, iface: str = None):
+        with self.lock:
+            is_new_dev = dev_info.addr_int not in self.discovered
+            self.discovered.add(dev_info.addr_int)
+            if iface is not None:
+                dev_info.heard_by = {iface: dev_info.rssi}
+            for sink in self.sinks:
+                sink.emit(dev_info, is_new_dev)
+
+
+class IfaceSink(LeScanSink):
+    def __init__(self, merging_sink: MergingSink, iface: str):
+        self.merging_sink = merging_sink
+        self.iface = iface
+        self.console = merging_sink.console
+
+    def emit(self, dev_info: LeDeviceInfo, is_new_dev: bool):
+        self.merging_sink.emit(dev_info, is_new_dev, self.iface)
+
+
+def merge_scan_results(results: dict[str, LeDevicesScanResult], sort='rssi',
+                       top: int = None) -> LeDevicesScanResult:
+    """Merge the results of HCI devices into one, deduplicated by address.
+
+    A device keeps the strongest RSSI, the AD structures of every HCI device
+    (AD types not yet seen are added), the RSSI per HCI device in heard_by and
+    the shortest discovery latency. The advertisements are counted over all
+    HCI devices.
+    """
+    merged = {}
+    for iface, result in results.items():
+        for dev_info in result.devices_info:
+            try:
+                merged_info = merged[dev_info.addr_int]
+            except KeyError:
+                merged_info = merged[dev_info.addr_int] = dev_info
+                merged_info.heard_by = {}
+            else:
+                ad_types = {ad.type for ad in merged_info.ad_structs}
+                for ad in dev_info.ad_structs:
+                    if ad.type not in ad_types:
+                        merged_info.add_ad_structs(ad)
+
+                merged_info.connectable = merged_info.connectable or dev_info.connectable
+                # An RSSI not available (None) is ignored.
+                if dev_info.rssi is not None and (merged_info.rssi is None or
+                                                  dev_info.rssi > merged_info.rssi):
+                    merged_info.rssi = dev_info.rssi
+                for attr in ('primary_phy', 'secondary_phy', 'sid', 'tx_power'):
+                    if getattr(merged_info, attr) is None:
+                        setattr(merged_info, attr, getattr(dev_info, attr))
+                merged_info.adv_count += dev_info.adv_count
+                if dev_info.last_seen is not None and (merged_info.last_seen is None or
+                                                       dev_info.last_seen > merged_info.last_seen):
+                    merged_info.last_seen = dev_info.last_seen
+                # Discovered as soon as any HCI device heard it
+                if merged_info.discovery_latency is None or (
+                        dev_info.discovery_latency is not None and
+                        dev_info.discovery_latency < merged_info.discovery_latency):
+                    merged_info.discovery_latency = dev_info.discovery_latency
+
+            merged_info.heard_by[iface] = dev_info.rssi
+
+    merged_result = LeDevicesScanResult(','.join(results))
+    for dev_info in rank_devices_info(merged.values(), sort, top):
+        merged_result.add_device_info(dev_info)
+    return merged_result
+
+
+def scan_devs_multi(ifaces: list[str], timeout=8, scan_type='active', sort='rssi',
+                    sinks: list = None, backend: str = 'bluepy', scan_filter: LeScanFilter = None,
+                    filter_dup: bool = False, scan_interval: int = None, scan_window: int = None,
+                    adaptive: bool = False, top: int = None) -> LeDevicesScanResult:
+    """Scan on all the HCI devices concurrently, return the merged result.
+    The HCI devices share the scan parameters, see LeScanner.scan_devs().
+
+    An HCI device failing is only logged, unless all of them fail.
+    """
+    if scan_type == 'active':
+        logger.warning("You might want to spoof your LE address before doing "
+                       "an active scan")
+
+    merging_sink = MergingSink(sinks) if sinks else None
+    results = {}
+    errors = {}
+
+    def scan(iface: str):
+        try:
+            results[iface] = LeScanner(iface, backend=backend, scan_interval=scan_interval,
+                                       scan_window=scan_window).scan_devs(
+                timeout, scan_type, sort,
+                None if merging_sink is None else [merging_sink.for_iface(iface)],
+                spinner=False, scan_filter=scan_filter, filter_dup=filter_dup, adaptive=adaptive)
+        except Exception as e:
+            errors[iface] = e
+
+    threads = [Thread(target=scan, args=(iface,), name=iface, daemon=True) for iface in ifaces]
+
+    spinner = Halo(text="Scanning on {} HCI devices".format(len(ifaces)), placement='right',
+                   enabled=merging_sink is None or not merging_sink.console)
+    spinner.start()
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        spinner.stop()
+
+    for iface, e in errors.items():
+        logger.warning("Scanning on {} failed, {}: {}".format(
+            blue(iface), e.__class__.__name__, e))
+    if not results:
+        raise RuntimeError("Scanning failed on all HCI devices")
+
+    # In the order of ifaces
+    return merge_scan_results({iface: results[iface] for iface in ifaces if iface in results},
+                              sort, top)
+
+
+__all__ = ['scan_devs_multi', 'merge_scan_results']
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+
+"""Incremental top-K ranking of LE devices
+
+TopK keeps a binary heap of (rank, seq, addr). Every report pushes the new
+rank of the device in O(log n) instead of re-sorting all devices, the entries
+it replaces are left in the heap and skipped when read. The heap is rebuilt
+from the current ranks once the stale entries outnumber the live ones.
+
+A rank is smaller for a higher ranked device, so the heap top is the best one.
+"""
+
+import heapq
+from typing import Callable, Hashable
+
+from ..gap_data import MANUFACTURER_SPECIFIC_DATA, company_names
+from ..oui import oui_to_company_name
+
+
+# Stale heap entries tolerated on top of the live ones before rebuilding
+COMPACT_SLACK = 64
+
+# Shortest time span an advertising rate is computed over, in seconds, so a
+# device just discovered does not rank first.
+MIN_ADV_RATE_SPAN = 1.0
+
+
+class TopK:
+    def __init__(self, rank: Callable):
+        """
+        rank - Returns the rank of an item, smaller is higher ranked.
+        """
+        self.rank = rank
+        self.heap = []
+        self.ranks = {} # addr -> (rank, seq) of the live heap entry
+        self.seq = 0 # Ties go to the device ranked earlier
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    def update(self, addr: Hashable, item):
+        rank = self.rank(item)
+        current = self.ranks.get(addr)
+        if current is not None and current[0] == rank:
+            return
+
+        self.seq += 1
+        self.ranks[addr] = (rank, self.seq)
+        heapq.heappush(self.heap, (rank, self.seq, addr))
+        if len(self.heap) > 2 * len(self.ranks) + COMPACT_SLACK:
+            self.compact()
+
+    def remove(self, addr: Hashable):
+        """The heap entry goes stale."""
+        self.ranks.pop(addr, None)
+
+    def compact(self):
+        self.heap = [(rank, seq, addr) for addr, (rank, seq) in self.ranks.items()]
+        heapq.heapify(self.heap)
+
+    def top(self, k: int = None) -> list:
+        """The addrs of the k highest ranked items, all if k is None. O(k log n)
+        plus the stale entries met, which are dropped for good."""
+        if k is None:
+            k = len(self.ranks)
+
+        live = []
+        while self.heap and len(live) < k:
+            entry = heapq.heappop(self.heap)
+            rank, seq, addr = entry
+            if self.ranks.get(addr) == (rank, seq):
+                live.append(entry)
+
+        for entry in live:
+            heapq.heappush(self.heap, entry)
+        return [addr for _, _, addr in live]
+
+
+def dev_vendor(addr: str, addr_type: str, ad_structs: list) -> str:
+    """The company of Manufacturer Specific Data, or of the OUI of a public
+    address. '' if unknown."""
+    for ad in ad_structs:
+        if ad.type == MANUFACTURER_SPECIFIC_DATA and len(ad.value) >= 2:
+            company_id = int.from_bytes(ad.value[:2], 'little')
+            if company_id in company_names:
+                return company_names[company_id]
+
+    if addr_type == 'public':
+        return oui_to_company_name(int(addr.replace(':', '')[:6], base=16)) or ''
+    return ''
+
+
+def adv_rate(adv_count: int, first_seen: float, last_seen: float) -> float:
+    """Advertisements per second"""
+    return adv_count / max(last_seen - first_seen, MIN_ADV_RATE_SPAN)
+
+
+def rssi_rank(rssi: int | None) -> tuple[bool, int]:
+    """The strongest first, the ones without an RSSI available last"""
+    return (rssi is None, 0 if rssi is None else -rssi)
+
+
+def vendor_rank(vendor: str) -> tuple[bool, str]:
+    """Alphabetically, the unknown ones last"""
+    return (vendor == '', vendor.lower())
+
+
+# Ranks of a LeDeviceRecord by --sort key
+record_ranks = {
+    'rssi':      lambda record: rssi_rank(record.rssi),
+    'last-seen': lambda record: -record.last_seen,
+    'adv-rate':  lambda record: -adv_rate(record.adv_count, record.first_seen, record.last_seen),
+    'vendor':    lambda record: vendor_rank(record.vendor),
+}
+
+# Ranks of a LeDeviceInfo of a scan result by --sort key
+dev_info_ranks = {
+    'rssi':      lambda dev_info: rssi_rank(dev_info.rssi),
+    'last-seen': lambda dev_info: -(dev_info.last_seen or 0.0),
+    'adv-rate':  lambda dev_info: -dev_info.adv_rate,
+    'vendor':    lambda dev_info: vendor_rank(dev_info.vendor),
+}
+
+SORT_KEYS = tuple(record_ranks)
+
+
+def rank_devices_info(devices_info: list, sort: str = None, top: int = None) -> list:
+    """Return the top devices of a scan result by sort, all if top is None.
+    The highest ranked one is the last, printed next to the prompt.
+
+    devices_info - [LeDeviceInfo], in no particular order
+    """
+    if sort is None:
+        return list(devices_info)[:top]
+
+    rank = dev_info_ranks[sort]
+    if top is None:
+        ranked = sorted(devices_info, key=rank)
+    else:
+        # O(n log k)
+        ranked = heapq.nsmallest(top, devices_info, key=rank)
+    ranked.reverse()
+    return ranked
+
+
+__all__ = ['TopK', 'SORT_KEYS', 'record_ranks', 'dev_info_ranks', 'rank_devices_info',
+           'dev_vendor', 'adv_rate', 'rssi_rank', 'vendor_rank']
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""Filtering of LE advertising reports by address, address type and RSSI
+
+With the hci backend the addresses are put in the Filter Accept List of the
+controller, so the other devices are not even reported to the host. What the
+controller can not filter is checked as the first step of handling a report,
+before any scan entry is created or any data is parsed.
+"""
+
+from bthci import ADDR_TYPE_PUBLIC, ADDR_TYPE_RANDOM
+
+
+class LeScanFilter:
+    def __init__(self, addrs: list[str] = None, addr_type: str = None,
+                 min_rssi: int = None):
+        """
+        addrs     - Only report these devices
+        addr_type - Only report devices of 'public' or 'random' addresses
+        min_rssi  - Only report advertisements at least this strong, in dBm
+        """
+        if addr_type is not None and addr_type not in ('public', 'random'):
+            raise ValueError("Invalid address type: {}".format(addr_type))
+
+        self.addrs = None if addrs is None else {addr.lower() for addr in addrs}
+        self.addr_type = addr_type
+        self.min_rssi = min_rssi
+
+    def __bool__(self) -> bool:
+        return self.addrs is not None or self.addr_type is not None or \
+            self.min_rssi is not None
+
+    def accept(self, addr: str, addr_type: str, rssi: int) -> bool:
+        """
+        addr - In lowercase, as bluepy.btle.ScanEntry.addr
+        """
+        if self.min_rssi is not None and rssi is not None and rssi < self.min_rssi:
+            return False
+        if self.addrs is not None and addr not in self.addrs:
+            return False
+        if self.addr_type is not None and addr_type != self.addr_type:
+            return False
+        return True
+
+    def accept_list(self) -> list[tuple[str, int]] | None:
+        """The [(BD_ADDR, Address_Type)] for the Filter Accept List of the
+        controller, None if all addresses are wanted."""
+        if self.addrs is None:
+            return None
+
+        if self.addr_type == 'public':
+            addr_types = (ADDR_TYPE_PUBLIC,)
+        elif self.addr_type == 'random':
+            addr_types = (ADDR_TYPE_RANDOM,)
+        else:
+            addr_types = (ADDR_TYPE_PUBLIC, ADDR_TYPE_RANDOM)
+
+        return [(addr, addr_type) for addr in sorted(self.addrs) for addr_type in addr_types]
+
+
+__all__ = ['LeScanFilter']
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+import sys
+import json
+import time
+
+from xpycommon.log import Logger
+from xpycommon.ui import blue, green
+
+from . import LOG_LEVEL
+from .le_scan import LeDeviceInfo, pp_le_dev_info
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+
+class LeScanSink:
+    """Receives LE devices during a scan, as soon as they are discovered."""
+    # Whether the sink writes to the console
+    console = False
+
+    def emit(self, dev_info: LeDeviceInfo, is_new_dev: bool):
+        """
+        is_new_dev - False if only the advertisement of a known device changed.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ConsoleSink(LeScanSink):
+    console = True
+
+    def emit(self, dev_info: LeDeviceInfo, is_new_dev: bool):
+        print(green("[New]") if is_new_dev else blue("[Updated]"))
+        pp_le_dev_info(dev_info)
+
+
+class JsonLinesSink(LeScanSink):
+    """Writes one JSON object per line, `-` means stdout."""
+    def __init__(self, path: str):
+        self.path = path
+        self.console = path == '-'
+        self.file = sys.stdout if path == '-' else open(path, 'a')
+
+    def emit(self, dev_info: LeDeviceInfo, is_new_dev: bool):
+        record = {
+            'time': time.time(),
+            'new': is_new_dev,
+        }
+        record.update(dev_info.to_dict())
+        self.write(record)
+
+    def write(self, record: dict):
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+__all__ = ['LeScanSink', 'ConsoleSink', 'JsonLinesSink']
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+"""Surveys of many LE peers in one run
+
+The targets are shared by one worker thread per HCI device. A worker opens
+its HCI device (or SecurityManager) once and goes through the targets one
+after another, as the controller only creates one LE connection at a time. A target failing is
+recorded in its result, the others go on.
+"""
+
+import time
+import sqlite3
+from pathlib import Path
+from queue import Queue, Empty
+from threading import Thread
+from typing import Callable, NamedTuple
+
+from bthci import HCI, ADDR_TYPE_PUBLIC, ADDR_TYPE_RANDOM
+from btsm import SecurityManager
+from halo import Halo
+from xpycommon.log import Logger
+from xpycommon.ui import blue, green, red, INDENT
+from xpycommon.bluetooth import BD_ADDR
+
+from .. import ScanResult
+from ..feature_bits import LE_FEATURES
+from ..fingerprint_cache import DEFAULT_MAX_AGE, TRANSPORT_LE, load_fingerprints, \
+                                store_fingerprints
+from . import LOG_LEVEL
+from .le_scan import LeScanner, read_ll_features, request_pairing_feature, ll_fingerprint
+from .scan_filter import LeScanFilter
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+ADDR_TYPES = {
+    'public': ADDR_TYPE_PUBLIC,
+    'random': ADDR_TYPE_RANDOM,
+}
+
+
+def load_targets(path: str) -> list[tuple[str, int | None]]:
+    """Read a target list, one `BD_ADDR [public|random]` per line. Empty
+    lines and lines starting with # are skipped."""
+    targets = []
+    for lineno, line in enumerate(Path(path).read_text().splitlines(), 1):
+        fields = line.split('#', 1)[0].split()
+        if not fields:
+            continue
+
+        addr = fields[0]
+        if not BD_ADDR.verify(addr) or len(fields) > 2 or \
+                (len(fields) == 2 and fields[1].lower() not in ADDR_TYPES):
+            raise ValueError("Invalid target at {}:{}: {}".format(path, lineno, red(line)))
+        targets.append((addr.upper(), ADDR_TYPES[fields[1].lower()] if len(fields) == 2 else None))
+    return targets
+
+
+def resolve_addr_types(iface: str, targets: list[tuple[str, int | None]],
+                       backend: str = 'bluepy', timeout: int = 10) -> list[tuple[str, int]]:
+    """Fill in the unknown address types, from the LE address type cache first.
+    The targets still unknown are scanned for all at once, only them. A target
+    not found is assumed to be public."""
+    resolved = {}
+    unknown = []
+    for addr, addr_type in targets:
+        if addr_type is not None:
+            resolved[addr] = addr_type
+            continue
+        try:
+            cached = LeScanner.cached_addr_to_atype(addr)
+        except (FileNotFoundError, sqlite3.Error):
+            # No cache yet, or it can not be read.
+            cached = None
+        if cached is None:
+            unknown.append(addr)
+        else:
+            resolved[addr] = ADDR_TYPES[cached]
+
+    if unknown:
+        logger.info("Scanning for the address types of {} targets".format(blue(str(len(unknown)))))
+        scan_result = LeScanner(iface, backend=backend).scan_devs(
+            timeout, 'passive', None, scan_filter=LeScanFilter(unknown))
+        scan_result.store()
+        for dev_info in scan_result.devices_info:
+            resolved[dev_info.addr] = ADDR_TYPES[dev_info.addr_type]
+
+        for addr in unknown:
+            if addr not in resolved:
+                logger.warning("{} not discovered, assumed to be public".format(blue(addr)))
+                resolved[addr] = ADDR_TYPE_PUBLIC
+
+    return [(addr, resolved[addr]) for addr, _ in targets]
+
+
+class SurveyEntry(NamedTuple):
+    addr: str
+    addr_type: int
+    iface: str # The HCI device it was surveyed on
+    result: object # None if failed
+    error: str | None
+    elapsed: float # sec
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        return {
+            'addr': self.addr,
+            'addr_type': 'random' if self.addr_type == ADDR_TYPE_RANDOM else 'public',
+            'iface': self.iface,
+            'error': self.error,
+            'elapsed': self.elapsed,
+        }
+
+
+def survey(ifaces: list[str], targets: list[tuple[str, int]],
+           work: Callable[[object, str, int], object],
+           open_session: Callable[[str], object], close_session: Callable[[object], None],
+           text: str = "Surveying") -> list[SurveyEntry]:
+    """Run work(session, addr, addr_type) for each target, one worker per HCI
+    device, each with its session opened once by open_session(iface).
+
+    Return the entries in the order of targets.
+    """
+    queue = Queue()
+    for idx, target in enumerate(targets):
+        queue.put((idx, target))
+    entries = [None] * len(targets)
+
+    def worker(iface: str):
+        try:
+            session = open_session(iface)
+        except Exception as e:
+            logger.warning("Failed to open {}, {}: {}".format(blue(iface), e.__class__.__name__, e))
+            return
+
+        try:
+            while True:
+                try:
+                    idx, (addr, addr_type) = queue.get_nowait()
+                except Empty:
+                    break
+
+                start = time.monotonic()
+                try:
+                    result, error = work(session, addr, addr_type), None
+                except Exception as e:
+                    result, error = None, "{}: {}".format(e.__class__.__name__, e)
+                entries[idx] = SurveyEntry(addr, addr_type, iface, result, error,
+                                           time.monotonic() - start)
+                logger.debug("{} on {}: {}".format(addr, iface, error or 'done'))
+        finally:
+            close_session(session)
+
+    threads = [Thread(target=worker, args=(iface,), name=iface, daemon=True) for iface in ifaces]
+
+    spinner = Halo(text="{} {} targets on {} HCI devices".format(text, len(targets), len(ifaces)),
+                   placement='right')
+    spinner.start()
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        spinner.stop()
+
+    # Left by the workers that failed to open their HCI device
+    for idx, (addr, addr_type) in enumerate(targets):
+        if entries[idx] is None:
+            entries[idx] = SurveyEntry(addr, addr_type, None, None, "Not surveyed", 0.0)
+    return entries
+
+
+class LlFeatureSurveyResult(ScanResult):
+    def __init__(self, entries: list[SurveyEntry]):
+        """
+        entries - Results are the LE features as bytes
+        """
+        super().__init__('LL Features Survey')
+        self.entries = entries
+
+    def print(self):
+        print(INDENT + "{:<17}  {:<6}  {:<6}  {:>7}  {}".format(
+            'Addr', 'Type', 'HCI', 'Time', 'LE features / Error'))
+        for entry in self.entries:
+            print(INDENT + "{:<17}  {:<6}  {:<6}  {:>6.1f}s  {}".format(
+                entry.addr, 'random' if entry.addr_type == ADDR_TYPE_RANDOM else 'public',
+                entry.iface or '-', entry.elapsed,
+                green(entry.result.hex()) if entry.ok else red(entry.error)))
+
+        num_ok = sum(entry.ok for entry in self.entries)
+        print()
+        print("{} of {} targets read, {} failed".format(
+            blue(str(num_ok)), len(self.entries), len(self.entries) - num_ok))
+
+    def to_dicts(self) -> list[dict]:
+        dicts = []
+        for entry in self.entries:
+            d = entry.to_dict()
+            d['le_features'] = entry.result.hex() if entry.ok else None
+            d['le_features_supported'] = LE_FEATURES.decode(entry.result).supported() \
+                if entry.ok else None
+            dicts.append(d)
+        return dicts
+
+
+def survey_ll_features(ifaces: list[str], targets: list[tuple[str, int | None]],
+                       timeout: int = 10, backend: str = 'bluepy',
+                       max_age: float = DEFAULT_MAX_AGE) -> LlFeatureSurveyResult:
+    """The targets read within max_age seconds are served from the fingerprint
+    cache, on HCI device 'cache'. Only the others have their unknown address
+    types resolved and are connected."""
+    cached = load_fingerprints([addr for addr, _ in targets], TRANSPORT_LE, max_age)
+    stale = [(addr, addr_type) for addr, addr_type in targets if addr not in cached]
+    if cached:
+        logger.info("{} of {} targets served from the fingerprint cache".format(
+            blue(str(len(targets) - len(stale))), len(targets)))
+
+    read = {}
+    if stale:
+        for iface in ifaces:
+            hci = HCI(iface)
+            hci.clean_up_running()
+            hci.close()
+
+        stale = resolve_addr_types(ifaces[0], stale, backend, timeout)
+
+        def open_hci(iface: str) -> HCI:
+            return HCI(iface)
+
+        def close_hci(hci: HCI):
+            hci.close()
+
+        for entry in survey(ifaces, stale,
+                lambda hci, addr, addr_type: read_ll_features(hci, addr, addr_type, timeout),
+                open_hci, close_hci, "Reading LL features of"):
+            read[entry.addr] = entry
+        store_fingerprints([ll_fingerprint(entry.addr, entry.addr_type, entry.result)
+                            for entry in read.values() if entry.ok])
+
+    entries = []
+    for addr, addr_type in targets:
+        if addr in read:
+            entries.append(read[addr])
+        else:
+            fp = cached[addr]
+            entries.append(SurveyEntry(addr, fp.addr_type if addr_type is None else addr_type,
+                                       'cache', fp.features[0], None, 0.0))
+    return LlFeatureSurveyResult(entries)
+
+
+class PairingFeatureSurveyResult(ScanResult):
+    def __init__(self, entries: list[SurveyEntry]):
+        """
+        entries - Results are the Pairing Responses from btsm
+        """
+        super().__init__('Pairing Feature Survey')
+        self.entries = entries
+
+    def print(self):
+        print(INDENT + "{:<17}  {:<6}  {:<6}  {:>7}  {}".format(
+            'Addr', 'Type', 'HCI', 'Time', 'Result'))
+        for entry in self.entries:
+            print(INDENT + "{:<17}  {:<6}  {:<6}  {:>6.1f}s  {}".format(
+                entry.addr, 'random' if entry.addr_type == ADDR_TYPE_RANDOM else 'public',
+                entry.iface or '-', entry.elapsed,
+                green('Pairing Response') if entry.ok else red(entry.error)))
+
+        num_ok = sum(entry.ok for entry in self.entries)
+        print()
+        print("{} of {} targets responded, {} failed".format(
+            blue(str(num_ok)), len(self.entries), len(self.entries) - num_ok))
+
+        for entry in self.entries:
+            if entry.ok:
+                print()
+                print(entry.result.to_human_readable_str(
+                    title="{} {}".format(blue("Pairing Response of"), blue(entry.addr))))
+
+    def to_dicts(self) -> list[dict]:
+        dicts = []
+        for entry in self.entries:
+            d = entry.to_dict()
+            d['pairing_response'] = entry.result.to_human_readable_str(title="Pairing Response") \
+                if entry.ok else None
+            dicts.append(d)
+        return dicts
+
+
+def survey_pairing_features(ifaces: list[str], targets: list[tuple[str, int]],
+                            timeout: int = 10) -> PairingFeatureSurveyResult:
+    """One SecurityManager per HCI device is reused for all its targets, only
+    connected and disconnected for each."""
+    def request(sm: SecurityManager, addr: str, addr_type: int):
+        sm.connect(addr, addr_type)
+        try:
+            return request_pairing_feature(sm, timeout)
+        finally:
+            sm.disconnect()
+
+    def close_sm(sm: SecurityManager):
+        sm.close()
+
+    return PairingFeatureSurveyResult(survey(ifaces, targets, request, SecurityManager, close_sm,
+                                             "Requesting pairing feature of"))
+
+
+__all__ = ['load_targets', 'resolve_addr_types', 'survey', 'SurveyEntry',
+           'LlFeatureSurveyResult', 'survey_ll_features',
+           'PairingFeatureSurveyResult', 'survey_pairing_features']
@@ -3,32 +3,83 @@
 r"""
 Usage:
     bluing le [-h | --help]
-    bluing le [-i <hci>] [--scan-type=<type>] [--timeout=<sec>] [--sort=<key>] --scan
-    bluing le [-i <hci>] --pairing-feature [--timeout=<sec>] [--addr-type=<type>] PEER_ADDR
-    bluing le [-i <hci>] --ll-feature-set [--timeout=<sec>] [--addr-type=<type>] PEER_ADDR
-    bluing le [-i <hci>] --gatt [--io-cap=<name>] [--addr-type=<type>] PEER_ADDR
+    bluing le [-i <hci>] [--backend=<name>] [--scan-type=<type>] [--timeout=<sec>] [--sort=<key>] [--top=<n>] [--scan-interval=<ms>] [--scan-window=<ms>] [--adaptive] [--filter-addr=<addrs>] [--filter-addr-type=<type>] [--min-rssi=<dbm>] [--filter-dup] [--stream] [--jsonl=<path>] --scan
+    bluing le [-i <hci>] [--backend=<name>] [--scan-type=<type>] [--max-devs=<n>] [--idle-timeout=<sec>] [--report-interval=<sec>] [--rssi-history=<n>] [--sort=<key>] [--top=<n>] [--scan-interval=<ms>] [--scan-window=<ms>] [--filter-addr=<addrs>] [--filter-addr-type=<type>] [--min-rssi=<dbm>] [--filter-dup] [--stream] [--jsonl=<path>] --monitor
+    bluing le [-i <hci>] [--backend=<name>] --pairing-feature [--timeout=<sec>] [--addr-type=<type>] [--targets=<path>] [--jsonl=<path>] [PEER_ADDR...]
+    bluing le [-i <hci>] [--backend=<name>] --ll-feature-set [--timeout=<sec>] [--max-age=<sec>] [--addr-type=<type>] [--targets=<path>] [--jsonl=<path>] [PEER_ADDR...]
+    bluing le [-i <hci>] [--backend=<name>] --gatt [--io-cap=<name>] [--addr-type=<type>] [--no-cache] PEER_ADDR
     bluing le [-i <hci>] --local --gatt
     bluing le [-i <hci>] --mon-incoming-conn
     bluing le [--device=</dev/tty>] [--channel=<num>] --sniff-adv
 
 Arguments:
-    PEER_ADDR    LE Bluetooth device address
+    PEER_ADDR    LE Bluetooth device address. --ll-feature-set and 
+                 --pairing-feature take several ones
 
 Options:
     -h, --help            Print this help and quit
-    -i <hci>              HCI device
+    -i <hci>              HCI device. --scan can scan on several ones at the 
+                          same time, comma separated (e.g., hci0,hci1). 
+                          --ll-feature-set and --pairing-feature share the 
+                          targets between them
     --scan                Discover advertising devices nearby
+    --backend=<name>      How LE devices are scanned. bluepy (via bluepy-helper) 
+                          or hci (directly on the HCI socket, also receives 
+                          extended advertising if the controller supports it) 
+                          [default: bluepy]
     --scan-type=<type>    The type of scan to perform. active or passive [default: active]
-    --sort=<key>          Sort the discovered devices by key, only support RSSI 
-                          now [default: rssi]
-    --ll-feature-set      Read LL FeatureSet of a remote LE device
-    --pairing-feature     Request the pairing feature of a remote LE device
+    --sort=<key>          Sort the discovered devices by key, rssi, last-seen, 
+                          adv-rate or vendor [default: rssi]
+    --top=<n>             Only print the top n devices by --sort
+    --scan-interval=<ms>  LE scan interval, 2.5 to 10240 ms (hci backend only). 
+                          10 ms if not given
+    --scan-window=<ms>    LE scan window, no longer than the interval (hci 
+                          backend only). The interval if not given
+    --adaptive            Start at the duty cycle of the scan window/interval 
+                          and halve the window, down to 1/8 of the interval, 
+                          once no new devices are discovered for a while 
+                          (hci backend only)
+    --filter-addr=<addrs> Only scan these devices, comma separated. With the hci 
+                          backend the controller filters them
+    --filter-addr-type=<type>
+                          Only scan devices of public or random addresses
+    --min-rssi=<dbm>      Ignore advertisements weaker than this RSSI
+    --filter-dup          Let the controller drop duplicate advertisements 
+                          (hci backend only). The RSSI and the data changes 
+                          of a device may be missed
+    --stream              Print each new device and each changed advertisement 
+                          as soon as it is received
+    --jsonl=<path>        Write each new device and each changed advertisement 
+                          to a JSON Lines file as soon as it is received, or 
+                          one line per target of a survey, `-` for stdout
+    --monitor             Scan indefinitely and keep a table of the devices 
+                          seen recently
+    --max-devs=<n>        Maximum number of devices tracked by --monitor [default: 1000]
+    --idle-timeout=<sec>  Forget devices not seen for this long [default: 300]
+    --report-interval=<sec>
+                          Interval of printing the device table [default: 10]
+    --rssi-history=<n>    Number of the latest RSSIs kept per device by 
+                          --monitor for the statistics [default: 64]
+    --ll-feature-set      Read LL FeatureSet of a remote LE device, or survey 
+                          several ones
+    --targets=<path>      File of the remote LE devices to survey, one 
+                          `PEER_ADDR [public|random]` per line
+    --max-age=<sec>       Serve the LL FeatureSet read within this long from 
+                          the fingerprint cache, 0 to always read it [default: 86400]
+    --pairing-feature     Request the pairing feature of a remote LE device, 
+                          or survey several ones
     --timeout=<sec>       Duration of the LE scanning, but may not be precise [default: 10]
     --gatt                Discover GATT Profile hierarchy of a remote LE device
+    --no-cache            Rediscover the GATT Profile hierarchy even if the 
+                          cached one is unchanged. By default only the values 
+                          are read again if the Database Hash (or else the 
+                          primary services) of the device is unchanged
     --io-cap=<name>       Set an IO Capability of the agent. Available value: 
                               DisplayOnly, DisplayYesNo, KeyboardOnly, NoInputNoOutput, 
                               KeyboardDisplay [default: NoInputNoOutput]
-    --addr-type=<type>    Type of the LE address, public or random
+    --addr-type=<type>    Type of the LE address, public or random. If not 
+                          given, it is looked up in the devices seen before, 
+                          or found by scanning until PEER_ADDR is discovered
     --sniff-adv           Sniff advertising physical channel PDU. Need at least 
                           one micro:bit (or other supported NRF51 device specified with --device)
     --channel=<num>       LE advertising physical channel, 37, 38 or 39 [default: 37,38,39]
@@ -41,18 +92,60 @@ import sys
 from collections import Counter
 
 from xpycommon.log import Logger
-from xpycommon.ui import blue, yellow, red
+from xpycommon.ui import red
 from xpycommon.bluetooth import BD_ADDR
 from docopt import docopt
-from bthci import ADDR_TYPE_PUBLIC, ADDR_TYPE_RANDOM, HCI
+from bthci import HCI
 
 from . import LOG_LEVEL, PKG_NAME
 from .le_scan import LeScanner
+from .scan_filter import LeScanFilter
+from .ranking import SORT_KEYS
+from .survey import ADDR_TYPES, load_targets
+from .hci_scan import DEFAULT_SCAN_INTERVAL, MIN_SCAN_INTERVAL, MAX_SCAN_INTERVAL
 
 
 logger = Logger(__name__, LOG_LEVEL)
 
 
+def parse_int_opt(opt: str, value: str) -> int:
+    """Parse the value of an integer option, decimal or hexadecimal."""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(value, base=16)
+        except ValueError as e:
+            e.args = ("Invalid {}: {}".format(opt, red(value)),)
+            raise e
+
+
+def parse_scan_timing(args: dict):
+    """Convert --scan-interval and --scan-window in ms to args['scan_interval']
+    and args['scan_window'] in units of 0.625 ms, None if not given."""
+    args['scan_interval'] = args['scan_window'] = None
+    if args['--scan-interval'] is None and args['--scan-window'] is None:
+        return
+
+    for opt in ('--scan-interval', '--scan-window'):
+        if args[opt] is None:
+            continue
+        try:
+            units = round(float(args[opt]) / 0.625)
+        except ValueError:
+            raise ValueError("Invalid {}: {}".format(opt, red(args[opt])))
+        if not MIN_SCAN_INTERVAL <= units <= MAX_SCAN_INTERVAL:
+            raise ValueError("{} out of range: {}".format(opt, red(args[opt])))
+        args[opt.lstrip('-').replace('-', '_')] = units
+
+    if args['scan_interval'] is None:
+        args['scan_interval'] = DEFAULT_SCAN_INTERVAL
+    if args['scan_window'] is None:
+        args['scan_window'] = args['scan_interval']
+    if args['scan_window'] > args['scan_interval']:
+        raise ValueError("--scan-window is longer than the interval: " + red(args['--scan-window']))
+
+
 def parse_cmdline(argv: list[str] = sys.argv[1:]) -> dict:
     logger.debug("Entered parse_cmdline(argv={})".format(argv))
 
@@ -70,16 +163,28 @@ def parse_cmdline(argv: list[str] = sys.argv[1:]) -> dict:
         # (`-i` is `None`), in order to determine whether to use the default HCI 
         # device (need call `clean_up_running()`) or not need the HCI device at all,
         # we can use other options to assist the determination.
-        hci_demander_counter = Counter([args['--scan'], args['--ll-feature-set'], 
+        hci_demander_counter = Counter([args['--scan'], args['--monitor'], args['--ll-feature-set'], 
                                         args['--pairing-feature'], args['--gatt'], 
                                         args['--mon-incoming-conn']])
         if hci_demander_counter[True] == 1:
             if args['-i'] is None:
                 args['-i'] = HCI.get_default_iface()
-           
-            hci = HCI(args['-i'])
-            hci.clean_up_running()
-            hci.close()
+
+            # --scan and surveys may run on several HCI devices, e.g. -i hci0,hci1
+            args['ifaces'] = args['-i'].split(',')
+            if len(args['ifaces']) > 1 and not (args['--scan'] or args['--ll-feature-set'] or 
+                                                args['--pairing-feature']):
+                raise ValueError("Only --scan and the surveys support several HCI devices: " + 
+                                 red(args['-i']))
+            args['-i'] = args['ifaces'][0]
+
+            # The --ll-feature-set targets may be served from the fingerprint
+            # cache, the HCI devices are cleaned up only once one is read.
+            if not args['--ll-feature-set']:
+                for iface in args['ifaces']:
+                    hci = HCI(iface)
+                    hci.clean_up_running()
+                    hci.close()
 
         args['--scan-type'] = args['--scan-type'].lower()
         if args['--scan-type'] not in ('active', 'passive'):
@@ -87,49 +192,94 @@ def parse_cmdline(argv: list[str] = sys.argv[1:]) -> dict:
         elif args['--scan-type'] == 'active':
             pass
         
+        args['--backend'] = args['--backend'].lower()
+        if args['--backend'] not in ('bluepy', 'hci'):
+            raise ValueError("Invalid --backend: " + red(args['--backend']))
+
         args['--sort'] = args['--sort'].lower()
-        if args['--sort'] != "rssi":
+        if args['--sort'] not in SORT_KEYS:
             raise ValueError("Invalid --sort: " + red(args['--sort']))
+
+        if args['--top'] is not None:
+            args['--top'] = parse_int_opt('--top', args['--top'])
+            if args['--top'] < 1:
+                raise ValueError("Invalid --top: " + red(str(args['--top'])))
         
-        try:
-            args['--timeout'] = int(args['--timeout'])
-        except ValueError:
-            try:
-                args['--timeout'] = int(args['--timeout'], base=16)
-            except ValueError as e:
-                e.args = ("Invalid --timeout: " + red(args['--timeout']),)
-                raise e
+        for opt in ('--timeout', '--max-devs', '--idle-timeout', '--report-interval',
+                    '--rssi-history', '--max-age'):
+            args[opt] = parse_int_opt(opt, args[opt])
+        if args['--max-age'] < 0:
+            raise ValueError("Invalid --max-age: " + red(str(args['--max-age'])))
+        if args['--rssi-history'] < 1:
+            raise ValueError("Invalid --rssi-history: " + red(str(args['--rssi-history'])))
+
+        if args['--filter-addr'] is not None:
+            args['--filter-addr'] = args['--filter-addr'].split(',')
+            for addr in args['--filter-addr']:
+                if not BD_ADDR.verify(addr):
+                    raise ValueError("Invalid --filter-addr: " + red(addr))
+        if args['--filter-addr-type'] is not None:
+            args['--filter-addr-type'] = args['--filter-addr-type'].lower()
+            if args['--filter-addr-type'] not in ('public', 'random'):
+                raise ValueError("Invalid --filter-addr-type: " + red(args['--filter-addr-type']))
+        if args['--min-rssi'] is not None:
+            args['--min-rssi'] = parse_int_opt('--min-rssi', args['--min-rssi'])
+        parse_scan_timing(args)
+
+        args['scan_filter'] = LeScanFilter(args['--filter-addr'], args['--filter-addr-type'], 
+                                           args['--min-rssi'])
 
         if args['--io-cap'] not in ['DisplayOnly', 'DisplayYesNo', 'KeyboardOnly', 
                                     'NoInputNoOutput', 'KeyboardDisplay']:
             raise ValueError("Invalid --io-cap: " + red(args['--io-cap']))
 
+        # PEER_ADDR is a list, as --ll-feature-set takes several ones.
+        if args['PEER_ADDR'] is None:
+            args['PEER_ADDR'] = []
+        elif isinstance(args['PEER_ADDR'], str):
+            args['PEER_ADDR'] = [args['PEER_ADDR']]
+        for addr in args['PEER_ADDR']:
+            if not BD_ADDR.verify(addr):
+                raise ValueError("Invalid PEER_ADDR: " + red(addr))
+        args['targets'] = [(addr.upper(), None) for addr in args['PEER_ADDR']]
+        if args['--targets'] is not None:
+            args['targets'] += load_targets(args['--targets'])
+
+        surveyable = args['--ll-feature-set'] or args['--pairing-feature']
+        if surveyable and not args['targets']:
+            raise ValueError("No PEER_ADDR or --targets given")
+        elif len(args['PEER_ADDR']) > 1 and not surveyable:
+            raise ValueError("Only --ll-feature-set and --pairing-feature support several PEER_ADDRs")
+
+        # A survey of several targets, their address types are resolved all
+        # at once later. A single target is handled as before, unless its
+        # result is to be written to --jsonl.
+        args['survey'] = surveyable and (
+            len(args['targets']) > 1 or args['--targets'] is not None or 
+            len(args.get('ifaces', [])) > 1 or args['--jsonl'] is not None)
+        if args['survey']:
+            args['PEER_ADDR'] = None
+            if args['--addr-type'] is not None:
+                addr_type = ADDR_TYPES.get(args['--addr-type'].lower())
+                if addr_type is None:
+                    raise ValueError("Invalid --addr-type: " + red(args['--addr-type']))
+                args['targets'] = [(addr, addr_type if atype is None else atype) 
+                                   for addr, atype in args['targets']]
+        else:
+            args['PEER_ADDR'] = args['targets'][0][0] if args['targets'] else None
+
         if args['PEER_ADDR'] is not None:
-            if not BD_ADDR.verify(args['PEER_ADDR']):
-                raise ValueError("Invalid PEER_ADDR: " + red(args['BD_ADDR']))
-            args['PEER_ADDR'] = args['PEER_ADDR'].upper()
-
-            if args['--addr-type'] is None:
-                logger.info("Automatically determining the address type of", blue(args['PEER_ADDR']))
-                
-                try:
-                    args['--addr-type'] = LeScanner.determine_addr_type(
-                        args['-i'], args['PEER_ADDR'])
-                    logger.info("{} is a {} address".format(
-                        blue(args['PEER_ADDR']), blue(args['--addr-type'])))
-                except Exception as e:
-                    logger.warning("{}: {}\n"
-                                   "    Assumed to be {}".format(
-                                       e.__class__.__name__, e, yellow('public')))
-                    args['--addr-type'] = 'public'
-            
-            args['--addr-type'] = args['--addr-type'].lower()
-            if args['--addr-type'] == 'public':
-                args['--addr-type'] = ADDR_TYPE_PUBLIC
-            elif args['--addr-type'] == 'random':
-                args['--addr-type'] = ADDR_TYPE_RANDOM
-            else:
-                raise ValueError("Invalid --addr-type: " + red(args['--addr-type']))
+
+            # Left unknown to read_ll_feature_set(), which only determines it
+            # if the target is not in the fingerprint cache.
+            if args['--addr-type'] is not None:
+                addr_type = ADDR_TYPES.get(args['--addr-type'].lower())
+                if addr_type is None:
+                    raise ValueError("Invalid --addr-type: " + red(args['--addr-type']))
+                args['--addr-type'] = addr_type
+            elif not args['--ll-feature-set']:
+                args['--addr-type'] = LeScanner(
+                    args['-i'], backend=args['--backend']).resolve_addr_type(args['PEER_ADDR'])
 
         try:
             args['--channel'] =  [int(n) for n in args['--channel'].split(',')]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+r"""Compiled index of the IEEE OUI list
+
+res/oui.txt is compiled into res/oui.idx, which is memory-mapped and binary
+searched on demand instead of being parsed on every run. All integers in the
+index are big-endian:
+
+    Header     Magic b'OUI\x00' (4 octets), version (2 octets),
+               Num_Records (4 octets)
+    Records    Num_Records * 8 octets, sorted by OUI. Each record is
+                   OUI (3 octets), name offset (4 octets), name length (1 octet)
+    Names      UTF-8 encoded organization names
+
+Usage:
+    python -m bluing.oui [<oui.txt> [<oui.idx>]]
+"""
+
+import sys
+import mmap
+import struct
+from pathlib import Path
+
+
+OUI_TXT_PATH = Path(__file__).parent/'res'/'oui.txt'
+OUI_IDX_PATH = Path(__file__).parent/'res'/'oui.idx'
+
+IDX_MAGIC = b'OUI\x00'
+IDX_VERSION = 1
+IDX_HEADER = struct.Struct('>4sHI')
+IDX_RECORD = struct.Struct('>3sIB')
+
+_index = None
+
+
+def parse_oui_txt(path: Path) -> dict[int, str]:
+    """Return {24-bit OUI: organization name} of an IEEE oui.txt"""
+    oui_company_names = {}
+
+    with open(path, encoding='utf-8') as oui_file:
+        for line in oui_file:
+            items = line.strip().split('\t\t')
+            if len(items) == 2 and '   (hex)' in items[0]:
+                oui = int(items[0].removesuffix('   (hex)').replace('-', ''), base=16)
+                oui_company_names[oui] = items[1]
+
+    return oui_company_names
+
+
+def build_index(oui_company_names: dict[int, str]) -> bytes:
+    records = bytearray()
+    names = bytearray()
+    name_offsets = {}
+
+    for oui in sorted(oui_company_names):
+        # Names longer than 255 octets are truncated, such names do not exist
+        # in practice.
+        name = oui_company_names[oui].encode('utf-8')[:0xFF]
+        try:
+            offset = name_offsets[name]
+        except KeyError:
+            offset = name_offsets[name] = len(names)
+            names += name
+        records += IDX_RECORD.pack(oui.to_bytes(3, 'big'), offset, len(name))
+
+    return IDX_HEADER.pack(IDX_MAGIC, IDX_VERSION, len(oui_company_names)) \
+        + records + names
+
+
+def compile_oui(txt_path: Path = OUI_TXT_PATH, idx_path: Path = OUI_IDX_PATH):
+    """The build step that compiles oui.txt into oui.idx"""
+    idx_path = Path(idx_path)
+    tmp_path = idx_path.with_name(idx_path.name + '.tmp')
+    tmp_path.write_bytes(build_index(parse_oui_txt(txt_path)))
+    tmp_path.replace(idx_path)
+
+
+def map_index(idx_path: Path = OUI_IDX_PATH) -> mmap.mmap | None:
+    """Memory-map an index, None if it is missing, truncated or of another
+    version."""
+    try:
+        with open(idx_path, 'rb') as idx_file:
+            index = mmap.mmap(idx_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # ValueError: An empty file cannot be mapped.
+        return None
+
+    try:
+        magic, version, num_records = IDX_HEADER.unpack_from(index)
+    except struct.error:
+        magic, version, num_records = None, None, 0
+    if magic != IDX_MAGIC or version != IDX_VERSION or \
+            len(index) < IDX_HEADER.size + num_records * IDX_RECORD.size:
+        index.close()
+        return None
+
+    return index
+
+
+def load_index():
+    """Memory-map the index, (re)build it first if it is missing, stale or
+    invalid.
+
+    When the package directory is not writable, an in-memory index is used
+    instead. Returns None if no OUI list is available at all.
+    """
+    global _index
+
+    if _index is not None:
+        return _index
+
+    try:
+        stale = OUI_TXT_PATH.stat().st_mtime > OUI_IDX_PATH.stat().st_mtime
+    except FileNotFoundError:
+        stale = OUI_TXT_PATH.exists()
+
+    if not stale:
+        _index = map_index(OUI_IDX_PATH)
+        if _index is not None or not OUI_TXT_PATH.exists():
+            return _index
+
+    try:
+        compile_oui(OUI_TXT_PATH, OUI_IDX_PATH)
+        _index = map_index(OUI_IDX_PATH)
+    except OSError:
+        pass
+    if _index is None:
+        _index = build_index(parse_oui_txt(OUI_TXT_PATH))
+    return _index
+
+
+def oui_to_company_name(oui: int) -> str | None:
+    """Binary search the organization name of a 24-bit OUI"""
+    index = load_index()
+    if index is None:
+        return None
+
+    _, _, num_records = IDX_HEADER.unpack_from(index)
+    key = oui.to_bytes(3, 'big')
+
+    lo, hi = 0, num_records
+    while lo < hi:
+        mid = (lo + hi) // 2
+        pos = IDX_HEADER.size + mid * IDX_RECORD.size
+        mid_key = index[pos:pos+3]
+        if mid_key < key:
+            lo = mid + 1
+        elif mid_key > key:
+            hi = mid
+        else:
+            _, offset, length = IDX_RECORD.unpack_from(index, pos)
+            names_pos = IDX_HEADER.size + num_records * IDX_RECORD.size + offset
+            return index[names_pos:names_pos+length].decode('utf-8', 'replace')
+
+    return None
+
+
+def main(argv: list[str] = sys.argv):
+    compile_oui(*[Path(arg) for arg in argv[1:3]])
+
+
+if __name__ == '__main__':
+    main()
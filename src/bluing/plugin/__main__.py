@@ -1,27 +1,34 @@
 #!/usr/bin/env python
 
 import sys
+from importlib import import_module
 
 from xpycommon.log import Logger
 from xpycommon.ui import red
 
 from . import PKG_NAME, LOG_LEVEL
 from .ui import parse_cmdline
-from .list import main as list_main
-from .install import main as install_main
-from .uninstall import main as uninstall_main
-from .run import main as run_main
             
 
 logger = Logger(__name__, LOG_LEVEL)
-cmd_to_main = {
-    'list': list_main,
-    'install': install_main,
-    'uninstall': uninstall_main,
-    'run': run_main
+cmd_to_pkg = {
+    'list': '.list',
+    'install': '.install',
+    'uninstall': '.uninstall',
+    'run': '.run'
 }
 
 
+def load_cmd_main(cmd: str):
+    """Import the package of a plugin command and return its main()."""
+    try:
+        pkg_name = cmd_to_pkg[cmd]
+    except KeyError:
+        raise ValueError("Invalid {} command: {}".format(PKG_NAME, red(cmd)))
+
+    return import_module(pkg_name, __package__).main
+
+
 def main(argv: list[str] = sys.argv):
     args = parse_cmdline(argv[1:])
     logger.debug("parse_cmdline() returned\n"
@@ -34,10 +41,7 @@ def main(argv: list[str] = sys.argv):
             cmd = args['<command>']
             argv = [cmd] + args['<args>']
 
-            try:
-                cmd_to_main[cmd](argv)
-            except KeyError as e:
-                raise ValueError("Invalid {} command: {}".format(PKG_NAME, red(args['<command>'])))
+            load_cmd_main(cmd)(argv)
     except Exception as e:
         logger.error("{}: \"{}\"".format(e.__class__.__name__, e))
         sys.exit(1)
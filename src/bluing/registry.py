@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+
+"""Assigned numbers registry
+
+Each table is parsed from its resource file under res/ on first access, not at
+import time. The parsed table is cached in res/registry/<resource>.cache, keyed
+by REGISTRY_CACHE_VERSION and the digest of the resource file, so later runs
+unpickle the table instead of parsing the text again.
+"""
+
+import io
+import csv
+import pickle
+import hashlib
+from collections.abc import Mapping
+from typing import Callable
+
+from xpycommon.log import Logger
+
+from . import PKG_ROOT, LOG_LEVEL
+
+
+logger = Logger(__name__, LOG_LEVEL)
+
+# Bump it when a parser below changes the form of its table.
+REGISTRY_CACHE_VERSION = 1
+RES_ROOT = PKG_ROOT/'res'
+REGISTRY_CACHE_DIR = RES_ROOT/'registry'
+
+
+def load_table(res_name: str, parser: Callable[[str], dict]) -> dict:
+    """Load a table from the cache, or parse the resource file and cache it."""
+    raw = (RES_ROOT/res_name).read_bytes()
+    cache_key = (REGISTRY_CACHE_VERSION, hashlib.blake2b(raw, digest_size=16).digest())
+    cache_path = REGISTRY_CACHE_DIR/(res_name + '.cache')
+
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            if pickle.load(cache_file) == cache_key:
+                return pickle.load(cache_file)
+            logger.debug("Stale registry cache: {}".format(cache_path))
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        logger.debug("Failed to load registry cache {}, {}: {}".format(
+            cache_path, e.__class__.__name__, e))
+
+    table = parser(raw.decode('utf-8'))
+
+    try:
+        REGISTRY_CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as cache_file:
+            pickle.dump(cache_key, cache_file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(table, cache_file, pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        # E.g. the package is installed in a read-only location.
+        logger.debug("Failed to store registry cache {}, {}: {}".format(
+            cache_path, e.__class__.__name__, e))
+
+    return table
+
+
+class AssignedNumbers(Mapping):
+    """A read-only table that is loaded on first access."""
+    def __init__(self, res_name: str, parser: Callable[[str], dict]):
+        self.res_name = res_name
+        self.parser = parser
+        self._table = None
+
+    @property
+    def table(self) -> dict:
+        if self._table is None:
+            self._table = load_table(self.res_name, self.parser)
+        return self._table
+
+    def __getitem__(self, key):
+        return self.table[key]
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __repr__(self) -> str:
+        return "{}({!r}, loaded={})".format(self.__class__.__name__, self.res_name,
+                                            self._table is not None)
+
+
+def parse_service_cls_profile_ids(text: str) -> dict:
+    # 需要手动编辑的 Service Class 如下：
+    #     IrMCSyncCommand
+    #     Headset – HS
+    # 同时注意去掉可能出现的 E2 80 8B
+    table = {}
+    for line in text.splitlines():
+        items = line.strip().split('\t')
+        if items[0] == 'Service Class Name':
+            continue
+        uuid = int(items.pop(1)[2:], base=16)
+        table[uuid] = {
+            'Name': items[0],
+            'Specification': items[1],
+            'Allowed Usage': items[2]
+        }
+    return table
+
+
+def parse_protocol_ids(text: str) -> dict:
+    table = {}
+    for line in text.splitlines():
+        items = line.strip().split('\t')
+        if items[0] == 'Protocol Name':
+            continue
+        uuid = items.pop(1).lower()
+        table[uuid] = {
+            'Name': items[0],
+            'spec': items[1]
+        }
+    return table
+
+
+def parse_company_identifiers(text: str) -> dict:
+    return {int(row['Decimal']): row['Company'] for row in csv.DictReader(io.StringIO(text))}
+
+
+def parse_gatt_uuids(text: str) -> dict:
+    table = {}
+    for line in text.splitlines():
+        items = line.strip().split('\t')
+        uuid = items.pop(2)
+        table[uuid] = {
+            'Name': items[0],
+            'Uniform Type Identifier': items[1],
+            'Specification': items[2]
+        }
+    return table
+
+
+# https://www.bluetooth.com/specifications/assigned-numbers/service-discovery/
+#     Table 2: Service Class Profile Identifiers
+#
+#     For historical reasons, some UUIDs in Table 2 are used to identify
+#     profiles in a BluetoothProfileDescriptorList universal attribute as well
+#     as service classes in a ServiceClassIDList universal attribute. However,
+#     for new profiles, Service Class UUIDs shall not be used in a
+#     BluetoothProfileDescriptorList universal attribute and Profile UUIDs
+#     shall not be used in a ServiceClassIDList universal attribute.
+#
+# Include both service class UUID (32-bit) and profile UUID (32-bit), and other
+# information.
+service_cls_profile_ids = AssignedNumbers('service-class-profile-ids.txt',
+                                          parse_service_cls_profile_ids)
+
+# Only used in the ProfileDescriptorList attribute
+protocol_ids = AssignedNumbers('sdp_ProfileDescriptorList_protocol_ids.txt',
+                               parse_protocol_ids)
+
+# https://www.bluetooth.com/specifications/assigned-numbers/company-identifiers/
+company_identifiers = AssignedNumbers('CompanyIdentfiers.csv', parse_company_identifiers)
+
+gatt_services = AssignedNumbers('gatt-service-uuid.txt', parse_gatt_uuids)
+gatt_characteristics = AssignedNumbers('gatt-characteristic-uuid.txt', parse_gatt_uuids)
+gatt_descriptors = AssignedNumbers('gatt-descriptor-uuid.txt', parse_gatt_uuids)
+
+
+__all__ = ['AssignedNumbers', 'service_cls_profile_ids', 'protocol_ids',
+           'company_identifiers', 'gatt_services', 'gatt_characteristics',
+           'gatt_descriptors']
@@ -1,36 +1,17 @@
 #!/usr/bin/env python
 
-import io
-import pkg_resources
 from xml.etree import ElementTree
 
 from xpycommon.ui import blue, green, yellow, red
 from xpycommon.log import DEBUG, INFO, WARNING, ERROR
 
-from .. import service_cls_profile_ids
+from ..registry import service_cls_profile_ids, protocol_ids
 
 
 __all__ = ['ag_service_record', 'hf_service_record', 'hid_service_record', 
     'mce_service_record', 'mse_service_record']
 
 
-# Only used in the ProfileDescriptorList attribute
-protocol_ids_file = pkg_resources.resource_stream(__name__, "../res/sdp_ProfileDescriptorList_protocol_ids.txt")
-protocol_ids_file = io.TextIOWrapper(protocol_ids_file)
-protocol_ids = {}
-
-for line in protocol_ids_file:
-    items = line.strip().split('\t')
-    if items[0] == 'Protocol Name':
-        continue
-    # print(items)
-    uuid = items.pop(1).lower()
-    protocol_ids[uuid] = {
-        'Name': items[0],
-        'spec': items[1]
-    }
-
-
 class ServiceRecord:
     '''SDP service record'''
 
@@ -38,7 +38,6 @@ from docopt import docopt
 from xpycommon.log import Logger
 from xpycommon.ui import red
 from xpycommon.bluetooth import BD_ADDR
-from bthci import HCI
 
 from . import VERSION_STR, LOG_LEVEL
 
@@ -64,6 +63,8 @@ def parse_cmdline(argv: list[str] = sys.argv[1:]) -> dict:
         # we can use other options to assist the determination.
         hci_demander_counter = Counter([args['--clean']])
         if hci_demander_counter[True] == 1:
+            from bthci import HCI
+
             if args['-i'] is None:
                 args['-i'] = HCI.get_default_iface()
            
@@ -0,0 +1,152 @@
+import socket
+import struct
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from bluing.le import gatt_batch
+from bluing.le.gatt_batch import BatchReader, AttErrorRsp, att_request, split_length_value_tuples
+
+
+READ_NOT_PERMITTED = 0x02
+REQUEST_NOT_SUPPORTED = 0x06
+
+
+class FakeAttServer:
+    """Serves Read Multiple (Variable Length) Requests from db on one end of a
+    SOCK_SEQPACKET socketpair, the other end is the bearer of the client."""
+    def __init__(self, db: dict[int, bytes], mtu: int = 23, denied: set[int] = (),
+                 unsupported: set[int] = (), notify: bool = False, close: bool = False):
+        self.db = db
+        self.mtu = mtu
+        self.denied = set(denied)
+        self.unsupported = set(unsupported)
+        self.notify = notify
+        self.close = close
+        self.requests = []
+        self.client_sock, self.sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while True:
+            try:
+                req = self.sock.recv(gatt_batch.ATT_MAX_PDU_SIZE)
+            except OSError:
+                return
+            if len(req) == 0:
+                return
+
+            opcode = req[0]
+            handles = list(struct.unpack_from('<{}H'.format((len(req) - 1) // 2), req, 1))
+            self.requests.append((opcode, handles))
+            if self.close:
+                self.sock.close()
+                return
+            if self.notify:
+                self.sock.send(bytes([0x1B, 0x01, 0x00, 0xFF]))
+
+            denied = [handle for handle in handles if handle in self.denied]
+            if opcode in self.unsupported:
+                self.error(opcode, handles[0], REQUEST_NOT_SUPPORTED)
+            elif denied:
+                self.error(opcode, denied[0], READ_NOT_PERMITTED)
+            elif opcode == gatt_batch.ATT_READ_MULTIPLE_VARIABLE_REQ:
+                params = b''.join(struct.pack('<H', len(self.db[handle])) + self.db[handle]
+                                  for handle in handles)
+                self.sock.send(bytes([opcode + 1]) + params[:self.mtu - 1])
+            else:
+                params = b''.join(self.db[handle] for handle in handles)
+                self.sock.send(bytes([opcode + 1]) + params[:self.mtu - 1])
+
+    def error(self, opcode: int, handle: int, error_code: int):
+        self.sock.send(bytes([gatt_batch.ATT_ERROR_RSP]) + struct.pack('<BHB', opcode, handle, error_code))
+
+    def gatt_client(self):
+        return SimpleNamespace(att_client=SimpleNamespace(sock=self.client_sock, mtu=self.mtu))
+
+
+CCCD = 0x2902
+DEVICE_NAME = 0x2A00
+BATTERY_LEVEL = 0x2A19
+
+
+def test_split_length_value_tuples():
+    params = b'\x02\x00ab' + b'\x00\x00' + b'\x03\x00xyz'
+    assert split_length_value_tuples(params) == [b'ab', b'', b'xyz']
+    # The last value truncated by the ATT_MTU
+    assert split_length_value_tuples(b'\x01\x00a\x05\x00abc') == [b'a', None]
+    assert split_length_value_tuples(b'\x01') == []
+
+
+def test_read_variable_length():
+    db = {handle: bytes([handle]) * 3 for handle in range(1, 11)}
+    server = FakeAttServer(db, notify=True)
+    reader = BatchReader(server.gatt_client())
+
+    values = reader.read([(handle, DEVICE_NAME) for handle in db])
+    assert values == db
+    # 5 values of 5 octets fit into a response of an ATT_MTU of 23.
+    assert [opcode for opcode, _ in server.requests] == [gatt_batch.ATT_READ_MULTIPLE_VARIABLE_REQ] * 3
+
+
+def test_read_leaves_a_value_too_long():
+    db = {1: b'a', 2: b'x' * 40, 3: b'c', 4: b'd'}
+    server = FakeAttServer(db)
+    values = BatchReader(server.gatt_client()).read([(handle, DEVICE_NAME) for handle in db])
+    assert 2 not in values
+    assert values == {1: b'a', 3: b'c', 4: b'd'}
+
+
+def test_read_drops_an_attribute_not_permitted():
+    db = {handle: b'\x64' for handle in range(1, 9)}
+    server = FakeAttServer(db, denied={2, 6})
+    reader = BatchReader(server.gatt_client())
+
+    values = reader.read([(handle, BATTERY_LEVEL) for handle in db])
+    # Left to be read one by one, batching goes on for the others.
+    assert sorted(values) == [1, 3, 4, 5, 7, 8]
+    assert reader.procedures['variable'] is not None
+    assert server.requests == [
+        (gatt_batch.ATT_READ_MULTIPLE_VARIABLE_REQ, [1, 2, 3, 4, 5, 6, 7, 8]),
+        (gatt_batch.ATT_READ_MULTIPLE_VARIABLE_REQ, [1, 3, 4, 5, 6, 7, 8]),
+        (gatt_batch.ATT_READ_MULTIPLE_VARIABLE_REQ, [1, 3, 4, 5, 7, 8]),
+    ]
+
+
+def test_read_falls_back_to_fixed_lengths():
+    db = {1: b'\x01\x00', 2: b'\x64', 3: b'\x02\x00', 4: b'name'}
+    server = FakeAttServer(db, unsupported={gatt_batch.ATT_READ_MULTIPLE_VARIABLE_REQ})
+    reader = BatchReader(server.gatt_client())
+
+    values = reader.read([(1, CCCD), (2, BATTERY_LEVEL), (3, CCCD), (4, DEVICE_NAME)])
+    assert values == {1: b'\x01\x00', 2: b'\x64', 3: b'\x02\x00'}
+    assert reader.procedures['variable'] is None
+    assert server.requests[-1] == (gatt_batch.ATT_READ_MULTIPLE_REQ, [1, 2, 3])
+
+
+def test_read_reconnects_on_a_closed_bearer():
+    reconnects = []
+    server = FakeAttServer({1: b'a', 2: b'b'}, close=True)
+    reader = BatchReader(server.gatt_client(), lambda: reconnects.append(time.monotonic()))
+
+    start = time.monotonic()
+    assert reader.read([(1, DEVICE_NAME), (2, DEVICE_NAME)]) == {}
+    assert len(reconnects) == 1
+    assert reconnects[0] - start < 1
+
+
+def test_att_request_error_rsp():
+    server = FakeAttServer({1: b'a'}, denied={1})
+    with pytest.raises(AttErrorRsp) as exc_info:
+        att_request(server.client_sock, struct.pack('<BHH', gatt_batch.ATT_READ_MULTIPLE_REQ, 1, 1))
+    assert exc_info.value.handle == 1
+    assert exc_info.value.error_code == READ_NOT_PERMITTED
+
+
+def test_no_bearer():
+    reader = BatchReader(SimpleNamespace())
+    assert reader.read([(1, CCCD), (2, CCCD)]) == {}
+    assert reader.num_requests == 0
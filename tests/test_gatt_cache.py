@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from bluing.le.gatt_cache import check_trusted
+
+
+def cache_dir(tmp_path):
+    res = tmp_path/'res'
+    res.mkdir(mode=0o755)
+    os.chmod(res, 0o755)
+    db = res/'gatt_dbs.db'
+    db.write_bytes(b'')
+    os.chmod(db, 0o644)
+    return res, db
+
+
+def test_trusted(tmp_path):
+    res, db = cache_dir(tmp_path)
+    check_trusted(db)
+    wal = res/'gatt_dbs.db-wal'
+    wal.write_bytes(b'')
+    os.chmod(wal, 0o644)
+    check_trusted(db)
+
+
+@pytest.mark.parametrize('name', ['gatt_dbs.db', 'gatt_dbs.db-wal', 'gatt_dbs.db-shm'])
+def test_writable_by_others(tmp_path, name):
+    res, db = cache_dir(tmp_path)
+    path = res/name
+    path.touch()
+    os.chmod(path, 0o666)
+    with pytest.raises(PermissionError):
+        check_trusted(db)
+
+
+def test_dir_writable_by_others(tmp_path):
+    res, db = cache_dir(tmp_path)
+    os.chmod(res, 0o777)
+    with pytest.raises(PermissionError):
+        check_trusted(db)
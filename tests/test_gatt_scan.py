@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+from uuid import UUID
+
+from bluing.le.gatt_scan import descriptor_ranges, descriptor_queries, assign_descriptors
+
+
+def uuid16_to_uuid(uuid: int) -> UUID:
+    return UUID('0000{:04x}-0000-1000-8000-00805f9b34fb'.format(uuid))
+
+
+class FakeCharact:
+    def __init__(self, handle: int, uuid: UUID):
+        self.declar = SimpleNamespace(handle=handle,
+                                      value=SimpleNamespace(handle=handle + 1, uuid=uuid))
+        self.descriptors = []
+
+    def add_descriptor_declar(self, descriptor):
+        self.descriptors.append(descriptor)
+
+
+class FakeService:
+    def __init__(self, start_handle: int, end_handle: int, characts: list[FakeCharact]):
+        self.start_handle = start_handle
+        self.end_handle = end_handle
+        self.characts = characts
+
+    def get_characts(self) -> list[FakeCharact]:
+        return self.characts
+
+
+def attr(handle: int):
+    return SimpleNamespace(handle=handle)
+
+
+def gatt_db():
+    """
+    0x0001 - 0x0007  Two characteristics of 16-bit UUIDs, a descriptor each
+    0x0008 - 0x000A  No characteristics
+    0x000B - 0xFFFF  A characteristic of a 128-bit UUID with two descriptors,
+                     then one of a 16-bit UUID up to the end of the handles
+    """
+    c1 = FakeCharact(0x0002, uuid16_to_uuid(0x2A00))
+    c2 = FakeCharact(0x0005, uuid16_to_uuid(0x2A01))
+    c3 = FakeCharact(0x000C, UUID('6e400001-b5a3-f393-e0a9-e50e24dcca9e'))
+    c4 = FakeCharact(0x0010, uuid16_to_uuid(0x2A19))
+    services = [FakeService(0x0001, 0x0007, [c1, c2]),
+                FakeService(0x0008, 0x000A, []),
+                FakeService(0x000B, 0xFFFF, [c3, c4])]
+    return services, (c1, c2, c3, c4)
+
+
+def test_descriptor_ranges():
+    services, (c1, c2, c3, c4) = gatt_db()
+    assert descriptor_ranges(services) == [
+        (0x0004, 0x0004, c1),
+        (0x0007, 0x0007, c2),
+        (0x000E, 0x000F, c3),
+        (0x0012, 0xFFFF, c4),
+    ]
+
+
+def test_descriptor_ranges_without_descriptors():
+    # Characteristic values up to the end of their services
+    c1 = FakeCharact(0x0002, uuid16_to_uuid(0x2A00))
+    c2 = FakeCharact(0x0004, uuid16_to_uuid(0x2A01))
+    services = [FakeService(0x0001, 0x0005, [c1, c2]), FakeService(0x0006, 0x0008, [])]
+    assert descriptor_ranges(services) == []
+    assert descriptor_queries(services, []) == []
+
+
+def test_descriptor_queries():
+    services, _ = gatt_db()
+    # Merged over the 16-bit declarations and values in between, not over the
+    # value of the 128-bit UUID at 0x000D.
+    assert descriptor_queries(services, descriptor_ranges(services)) == [
+        (0x0004, 0x0007),
+        (0x000E, 0xFFFF),
+    ]
+
+
+def test_assign_descriptors():
+    services, (c1, c2, c3, c4) = gatt_db()
+    ranges = descriptor_ranges(services)
+
+    # Find Information over the merged queries also returns the declarations
+    # and values in between.
+    found = [attr(handle) for handle in (0x0004, 0x0005, 0x0006, 0x0007,
+                                         0x000E, 0x000F, 0x0010, 0x0011, 0x0012, 0xFFFF)]
+    assert assign_descriptors(ranges, found) == 6
+    assert [d.handle for d in c1.descriptors] == [0x0004]
+    assert [d.handle for d in c2.descriptors] == [0x0007]
+    assert [d.handle for d in c3.descriptors] == [0x000E, 0x000F]
+    assert [d.handle for d in c4.descriptors] == [0x0012, 0xFFFF]
@@ -0,0 +1,73 @@
+import struct
+
+from bluing.le import hci_scan
+from bluing.le.hci_scan import HciScanner
+
+
+BD_ADDR = bytes.fromhex('0102030405c6')
+
+
+def ext_adv_report(data: bytes, data_status: int, sid: int = 1, bd_addr: bytes = BD_ADDR) -> memoryview:
+    event_type = hci_scan.EXT_ADV_CONNECTABLE | data_status << hci_scan.EXT_ADV_DATA_STATUS_POS
+    header = hci_scan.EXT_ADV_REPORT_HEADER.pack(
+        event_type, 0x01, bd_addr, 0x01, 0x02, sid, 0, -60, 0, 0x00, bytes(6), len(data))
+    return memoryview(bytes([1]) + header + data)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_scanner(monkeypatch) -> tuple[HciScanner, list[bytes], Clock]:
+    clock = Clock()
+    monkeypatch.setattr(hci_scan.time, 'monotonic', clock)
+    reports = []
+    scanner = HciScanner(0)
+    monkeypatch.setattr(scanner, 'on_report', lambda connectable, addr_type, bd_addr, data, *_:
+                        reports.append(data))
+    return scanner, reports, clock
+
+
+def test_fragments_reassembled(monkeypatch):
+    scanner, reports, clock = make_scanner(monkeypatch)
+    scanner.handle_ext_adv_report(ext_adv_report(b'\x02\x01', hci_scan.EXT_ADV_DATA_INCOMPLETE))
+    clock.now += 1
+    scanner.handle_ext_adv_report(ext_adv_report(b'\x06', hci_scan.EXT_ADV_DATA_COMPLETE))
+    assert reports == [b'\x02\x01\x06']
+    assert scanner.fragments == {}
+
+
+def test_stale_fragments_dropped(monkeypatch):
+    scanner, reports, clock = make_scanner(monkeypatch)
+    scanner.handle_ext_adv_report(ext_adv_report(b'\xff\xff', hci_scan.EXT_ADV_DATA_INCOMPLETE))
+    clock.now += hci_scan.FRAGMENT_TIMEOUT + 1
+    # Not prepended to the next advertisement
+    scanner.handle_ext_adv_report(ext_adv_report(b'\x02\x01\x06', hci_scan.EXT_ADV_DATA_COMPLETE))
+    assert reports == [b'\x02\x01\x06']
+
+    scanner.handle_ext_adv_report(ext_adv_report(b'\xff\xff', hci_scan.EXT_ADV_DATA_INCOMPLETE))
+    clock.now += hci_scan.FRAGMENT_TIMEOUT + 1
+    scanner.handle_ext_adv_report(ext_adv_report(b'\x02\x01', hci_scan.EXT_ADV_DATA_INCOMPLETE))
+    scanner.handle_ext_adv_report(ext_adv_report(b'\x06', hci_scan.EXT_ADV_DATA_COMPLETE))
+    assert reports[1:] == [b'\x02\x01\x06']
+
+
+def test_fragments_bounded(monkeypatch):
+    scanner, reports, clock = make_scanner(monkeypatch)
+    for _ in range(hci_scan.MAX_EXT_ADV_DATA_LEN // 200 + 1):
+        scanner.handle_ext_adv_report(ext_adv_report(b'\x00' * 200, hci_scan.EXT_ADV_DATA_INCOMPLETE))
+    assert sum(len(fragments) for _, fragments in scanner.fragments.values()) <= \
+        hci_scan.MAX_EXT_ADV_DATA_LEN
+
+    for i in range(hci_scan.MAX_FRAGMENTED_SETS * 2):
+        bd_addr = struct.pack('<H', i) + BD_ADDR[2:]
+        scanner.handle_ext_adv_report(ext_adv_report(b'\x00', hci_scan.EXT_ADV_DATA_INCOMPLETE,
+                                                     bd_addr=bd_addr))
+        clock.now += 0.01
+    assert len(scanner.fragments) <= hci_scan.MAX_FRAGMENTED_SETS
+    # The most recent ones are kept.
+    assert (struct.pack('<H', hci_scan.MAX_FRAGMENTED_SETS * 2 - 1) + BD_ADDR[2:], 1) in scanner.fragments
@@ -0,0 +1,27 @@
+from bluing.le import le_scan
+from bluing.le.le_scan import LeDeviceInfo, LeDevicesScanResult
+
+
+def dev_info(addr: str, heard_by: dict | None) -> LeDeviceInfo:
+    info = LeDeviceInfo(addr, 'random', True, None)
+    info.heard_by = heard_by
+    return info
+
+
+def test_store_picks_the_strongest_available_rssi(monkeypatch):
+    stored = []
+    monkeypatch.setattr(le_scan, 'store_addr_types', lambda records: stored.extend(records))
+
+    result = LeDevicesScanResult('hci0,hci1,hci2')
+    result.add_device_info(dev_info('11:22:33:44:55:01', {'hci0': None, 'hci1': -70, 'hci2': -40}))
+    result.add_device_info(dev_info('11:22:33:44:55:02', {'hci0': -60, 'hci1': None}))
+    result.add_device_info(dev_info('11:22:33:44:55:03', {'hci0': None, 'hci1': None}))
+    result.add_device_info(dev_info('11:22:33:44:55:04', None))
+    result.store()
+
+    assert [(addr, iface) for addr, _, _, iface in stored] == [
+        ('11:22:33:44:55:01', 'hci2'),
+        ('11:22:33:44:55:02', 'hci0'),
+        ('11:22:33:44:55:03', 'hci0,hci1,hci2'),
+        ('11:22:33:44:55:04', 'hci0,hci1,hci2'),
+    ]
@@ -0,0 +1,57 @@
+from bluing import oui
+
+
+OUI_TXT = """\
+00-1A-7D   (hex)\t\tcyber-blue(HK)Ltd
+001A7D     (base 16)\t\tcyber-blue(HK)Ltd
+
+F0-B4-79   (hex)\t\tApple, Inc.
+F0B479     (base 16)\t\tApple, Inc.
+"""
+
+
+def use_paths(monkeypatch, tmp_path):
+    txt_path = tmp_path/'oui.txt'
+    txt_path.write_text(OUI_TXT, encoding='utf-8')
+    idx_path = tmp_path/'oui.idx'
+    monkeypatch.setattr(oui, 'OUI_TXT_PATH', txt_path)
+    monkeypatch.setattr(oui, 'OUI_IDX_PATH', idx_path)
+    monkeypatch.setattr(oui, '_index', None)
+    return txt_path, idx_path
+
+
+def test_compiled_on_demand(monkeypatch, tmp_path):
+    _, idx_path = use_paths(monkeypatch, tmp_path)
+    assert oui.oui_to_company_name(0xF0B479) == 'Apple, Inc.'
+    assert oui.oui_to_company_name(0x001A7D) == 'cyber-blue(HK)Ltd'
+    assert oui.oui_to_company_name(0x123456) is None
+    assert idx_path.exists()
+
+
+def test_invalid_index_rebuilt(monkeypatch, tmp_path):
+    txt_path, idx_path = use_paths(monkeypatch, tmp_path)
+    for content in (b'OU', b'OUI\x00\x00\x01\x00\x00\x00\x10', b'OUI\x00\x00\x09\x00\x00\x00\x00'):
+        idx_path.write_bytes(content)
+        monkeypatch.setattr(oui, '_index', None)
+        assert oui.oui_to_company_name(0xF0B479) == 'Apple, Inc.'
+
+
+def test_invalid_index_in_memory(monkeypatch, tmp_path):
+    _, idx_path = use_paths(monkeypatch, tmp_path)
+    idx_path.write_bytes(b'OU')
+
+    def compile_oui(*args):
+        raise PermissionError(13, "Permission denied")
+    monkeypatch.setattr(oui, 'compile_oui', compile_oui)
+
+    assert oui.oui_to_company_name(0xF0B479) == 'Apple, Inc.'
+    assert isinstance(oui._index, bytes)
+
+
+def test_malformed_bdaddr(monkeypatch, tmp_path):
+    from bluing.common import bdaddr_to_company_name
+
+    use_paths(monkeypatch, tmp_path)
+    assert 'Unknown' in bdaddr_to_company_name('ZZ:B4:79:00:00:01')
+    assert 'Unknown' in bdaddr_to_company_name('')
+    assert 'Apple, Inc.' in bdaddr_to_company_name('F0:B4:79:00:00:01')
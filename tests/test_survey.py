@@ -0,0 +1,30 @@
+import json
+
+from bluing.le.survey import SurveyEntry, LlFeatureSurveyResult
+from bluing.le.scan_sink import JsonLinesSink
+from bluing.le.__main__ import write_survey
+
+
+def test_ll_features_written_as_json_lines(tmp_path):
+    path = tmp_path/'survey.jsonl'
+    result = LlFeatureSurveyResult([
+        SurveyEntry('11:22:33:44:55:01', 0, 'hci0', bytes.fromhex('0100000000000000'), None, 1.5),
+        SurveyEntry('11:22:33:44:55:02', 1, 'hci1', None, "TimeoutError: ", 10.0),
+    ])
+
+    sink = JsonLinesSink(str(path))
+    assert write_survey(result, [sink]) is result
+    sink.close()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record['addr'] for record in records] == ['11:22:33:44:55:01', '11:22:33:44:55:02']
+    assert records[0]['le_features'] == '0100000000000000'
+    assert records[0]['le_features_supported'] == ['LE Encryption']
+    assert records[1]['addr_type'] == 'random'
+    assert records[1]['le_features'] is None
+    assert records[1]['error'] == "TimeoutError: "
+
+
+def test_not_printed_with_json_lines_on_stdout(capsys):
+    result = LlFeatureSurveyResult([])
+    assert write_survey(result, [JsonLinesSink('-')]) is None